@@ -9,7 +9,6 @@ CRAWLER_PARAMS = {
     "ohmynews_politics": {"num_pages": 8},
     "yonhap_politics": {"num_pages": 10},
     "hani_politics": {"num_pages": 10},
-    "newsone_politics": {"total_limit": 150},
     "khan_politics": {"num_pages": 15},
     "donga_politics": {"num_pages": 15},
     "joongang_politics": {"num_pages": 7},
@@ -22,45 +21,194 @@ CRAWLER_PARAMS = {
     "naeil_politics": {"num_pages": 8},       # 160개 기사
     "pressian_politics": {"num_pages": 16},   # 160개 기사
     "hankyung_politics": {"num_pages": 4},    # 160개 기사
-    "sisain_politics": {"num_pages": 20, "target_articles": 160}      # 최대 20페이지, 목표 160개 기사
+    "sisain_politics": {"num_pages": 20, "target_articles": 160, "page_window": 4}  # 최대 20페이지, 목표 160개 기사 (목록 4페이지까지 미리 요청)
 }
 
-# 크롤러 그룹 정의 (3단계로 확장)
+# 크롤러 그룹 정의 (실행 순서가 아닌 분류용, 실행은 SCHEDULER_CONFIG가 조절)
 CRAWLER_GROUPS = {
     "simple": {
-        "crawlers": ["ohmynews_politics", "yonhap_politics", "hani_politics", "newsone_politics", "khan_politics"],
-        "description": "기존 단순한 크롤러 (HTML/API 기반)",
-        "execution_mode": "parallel",
-        "max_concurrent": 3
+        "crawlers": ["ohmynews_politics", "yonhap_politics", "hani_politics", "khan_politics"],
+        "description": "기존 단순한 크롤러 (HTML/API 기반)"
     },
     "progressive": {
         "crawlers": ["segye_politics", "munhwa_politics", "naeil_politics", "pressian_politics", "hankyung_politics", "sisain_politics"],
-        "description": "새로운 진보 성향 크롤러 (HTML/Hybrid 기반)",
-        "execution_mode": "parallel",
-        "max_concurrent": 4
+        "description": "새로운 진보 성향 크롤러 (HTML/Hybrid 기반)"
     },
     "complex": {
         "crawlers": ["donga_politics", "joongang_politics", "newsis_politics", "chosun_politics"],
-        "description": "기존 복잡한 크롤러 (Playwright 사용)",
-        "execution_mode": "sequential",
-        "max_concurrent": 1
+        "description": "기존 복잡한 크롤러 (Playwright 사용)"
     }
 }
 
-# Playwright 사용 크롤러 목록
-PLAYWRIGHT_CRAWLERS = [
-    "donga_politics", "joongang_politics", "newsis_politics", "chosun_politics"
-]
+# 재시도 / 회로 차단 설정 (공유 HTTP 클라이언트의 모든 요청에 적용)
+RETRY_CONFIG = {
+    "max_retries": 3,              # 요청당 최대 재시도 횟수 (GET/HEAD만)
+    "retry_delay": 0.5,            # 첫 재시도 기준 대기 시간 (초), 이후 2배씩 증가 + 지터
+    "max_delay": 10.0,             # 재시도 대기 시간 상한 (초)
+    "retry_budget_ratio": 0.2,     # 전체 요청 대비 허용 재시도 비율
+    "retry_budget_min": 20,        # 요청이 적을 때도 허용하는 최소 재시도 수
+    "breaker_failures": 5,         # 호스트별 연속 실패가 이 횟수에 도달하면 회로 차단
+    "breaker_cooldown": 60.0       # 차단 유지 시간 (초), 이후 시험 요청 한 건으로 복구 확인
+}
 
-# 단계별 대기 시간 (초)
-STAGE_DELAYS = {
-    "simple": 0,
-    "progressive": 2,
-    "complex": 3
+# 공유 HTTP 클라이언트 설정 (CrawlerManager가 소유)
+HTTP_CLIENT_CONFIG = {
+    "max_connections": 100,           # 전체 동시 연결 수
+    "max_keepalive_connections": 40,  # 유지할 keep-alive 연결 수
+    "keepalive_expiry": 30.0,         # keep-alive 유지 시간 (초)
+    "http2": True,                    # h2 패키지가 있을 때만 적용
+    "timeout": 15.0,
+    "connect_timeout": 5.0,
+    "connect_retries": 1,             # 연결 단계 재시도 횟수
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 }
 
-# 재시도 설정
-RETRY_CONFIG = {
-    "max_retries": 3,
-    "retry_delay": 5
+# 호스트별 적응형 속도 제한 설정 (AIMD + 토큰 버킷)
+RATE_LIMIT_CONFIG = {
+    "initial_concurrency": 4,      # 호스트별 시작 동시 요청 수
+    "min_concurrency": 1,
+    "max_concurrency": 32,         # 호스트별 최대 동시 요청 수 (호스트별 연결 수 상한)
+    "initial_rate": 10.0,          # 호스트별 시작 초당 요청 수
+    "min_rate": 1.0,
+    "max_rate": 50.0,
+    "burst": 10,                   # 토큰 버킷 최대 크기
+    "additive_increase": 1.0,      # 정상 응답 시 증가량
+    "multiplicative_decrease": 0.5,  # 과부하 신호 시 감소 비율
+    "latency_target": 2.0,         # 이 시간(초) 이내 응답만 증가 근거로 사용
+    "backoff_pause": 1.0,          # 과부하 시 기본 대기 시간 (초)
+    "max_retry_after": 30.0        # Retry-After 최대 반영 시간 (초)
+}
+
+# 크롤링 스케줄러 설정 (자원 클래스별 동시 실행 슬롯)
+SCHEDULER_CONFIG = {
+    "workers": 8,           # 동시에 실행할 수 있는 최대 작업 수
+    "resource_slots": {
+        "http": 8,          # 크롤러 작업 (브라우저 폴백 페이지 수는 브라우저 풀이 제한)
+        "db": 2             # 동시에 Supabase에 저장하는 작업
+    }
+}
+
+# 공유 Playwright 브라우저 풀 설정 (CrawlerManager가 소유)
+BROWSER_POOL_CONFIG = {
+    "contexts": 2,                 # 브라우저 컨텍스트 수
+    "pages_per_context": 4,        # 컨텍스트별 재사용 페이지 수
+    "headless": True,
+    "navigation_timeout": 15000,   # 페이지 이동 타임아웃 (ms)
+    "viewport": {"width": 1280, "height": 720},
+    "launch_args": [
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-features=VizDisplayCompositor"
+    ],
+    # 본문 추출에 불필요한 리소스 차단
+    "blocked_resource_types": ["image", "media", "font", "stylesheet"],
+    "blocked_url_patterns": [
+        "doubleclick.net", "googlesyndication.com", "google-analytics.com",
+        "googletagmanager.com", "adservice", "criteo", "taboola"
+    ]
+}
+
+# 디스크 HTTP 캐시 설정 (ETag/Last-Modified 조건부 GET)
+HTTP_CACHE_CONFIG = {
+    "enabled": True,
+    "cache_dir": ".cache/http",   # 프로젝트 루트 기준 경로
+    "max_age_days": 3             # 이 기간이 지난 항목은 사용하지 않고 정리
+}
+
+# 증분 크롤링 워터마크 설정 (언론사별 마지막 처리 기사)
+WATERMARK_CONFIG = {
+    "enabled": True,                          # False면 매번 CRAWLER_PARAMS 깊이 전체 수집
+    "state_file": ".cache/watermarks.json",   # 프로젝트 루트 기준 경로
+    "max_urls": 1000                          # 언론사별로 기억할 최근 URL 수
+}
+
+# 스트리밍 파이프라인 설정 (목록 → 본문 → 파싱 → 저장, 단계 사이는 크기 제한 큐)
+PIPELINE_CONFIG = {
+    "fetch_workers": 16,          # 본문 요청 워커 수 (호스트별 실제 동시성은 속도 제한기가 조절)
+    "parse_workers": 2,           # HTML 파싱 워커 수 (프로세스 풀 사용 시 풀 크기와 같게 조정)
+    "parse_processes": None,      # 파싱 프로세스 수 (None: CPU 수, 0: 이벤트 루프에서 직접 파싱)
+    "detail_queue_size": 64,      # 목록 → 본문 요청 큐 크기
+    "parse_queue_size": 16,       # 본문 → 파싱 큐 크기 (HTML 원문이 머무는 구간)
+    "save_queue_size": 64,        # 파싱 → 저장 큐 크기
+    "save_batch_size": 20,        # 배치 저장 크기
+    "save_flush_interval": 2.0    # 배치가 덜 찼어도 이 시간(초)이 지나면 저장
+}
+
+# 기존 기사 URL 인덱스 설정 (본문 요청 전 중복 제거)
+URL_INDEX_CONFIG = {
+    "enabled": True,
+    "db_file": ".cache/url_index.sqlite",   # 프로젝트 루트 기준 경로
+    "bloom_capacity": 200000,               # 블룸 필터 예상 URL 수 (초과 시 자동 확장)
+    "bloom_error_rate": 0.001,              # 블룸 필터 오탐률 (오탐은 SQLite 조회로 확인)
+    "sync_page_size": 1000                  # Supabase 동기화 시 한 번에 가져올 행 수
+}
+
+# HTML 파서 설정 (BeautifulSoup 트리 빌더)
+HTML_PARSER_CONFIG = {
+    # "html.parser" / "lxml" / "auto"(lxml 설치 시 lxml, 없으면 html.parser)
+    # scripts/parser_parity.py --fixtures로 기록된 픽스처를 재생해 모든 언론사 결과가 같으면 "lxml"로 전환
+    "backend": "html.parser"
+}
+
+# 단계별 본문 수집 설정 (httpx 먼저, 추출 결과가 부족한 기사만 브라우저로 재수집)
+TIERED_FETCH_CONFIG = {
+    "min_content_length": 100,        # httpx 추출 본문이 이보다 짧으면 브라우저로 재수집
+    "required_fields": ["content"]    # httpx 추출 결과에 반드시 있어야 하는 필드
+}
+
+# 재개 가능한 크롤링 프론티어 설정 (중단된 실행을 멈춘 지점부터 이어서 수집)
+FRONTIER_CONFIG = {
+    "enabled": True,
+    "db_file": ".cache/frontier.sqlite",   # 프로젝트 루트 기준 경로
+    "resume_max_age_hours": 24             # 이보다 오래된 중단 실행/기사 단계는 재개하지 않고 정리
+}
+
+# 오프라인 HTML 픽스처 기록 설정 (scripts/parse_benchmark.py로 파싱 성능 재현)
+FIXTURE_CONFIG = {
+    "record": False,                     # True면 실행 중 받은 응답/파싱 입력을 기록 (--record-fixtures로도 지정)
+    "dir": "fixtures/recorded"           # 프로젝트 루트 기준 기록 경로
+}
+
+# 모의 언론사 서버 설정 (scripts/mock_outlet_server.py, 네트워크 없이 크롤링 부하 테스트)
+MOCK_OUTLET_CONFIG = {
+    "base_url": None,                    # 예: "http://127.0.0.1:8765" - 지정하면 모든 HTTP 요청을 이 서버로 전환 (--mock-outlets로도 지정)
+    "host": "127.0.0.1",
+    "port": 8765,
+    "fixtures_dir": "fixtures/recorded", # 재생할 픽스처 (--record-fixtures로 기록한 경로)
+    "latency_ms": 50,                    # 기본 응답 지연
+    "jitter_ms": 30,                     # 추가 지연 평균 (지수 분포 - 꼬리 지연 재현)
+    "bandwidth_kbps": 0,                 # 연결당 전송 속도 제한 (0이면 무제한)
+    "error_rate": 0.0,                   # 500/503 응답 비율
+    "throttle_rate": 0.0,                # 429 응답 비율
+    "retry_after": 1,                    # 429 응답의 Retry-After (초)
+    "outlets": {}                        # 호스트별 덮어쓰기, 예: {"www.donga.com": {"latency_ms": 300, "throttle_rate": 0.1}}
+}
+
+# 실행 보고서 설정 (단계별 소요 시간/요청/기사 처리 지표, utils/crawl_metrics.py)
+METRICS_CONFIG = {
+    "json_file": ".cache/metrics/last_run.json",      # 프로젝트 루트 기준 경로 (None이면 저장 안 함)
+    "prometheus_file": ".cache/metrics/crawler.prom"  # node_exporter textfile collector 경로로 지정 가능 (None이면 저장 안 함)
+}
+
+# 저장 시점 유사 중복 기사 판별 설정 (통신사 기사 재게재, utils/near_duplicate.py)
+NEAR_DUP_CONFIG = {
+    "enabled": True,
+    "db_file": ".cache/near_duplicates.sqlite",  # 프로젝트 루트 기준 경로
+    "table": "article_duplicates",               # 중복 연결을 기록할 Supabase 테이블
+    "max_distance": 3,                           # 본문 SimHash 해밍 거리 허용치 (64비트 중)
+    "title_max_distance": 10,                    # 정규화한 제목이 같을 때의 허용치
+    "min_tokens": 40,                            # 이보다 짧은 본문은 비교하지 않음 (단어 수)
+    "shingle_size": 3,                           # 단어 n-gram 크기
+    "window_days": 7                             # 이 기간 안에 저장된 기사끼리만 비교
+}
+
+# 원문 HTML 보관 설정 (재수집 없이 본문 재추출, utils/raw_archive.py / scripts/reextract.py)
+RAW_ARCHIVE_CONFIG = {
+    "enabled": True,
+    "dir": ".cache/archive",   # 프로젝트 루트 기준 경로 (objects/ 아래 원문, index.sqlite 색인)
+    "zstd_level": 9,           # zstd 압축 수준 (zstandard 패키지가 없으면 gzip 사용)
+    "commit_every": 50,        # 기록 스레드가 색인을 한 번에 커밋할 최대 원문 수
+    "queue_size": 500,         # 기록 대기 중인 원문 최대 수 (가득 차면 새 원문은 보관하지 않고 건수만 집계)
+    "max_age_days": 60         # 이 기간이 지난 원문은 실행 시작 시 정리
 }
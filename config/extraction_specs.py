@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+언론사별 본문 추출 명세 (utils/extraction.py 엔진이 컴파일해 실행)
+
+명세 항목:
+- container: 본문 컨테이너 선택자 (앞에서부터 시도)
+- remove: 컨테이너 안에서 제거할 요소 선택자 (한 번에 합쳐 실행)
+- br_to_newline: <br>을 줄바꿈으로 변환
+- paragraphs / fallback: 문단 수집 규칙 (fallback은 문단이 하나도 없을 때 사용)
+    - selector: 문단 선택자 (없으면 컨테이너 텍스트를 빈 줄 기준으로 분할, split: "lines"면 줄 단위)
+    - separator: 텍스트 조각 사이 구분자 / strip: False면 조각별 공백을 자르지 않음 (인라인 태그 사이 공백 보존)
+    - min_length: 이 길이 이하 문단 제외 / measure: "raw"면 정리 전 길이로 판단
+    - unescape: HTML 엔티티 디코드 / normalize: &nbsp; 및 연속 공백 정리 (기본 True)
+    - strip_patterns: 문단에서 지울 정규식 / drop_patterns: 일치하면 문단 제외
+- join: 문단을 합칠 구분자 (기본 빈 줄)
+- byline: 마지막 문단이 일치하면 본문에서 분리할 정규식
+- post_replace: 문단을 합친 뒤 적용할 (정규식, 치환) 목록
+- dates: 발행시간 후보 (앞에서부터 시도, 원문 문자열 반환)
+    - json_ld: 첫 JSON-LD 스크립트의 키
+    - selector + attr: 첫 일치 요소의 속성값
+    - selector [+ children] + contains / pattern / remove: 조건에 맞는 텍스트
+"""
+
+# 공통 발행시간 후보
+META_PUBLISHED_TIME = {"selector": 'meta[property="article:published_time"]', "attr": "content"}
+TIME_DATETIME = {"selector": "time[datetime]", "attr": "datetime"}
+DATE_PATTERN = r'\d{4}[-/]\d{2}[-/]\d{2}'
+
+EXTRACTION_SPECS = {
+    "hankyung_politics": {
+        "container": ['.article-body#articletxt[itemprop="articleBody"]'],
+        "remove": [
+            'script', 'style', 'noscript', 'iframe',
+            '.ad-area-wrap', '[id^=div-gpt-ad]', 'ins',
+            'figure img', 'figure figcaption',  # figure는 이미지/설명만 제거하고 텍스트는 보존
+        ],
+        "br_to_newline": True,
+        "paragraphs": {"selector": "p", "min_length": 10, "measure": "raw", "unescape": True},
+        # <p> 태그가 없으면 빈 줄 기준으로 분할
+        "fallback": {"min_length": 10, "measure": "raw", "unescape": True},
+        # 마지막 문단이 짧은 기자명 또는 이메일이면 바이라인
+        "byline": r'^(?=.*기자).{0,49}$|@',
+    },
+    "pressian_politics": {
+        "container": ['.section .article_body[itemprop="articleBody"]', '.article_body'],
+        "remove": [
+            'script', 'style', 'noscript', 'figure', 'figcaption', 'img',
+            '.article_ad', '.article_ad2', '[class^=ads]', 'ins.adsbygoogle',
+            'iframe', '[id^=google_ads_]',
+        ],
+        "br_to_newline": True,
+        "paragraphs": {"selector": "p", "min_length": 10, "measure": "raw"},
+    },
+    "naeil_politics": {
+        "container": ['div.article-view'],
+        "remove": [
+            'div.article-subtitle', 'div.article-photo-wrap',
+            'figure', 'figcaption',
+            'script', 'style', 'noscript',
+            'iframe', 'aside', '[class^=ad-]', '[data-svcad]',
+        ],
+        "paragraphs": {
+            "selector": "p",
+            "min_length": 5,
+            "drop_patterns": [
+                r'^(?=.*기자)(?=.*@)',           # 기자명/이메일
+                r'^(?:\S+ ){0,2}\S*기자$',       # "○○ 기자" 형태
+                r'^저작권', r'^Copyright',
+            ],
+        },
+        "byline": r'^(?=.*기자)(?=.*(?:\w\s*기자|@))',
+    },
+    "segye_politics": {
+        "container": ['article.viewBox2'],
+        "remove": [
+            'em.precis', 'figure', 'figcaption', 'aside',
+            '.newsct_journalist', 'p.copyright',
+            'script', 'style', 'noscript',
+            'ins.adsbygoogle', 'iframe', '#outerDiv',
+        ],
+        "paragraphs": {
+            "selector": "p",
+            "min_length": 5,
+            "unescape": True,
+            "drop_patterns": [
+                r'^저작권', r'^Copyright', r'^ⓒ',
+                r'기자.{0,8}$',   # 끝에 기자명 있는 문단
+                r'@',
+            ],
+        },
+        "dates": [
+            {"json_ld": "datePublished"},
+            META_PUBLISHED_TIME,
+            TIME_DATETIME,
+            *({"selector": s, "pattern": DATE_PATTERN}
+              for s in ['.date', '.time', '.publish_date', '.article_date', '.news_date']),
+        ],
+    },
+    "khan_politics": {
+        "container": ['div#articleBody'],
+        "remove": [
+            'div.editor-subtitle', 'div.art_photo', 'p.caption',
+            'div[class*="banner-article"]', 'div.srch-kw',
+            'div[class*="banner"]', 'div[class*="ad"]', 'div[class*="advertisement"]',
+            'script', 'style', 'noscript', 'iframe',
+        ],
+        "paragraphs": {
+            "selector": "p.content_text",
+            "min_length": 10,
+            "drop_patterns": [
+                r'[가-힣]+\s*기자', r'[가-힣]+\s*특파원', r'[가-힣]+\s*통신원',
+                r'@', r'\[출처:', r'\[경향신문\]',
+            ],
+        },
+        "dates": [
+            TIME_DATETIME,
+            META_PUBLISHED_TIME,
+            # 기사 날짜 영역의 "입력 ..." 문단
+            *({"selector": s, "children": "p", "contains": "입력", "remove": "입력"}
+              for s in ['a[title*="기사 입력/수정일"]', '.article-date', '.date', '.publish_date']),
+        ],
+    },
+    "munhwa_politics": {
+        "container": ['#article-body'],
+        "remove": [
+            'script', 'style', 'noscript',
+            '.article-photo-wrap', '.article-subtitle',
+            'figure', 'figcaption',
+            '[data-svcad]', '[id^=svcad_]', '[id*=svcad]',
+            '[class^=ad-]', '[class*=ad-]',
+            'ins', 'iframe', 'div[id^="svcad"]',
+        ],
+        "paragraphs": {
+            "selector": "p.text-l",
+            "min_length": 10,
+            "normalize": False,
+            "strip_patterns": [r'…\s*\w+\s*기자\s*$', r'\w+\s*기자\s*$', r'기자\s*\w+\s*$'],
+        },
+        "fallback": {
+            "selector": "p",
+            "min_length": 20,
+            "normalize": False,
+            "strip_patterns": [r'…\s*\w+\s*기자\s*$', r'\w+\s*기자\s*$'],
+        },
+        "post_replace": [(r'&nbsp;', ' '), (r'&[a-zA-Z]+;', ' '), (r'\s+', ' ')],
+        "dates": [
+            META_PUBLISHED_TIME,
+            *({"selector": s, "pattern": DATE_PATTERN}
+              for s in ['.date', '.publish-date', '.article-date', '[class*="date"]']),
+        ],
+    },
+    "hani_politics": {
+        "container": ['div.article-text'],
+        "remove": [
+            '[class*="ArticleDetailAudioPlayer"]',
+            '[class*="ArticleDetailContent_adWrap"]', '[class*="ArticleDetailContent_adFlex"]',
+            '[class*="BaseAd_"]',
+            'figure', 'script', 'style', 'noscript', 'iframe', 'img',
+        ],
+        "paragraphs": {
+            "selector": "p.text",
+            "strip": False,
+            "unescape": True,
+            "strip_patterns": [r'<[^>]+>'],  # 엔티티로 이스케이프되어 있던 태그
+            "drop_patterns": [r'(?i)^(?=.*@)(?=.*(?:기자|reporter))'],  # 기자 이메일 문단
+        },
+    },
+    "yonhap_politics": {
+        "container": ['.story-news.article'],
+        "remove": ['aside', 'figure', 'div.comp-box', 'p.txt-copyright'],
+        "paragraphs": {
+            "selector": "p",
+            "separator": " ",
+            "normalize": False,
+            "drop_patterns": [
+                r'저작권자', r'무단 전재', r'제보는 카카오톡',
+                r'\A\[.*\]\Z',                          # [대괄호] 안내 문단
+                r'[a-zA-Z0-9._%+-]+@yna\.co\.kr',       # 기자 이메일
+            ],
+        },
+    },
+    "ohmynews_politics": {
+        "container": ['div.at_contents[itemprop="articleBody"]'],
+        "remove": [
+            'figure', 'script', 'style', 'iframe', 'button', 'img', 'video', 'audio',
+            'div[class*="ad" i]',  # 광고성 div (클래스에 ad/advertisement 포함)
+        ],
+        # 문단 태그 없이 텍스트 노드가 이어지는 본문: 줄 단위로 나눠 한 줄씩 연결
+        "paragraphs": {"split": "lines", "separator": "\n", "normalize": False},
+        "join": "\n",
+    },
+    "sisain_politics": {
+        "container": [
+            'article#article-view-content-div.article-veiw-body[itemprop="articleBody"]',
+            'article.article-veiw-body[itemprop="articleBody"]',
+        ],
+        "remove": [
+            'script', 'style', 'noscript', 'iframe',
+            '.ad-template', 'ins.adsbygoogle', '[id^="AD"]',
+            '.IMGFLOATING', '[style*="display:none"]',
+        ],
+        "br_to_newline": True,
+        "paragraphs": {"selector": "p", "min_length": 10, "measure": "raw"},
+    },
+}
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """
 크롤러 패키지
+(CrawlerManager와 각 크롤러 모듈은 처음 사용할 때 import)
 """
 
-from .crawler_manager import CrawlerManager
+__all__ = ['CrawlerManager']
 
-__all__ = ['CrawlerManager']
\ No newline at end of file
+
+def __getattr__(name):
+    if name == 'CrawlerManager':
+        from .crawler_manager import CrawlerManager
+        return CrawlerManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
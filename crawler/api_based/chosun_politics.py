@@ -3,28 +3,30 @@
 조선일보 정치 기사 크롤러 (API 기반)
 - story-card-by-id API를 사용하여 개별 기사 정보 수집
 - 정치 섹션 기사만 필터링
-- 본문은 Playwright로 별도 수집
+- 본문은 같은 API 응답의 content_elements에서 추출 (없는 기사만 Playwright로 수집)
 """
 
 import asyncio
+import html
 import json
+import re
 import sys
 import os
 from datetime import datetime
-from typing import List, Dict, Optional
-from urllib.parse import urljoin, quote
-import httpx
+from typing import AsyncIterator, List, Dict, Optional
+from urllib.parse import urljoin
 import pytz
-from bs4 import BeautifulSoup
 from rich.console import Console
-from rich.table import Table
-from playwright.async_api import async_playwright
 
 # 프로젝트 루트 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 # 내부 모듈
 from utils.supabase_manager import SupabaseManager
+from utils.http_client import open_client
+from utils.watermark import CrawlWatermark
+from utils.pipeline import CrawlPipeline
+from utils.browser_pool import BrowserPool, open_browser_pool
 
 console = Console()
 KST = pytz.timezone("Asia/Seoul")
@@ -36,21 +38,23 @@ class ChosunPoliticsCollector:
         self.media_name = "조선일보"
         self.media_bias = "right"
         self.supabase_manager = SupabaseManager()
+        self.http_client = None  # CrawlerManager가 주입하는 공유 HTTP 클라이언트
+        self.scheduler = None  # CrawlerManager가 주입하는 스케줄러 (DB 슬롯 관리)
+        self.watermark = CrawlWatermark(self.media_name)  # 언론사별 증분 크롤링 워터마크
         self.articles: List[Dict] = []
-        self._playwright = None
-        self._browser = None
+        self.browser_pool = None  # CrawlerManager가 주입하는 공유 브라우저 풀
 
-    async def _get_politics_article_ids(self, max_articles: int = 150) -> List[str]:
-        """정치 섹션 기사 ID 목록 수집"""
+    async def _iter_article_ids(self, max_articles: int = 150) -> AsyncIterator[Dict]:
+        """정치 섹션 기사 ID를 피드 순서대로 반환 (파이프라인 목록 단계)"""
         console.print("🔌 정치 섹션 기사 ID 수집 시작...")
         
         api_base = "https://www.chosun.com/pf/api/v3/content/fetch/story-feed"
-        article_ids = []
+        collected = 0
         offset = 0
         size = 50
         
-        async with httpx.AsyncClient(timeout=5.0) as client:  # 타임아웃 단축
-            while len(article_ids) < max_articles:
+        async with open_client(self.http_client, timeout=5.0) as client:  # 타임아웃 단축
+            while collected < max_articles:
                 try:
                     console.print(f"📡 API 호출 (offset: {offset})")
                     
@@ -76,14 +80,22 @@ class ChosunPoliticsCollector:
                         console.print("⚠️ 더 이상 기사가 없습니다")
                         break
                     
-                    for element in content_elements:
-                        if len(article_ids) >= max_articles:
+                    # 피드 항목의 URL/시간으로 워터마크 비교 (첫 실행은 max_articles까지 수집)
+                    feed_items = [self._feed_item(element) for element in content_elements]
+                    for element, item in zip(content_elements, feed_items):
+                        if collected >= max_articles:
                             break
                         article_id = element.get("_id")
-                        if article_id:
-                            article_ids.append(article_id)
+                        if article_id and not self.watermark.is_seen(item):
+                            collected += 1
+                            # 피드의 URL을 함께 넘겨 본문 요청 전에 기존 기사 여부 확인
+                            yield {"_id": article_id, "title": "", "url": item["url"]}
                     
-                    console.print(f"📈 수집된 기사 ID: {len(article_ids)}개")
+                    console.print(f"📈 수집된 기사 ID: {collected}개")
+                    
+                    if self.watermark.is_page_stale(feed_items):
+                        console.print("🔖 워터마크 도달 - 이후 피드는 이미 처리된 기사")
+                        break
                     offset += size
                     # 대기 시간 제거
                     
@@ -91,11 +103,18 @@ class ChosunPoliticsCollector:
                     console.print(f"❌ API 호출 오류: {e}")
                     break
 
-        console.print(f"🎯 총 {len(article_ids)}개 기사 ID 수집 완료")
-        return article_ids
+        console.print(f"🎯 총 {collected}개 기사 ID 수집 완료")
+
+    def _feed_item(self, element: Dict) -> Dict:
+        """스토리 피드 항목에서 워터마크 비교용 URL/시간 추출"""
+        canonical_url = element.get("canonical_url") or ""
+        return {
+            "url": urljoin(self.base_url, canonical_url) if canonical_url.startswith("/") else canonical_url,
+            "published_at": element.get("last_updated_date"),
+        }
 
     async def _get_article_details(self, article_id: str) -> Optional[Dict]:
-        """개별 기사 상세 정보 수집"""
+        """개별 기사 상세 API 응답 수집 (기사 데이터 구성은 _parse_article_data)"""
         api_url = "https://www.chosun.com/pf/api/v3/content/fetch/story-card-by-id"
         
         # API 필터 설정 (제공해주신 것과 동일)
@@ -119,6 +138,11 @@ class ChosunPoliticsCollector:
             "description": {
                 "basic": ""
             },
+            "content_elements": {
+                "_id": "",
+                "content": "",
+                "type": ""
+            },
             "display_date": "",
             "first_publish_date": "",
             "headlines": {
@@ -288,7 +312,7 @@ class ChosunPoliticsCollector:
             "published": ""
         }
         
-        async with httpx.AsyncClient(timeout=5.0) as client:  # 타임아웃 단축
+        async with open_client(self.http_client, timeout=5.0) as client:  # 타임아웃 단축
             try:
                 params = {
                     "query": json.dumps(query_data),
@@ -300,9 +324,7 @@ class ChosunPoliticsCollector:
                 
                 resp = await client.get(api_url, params=params)
                 resp.raise_for_status()
-                data = resp.json()
-                
-                return self._parse_article_data(data)
+                return resp.json()
                 
             except Exception as e:
                 console.print(f"❌ 기사 상세 정보 수집 실패 ({article_id}): {e}")
@@ -376,7 +398,7 @@ class ChosunPoliticsCollector:
             return {
                 "title": title.strip(),
                 "url": url,
-                "content": "",  # 본문은 나중에 Playwright로 채움
+                "content": self._content_from_elements(data.get("content_elements")),  # 없으면 Playwright로 채움
                 "published_at": published_at,  # API에서 제공하는 시간 (없을 수도 있음)
                 "created_at": datetime.now(KST).isoformat(),  # 수집 시점의 현재 시간 (항상 존재)
                 "author": author,
@@ -388,161 +410,110 @@ class ChosunPoliticsCollector:
             console.print(f"❌ 데이터 파싱 실패: {e}")
             return None
 
-    async def _collect_articles(self, max_articles: int = 150):
-        """기사 수집 (ID 수집 → 상세 정보 수집) - 병렬 처리"""
-        console.print(f"🚀 조선일보 정치 기사 수집 시작 (최대 {max_articles}개)")
-        
-        # 1단계: 기사 ID 수집
-        article_ids = await self._get_politics_article_ids(max_articles)
-        
-        if not article_ids:
-            console.print("❌ 수집할 기사가 없습니다.")
-            return
-
-        # 2단계: 병렬로 기사 상세 정보 수집 (20개씩 배치)
-        console.print(f"📖 {len(article_ids)}개 기사 상세 정보 수집 중... (병렬 처리)")
-        
-        batch_size = 20
-        success_count = 0
-        
-        for i in range(0, len(article_ids), batch_size):
-            batch_ids = article_ids[i:i + batch_size]
-            console.print(f"📄 배치 {i//batch_size + 1}/{(len(article_ids) + batch_size - 1)//batch_size} 처리 중...")
-            
-            # 배치 내에서 병렬 처리
-            tasks = [self._get_article_details(article_id) for article_id in batch_ids]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for j, result in enumerate(results):
-                if isinstance(result, Exception):
-                    console.print(f"❌ [{i + j + 1}/{len(article_ids)}] 오류: {str(result)[:50]}")
-                elif result:
-                    self.articles.append(result)
-                    success_count += 1
-                    console.print(f"✅ [{i + j + 1}/{len(article_ids)}] {result['title'][:30]}...")
-                else:
-                    console.print(f"⚠️ [{i + j + 1}/{len(article_ids)}] 기사 정보 수집 실패")
-            
-            # 배치 간 짧은 대기
-            if i + batch_size < len(article_ids):
-                await asyncio.sleep(0.1)
-
-        console.print(f"📊 수집 완료: {success_count}/{len(article_ids)}개 성공")
+    def _content_from_elements(self, elements: Optional[List[Dict]]) -> str:
+        """ARC content_elements의 text 요소를 본문 문단으로 변환"""
+        paragraphs = []
+        for element in elements or []:
+            if element.get("type") != "text":
+                continue
+            # 문단 안의 인라인 태그(<b>, <br/>, <a> 등) 제거
+            text = re.sub(r"<br\s*/?>", "\n", element.get("content") or "", flags=re.IGNORECASE)
+            text = html.unescape(re.sub(r"<[^>]+>", "", text)).strip()
+            if text:
+                paragraphs.append(text)
+        return "\n\n".join(paragraphs)
+
+    async def _fetch_detail(self, pool: BrowserPool, item: Dict) -> Optional[Dict]:
+        """
+        기사 상세 API 응답 수집, API 본문이 없는 기사만 브라우저로 본문 수집
+
+        Returns:
+            Optional[Dict]: {"api": API 응답, "browser_content": 브라우저로 추출한 본문 또는 None}
+            (원문 보관소에는 이 응답이 그대로 보관되어 재추출 시 _parse_detail로 다시 구조화)
+        """
+        data = await self._get_article_details(item["_id"])
+        if not data:
+            return None
+        article = self._parse_article_data(data)
+        if not article:
+            return None
+        browser_content = None
+        if len(article["content"]) <= 50:
+            console.print(f"🌐 API 본문 없음 - 브라우저로 수집: {article['title'][:30]}...")
+            browser_content = await self._extract_content(pool, article["url"])
+        return {"api": data, "browser_content": browser_content}
+
+    def _parse_detail(self, item: Dict, raw: Dict) -> Optional[Dict]:
+        """API 응답을 기사 데이터로 구조화 (API 본문이 없으면 브라우저로 수집한 본문 사용)"""
+        article = self._parse_article_data(raw["api"])
+        if not article:
+            return None
+        if raw.get("browser_content") is not None:
+            article["content"] = raw["browser_content"]
+        if article["content"]:
+            console.print(f"✅ 본문 수집 성공: {article['title'][:30]}...")
+        else:
+            console.print(f"⚠️ 본문 수집 실패: {article['title'][:30]}...")
+        return article
 
-    async def _extract_content(self, url: str) -> str:
-        """Playwright로 본문 전문 추출"""
-        page = None
+    async def _extract_content(self, pool: BrowserPool, url: str) -> str:
+        """Playwright로 본문 전문 추출 (공유 브라우저 풀의 페이지 사용)"""
         try:
-            if not self._browser:
-                self._playwright = await async_playwright().start()
-                self._browser = await self._playwright.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox', 
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu',
-                        '--disable-web-security',
-                        '--disable-features=VizDisplayCompositor',
-                        '--memory-pressure-off'
-                    ]
-                )
-
-            page = await self._browser.new_page()
-            await page.set_viewport_size({"width": 1280, "height": 720})
-            await page.goto(url, wait_until="domcontentloaded", timeout=10000)
+            async with pool.page() as page:
+                await page.goto(url, wait_until="domcontentloaded", timeout=10000)
 
-            # 조선일보 본문 추출
-            content = ""
+                # 조선일보 본문 추출
+                content = ""
             
-            try:
-                content = await page.evaluate('''() => {
-                    const selectors = [
-                        'section.article-body p',
-                        'div#article-body p',
-                        'div.article-body p',
-                        'article.article-body p',
-                        '.story-news p',
-                        '.article-content p',
-                        'main p',
-                        'article p'
-                    ];
+                try:
+                    content = await page.evaluate('''() => {
+                        const selectors = [
+                            'section.article-body p',
+                            'div#article-body p',
+                            'div.article-body p',
+                            'article.article-body p',
+                            '.story-news p',
+                            '.article-content p',
+                            'main p',
+                            'article p'
+                        ];
                     
-                    for (const selector of selectors) {
-                        const paragraphs = document.querySelectorAll(selector);
-                        if (paragraphs.length > 0) {
-                            const texts = Array.from(paragraphs)
-                                .map(p => p.textContent.trim())
-                                .filter(text => text.length > 20)
-                                .slice(0, 20);
+                        for (const selector of selectors) {
+                            const paragraphs = document.querySelectorAll(selector);
+                            if (paragraphs.length > 0) {
+                                const texts = Array.from(paragraphs)
+                                    .map(p => p.textContent.trim())
+                                    .filter(text => text.length > 20)
+                                    .slice(0, 20);
                             
-                            if (texts.length > 0) {
-                                return texts.join('\\n\\n');
+                                if (texts.length > 0) {
+                                    return texts.join('\\n\\n');
+                                }
                             }
                         }
-                    }
                     
-                    return "";
-                }''')
+                        return "";
+                    }''')
                 
-                if content and len(content.strip()) > 50:
-                    return content.strip()
+                    if content and len(content.strip()) > 50:
+                        return content.strip()
                     
-            except Exception as e:
-                console.print(f"⚠️ JavaScript 본문 추출 실패: {str(e)[:50]}")
+                except Exception as e:
+                    console.print(f"⚠️ JavaScript 본문 추출 실패: {str(e)[:50]}")
             
-            return content.strip()
+                return content.strip()
             
         except Exception as e:
             console.print(f"❌ 본문 추출 실패 ({url[:50]}...): {str(e)[:50]}")
             return ""
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except:
-                    pass
-
-    async def collect_contents(self):
-        """본문 전문 수집 - 병렬 처리"""
-        if not self.articles:
-            return
-
-        console.print(f"📖 본문 수집 시작: {len(self.articles)}개 기사 (병렬 처리)")
-        
-        batch_size = 10  # 더 큰 배치 크기
-        success_count = 0
-        
-        for i in range(0, len(self.articles), batch_size):
-            batch = self.articles[i:i + batch_size]
-            console.print(f"📄 배치 {i//batch_size + 1}/{(len(self.articles) + batch_size - 1)//batch_size} 처리 중...")
-            
-            # 배치 내에서 병렬 처리
-            tasks = [self._extract_content(art["url"]) for art in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for j, (art, result) in enumerate(zip(batch, results)):
-                if isinstance(result, Exception):
-                    console.print(f"❌ [{i + j + 1}/{len(self.articles)}] 오류: {str(result)[:50]}")
-                elif result:
-                    self.articles[i + j]["content"] = result
-                    success_count += 1
-                    console.print(f"✅ [{i + j + 1}/{len(self.articles)}] 본문 수집 성공")
-                else:
-                    console.print(f"⚠️ [{i + j + 1}/{len(self.articles)}] 본문 수집 실패")
-            
-            # 배치 간 짧은 대기
-            if i + batch_size < len(self.articles):
-                await asyncio.sleep(0.5)
-
-        console.print(f"✅ 본문 수집 완료: {success_count}/{len(self.articles)}개 성공")
 
-    async def save_to_supabase(self):
-        """DB 저장"""
-        if not self.articles:
+    def save_to_supabase(self, articles: List[Dict]) -> List[str]:
+        """DB 저장 - 입력 순서와 같은 기사별 저장 결과 반환 (inserted/duplicate/skipped/failed)"""
+        if not articles:
             console.print("❌ 저장할 기사가 없습니다.")
-            return
+            return []
 
-        console.print(f"💾 Supabase에 {len(self.articles)}개 기사 저장 중...")
+        console.print(f"💾 Supabase에 {len(articles)}개 기사 저장 중...")
 
         # 언론사 확인
         media = self.supabase_manager.get_media_outlet(self.media_name)
@@ -551,32 +522,18 @@ class ChosunPoliticsCollector:
         else:
             media_id = media["id"]
 
-        # 중복 체크
-        urls = [art["url"] for art in self.articles]
-        existing_urls = set()
-        
-        try:
-            for url in urls:
-                exists = self.supabase_manager.client.table("articles").select("url").eq("url", url).execute()
-                if exists.data:
-                    existing_urls.add(url)
-        except Exception as e:
-            console.print(f"⚠️ 중복 체크 중 오류: {e}")
-
         success, failed, skipped, short_content_count = 0, 0, 0, 0
+        rows, row_titles, row_indices = [], [], []
+        results = ["failed"] * len(articles)
         
-        for i, art in enumerate(self.articles, 1):
+        for i, art in enumerate(articles, 1):
             try:
-                if art["url"] in existing_urls:
-                    console.print(f"⚠️ [{i}/{len(self.articles)}] 중복 기사 스킵: {art['title'][:30]}...")
-                    skipped += 1
-                    continue
-                
-                # 본문 길이 체크 (20자 미만 제외)
+                # 본문 길이 체크 (20자 미만 제외, 이미 저장된 기사는 upsert 결과에서 중복으로 확인)
                 content = art.get('content', '')
                 if len(content.strip()) < 20:
+                    results[i - 1] = "skipped"
                     short_content_count += 1
-                    console.print(f"⚠️ [{i}/{len(self.articles)}] 짧은 본문 제외: {art['title'][:30]}...")
+                    console.print(f"⚠️ [{i}/{len(articles)}] 짧은 본문 제외: {art['title'][:30]}...")
                     continue
 
                 published_at_str = None
@@ -598,45 +555,55 @@ class ChosunPoliticsCollector:
                     "created_at": created_at_str,
                 }
 
-                if self.supabase_manager.insert_article(article_data):
-                    success += 1
-                    console.print(f"✅ [{i}/{len(self.articles)}] 저장 성공: {art['title'][:30]}...")
-                else:
-                    failed += 1
-                    console.print(f"❌ [{i}/{len(self.articles)}] 저장 실패: {art['title'][:30]}...")
+                rows.append(article_data)
+                row_titles.append(art["title"])
+                row_indices.append(i - 1)
                     
             except Exception as e:
                 failed += 1
-                console.print(f"❌ [{i}/{len(self.articles)}] 저장 오류: {str(e)[:50]}")
+                console.print(f"❌ [{i}/{len(articles)}] 저장 오류: {str(e)[:50]}")
+
+        # 청크 단위 일괄 저장 (행별 결과 반환)
+        statuses = self.supabase_manager.insert_articles_bulk(rows) if rows else []
+        for index, title, status in zip(row_indices, row_titles, statuses):
+            results[index] = status
+            if status == "inserted":
+                success += 1
+                console.print(f"✅ 저장 성공: {title[:30]}...")
+            elif status == "duplicate":
+                skipped += 1
+            else:
+                failed += 1
+                console.print(f"❌ 저장 실패: {title[:30]}...")
 
         console.print(f"\n📊 저장 결과:")
         console.print(f"  ✅ 성공: {success}개")
         console.print(f"  ❌ 실패: {failed}개") 
         console.print(f"  ⚠️ 중복 스킵: {skipped}개")
         console.print(f"  📏 짧은본문 제외: {short_content_count}개")
-        console.print(f"  📈 성공률: {(success / len(self.articles) * 100):.1f}%")
-
-    async def cleanup(self):
-        """리소스 정리"""
-        try:
-            if self._browser:
-                await self._browser.close()
-                self._browser = None
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
-            console.print("🧹 Playwright 리소스 정리 완료")
-        except Exception as e:
-            console.print(f"⚠️ 리소스 정리 중 오류: {str(e)[:50]}")
+        console.print(f"  📈 성공률: {(success / len(articles) * 100):.1f}%")
+        return results
 
     async def run(self, max_articles: int = 150):
         """실행"""
         try:
             console.print(f"🚀 조선일보 정치 기사 크롤링 시작 (최대 {max_articles}개)")
             
-            await self._collect_articles(max_articles)
-            await self.collect_contents()
-            await self.save_to_supabase()
+            # ID 목록 → 상세/본문 → 저장을 스트리밍으로 처리 (배치 저장 시 DB 슬롯 점유)
+            async with open_browser_pool(self.browser_pool) as pool:
+                pipeline = CrawlPipeline(
+                    self.media_name,
+                    discover=self._iter_article_ids(max_articles),
+                    fetch_detail=lambda item: self._fetch_detail(pool, item),
+                    parse_detail=self._parse_detail,
+                    save_batch=self.save_to_supabase,
+                    scheduler=self.scheduler,
+                    parse_in_process=False,  # API 응답은 수집 단계에서 이미 구조화됨
+                )
+                self.articles = await pipeline.run()
+
+            # 워터마크 갱신 (다음 실행은 이번에 처리한 기사까지만 순회)
+            self.watermark.advance(self.articles, failed=pipeline.failed, skipped=pipeline.skipped)
             
             console.print("🎉 크롤링 완료!")
             
@@ -644,13 +611,14 @@ class ChosunPoliticsCollector:
             console.print("⏹️ 사용자에 의해 중단되었습니다")
         except Exception as e:
             console.print(f"❌ 크롤링 중 오류 발생: {str(e)}")
-        finally:
-            await self.cleanup()
 
 
 async def main():
     collector = ChosunPoliticsCollector()
-    await collector.run(max_articles=150)
+    # 단독 실행 시에도 하나의 커넥션 풀(속도 제한 포함)을 실행 내내 재사용
+    async with open_client() as client:
+        collector.http_client = client
+        await collector.run(max_articles=150)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """
 크롤러 병렬 파이프라인 매니저
-4단계로 나누어 크롤러들을 안정적으로 실행합니다.
+모든 크롤러를 하나의 스케줄러 대기열에 넣고 http 슬롯이 허용하는 만큼 동시에 실행합니다.
+크롤러 내부의 DB 작업(URL 인덱스 동기화, 배치 저장)은 db 슬롯으로 제한합니다.
 """
 
+import argparse
 import asyncio
 import sys
 import os
@@ -19,25 +21,18 @@ import pytz
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 설정 및 크롤러 모듈들 import
-from config.crawler_config import CRAWLER_PARAMS, CRAWLER_GROUPS, PLAYWRIGHT_CRAWLERS, STAGE_DELAYS, RETRY_CONFIG
-# 기존 크롤러들
-from .html_parsing.ohmynews_politics import OhmyNewsPoliticsCollector
-from .html_parsing.yonhap_politics import YonhapPoliticsCollector
-from .html_parsing.hani_politics import HaniPoliticsCrawler
-from .html_parsing.newsone_politics import NewsonePoliticsCrawler
-from .html_parsing.khan_politics import KhanPoliticsCollector
-from .html_parsing.donga_politics import DongaPoliticsCollector
-from .html_parsing.joongang_politics import JoongangPoliticsCollector
-from .html_parsing.newsis_politics import NewsisPoliticsCollector
-from .api_based.chosun_politics import ChosunPoliticsCollector
-
-# 새로운 진보 성향 크롤러들
-from .hybrid.segye_politics import SegyePoliticsCollector
-from .html_parsing.munhwa_politics import MunhwaPoliticsCollector
-from .html_parsing.naeil_politics import NaeilPoliticsCollector
-from .html_parsing.pressian_politics import PressianPoliticsCollector
-from .html_parsing.hankyung_politics import HankyungPoliticsCollector
-from .html_parsing.sisain_politics import SisainPoliticsCollector
+from config.crawler_config import CRAWLER_PARAMS, CRAWLER_GROUPS, FIXTURE_CONFIG, MOCK_OUTLET_CONFIG, METRICS_CONFIG
+from utils.http_client import create_shared_client, get_rate_limiter, get_http_cache, get_retry_controller
+from utils.scheduler import CrawlScheduler, ScheduledJob
+from utils.browser_pool import BrowserPool
+from utils.parse_pool import shutdown_parse_pool
+from utils.tiered_fetch import get_escalation_stats
+from utils.frontier import get_frontier
+from utils.fixtures import start_recording, stop_recording
+from utils.raw_archive import get_raw_archive, close_raw_archive
+from utils.near_duplicate import close_near_duplicate_index
+from utils.crawl_metrics import PHASES, current_outlet, get_crawl_metrics, write_report
+from .registry import load_crawler_class, available_crawlers
 
 console = Console()
 KST = pytz.timezone("Asia/Seoul")
@@ -53,7 +48,8 @@ class CrawlerResult:
         self.end_time = None
         self.duration = None
         self.error_message = None
-        self.articles_collected = 0
+        self.articles_collected = 0  # 저장 단계까지 처리된 기사 수 (파이프라인 지표가 없으면 수집 기사 수)
+        self.metrics = None  # 단계별 시간/요청/기사 처리 지표 (utils.crawl_metrics.OutletMetrics)
         
     def start(self):
         """실행 시작"""
@@ -67,6 +63,18 @@ class CrawlerResult:
         self.status = "success" if success else "failed"
         self.error_message = error_message
         self.articles_collected = articles_count
+    
+    def to_dict(self) -> Dict:
+        """실행 보고서용 딕셔너리"""
+        return {
+            "status": self.status,
+            "started_at": self.start_time.isoformat() if self.start_time else None,
+            "finished_at": self.end_time.isoformat() if self.end_time else None,
+            "duration": round(self.duration, 3) if self.duration is not None else None,
+            "articles_saved": self.articles_collected,
+            "error": self.error_message,
+            "metrics": self.metrics.to_dict() if self.metrics else {},
+        }
 
 
 class CrawlerManager:
@@ -74,34 +82,16 @@ class CrawlerManager:
     
     def __init__(self):
         self.results: Dict[str, CrawlerResult] = {}
-        self.semaphore = asyncio.Semaphore(3)  # 일반 크롤러 동시 실행 제한
-        self.playwright_semaphore = asyncio.Semaphore(2)  # Playwright 크롤러 동시 실행 제한
-        
-        # 크롤러 클래스 매핑
-        self.crawler_classes = {
-            # 기존 크롤러들
-            "ohmynews_politics": OhmyNewsPoliticsCollector,
-            "yonhap_politics": YonhapPoliticsCollector,
-            "hani_politics": HaniPoliticsCrawler,
-            "newsone_politics": NewsonePoliticsCollector,
-            "khan_politics": KhanPoliticsCollector,
-            "donga_politics": DongaPoliticsCollector,
-            "joongang_politics": JoongangPoliticsCollector,
-            "newsis_politics": NewsisPoliticsCollector,
-            "chosun_politics": ChosunPoliticsCollector,
-            
-            # 새로운 진보 성향 크롤러들
-            "segye_politics": SegyePoliticsCollector,
-            "munhwa_politics": MunhwaPoliticsCollector,
-            "naeil_politics": NaeilPoliticsCollector,
-            "pressian_politics": PressianPoliticsCollector,
-            "hankyung_politics": HankyungPoliticsCollector,
-            "sisain_politics": SisainPoliticsCollector,
-        }
+        self.http_client = None  # 모든 크롤러가 공유하는 HTTP 커넥션 풀
+        self.scheduler = None  # 자원 클래스별 슬롯을 관리하는 스케줄러
+        self.browser_pool = None  # Playwright 크롤러들이 공유하는 브라우저 풀
+        self.frontier = get_frontier()  # 중단된 실행을 이어가기 위한 체크포인트
+        self.run_id = None
+        self.completed_crawlers = set()  # 재개한 실행에서 이미 완료된 크롤러
+        self.selected_crawlers = None  # 지정 시 해당 크롤러만 실행 (크롤러 모듈은 실행 시점에 로딩)
         
         # 설정에서 크롤러 그룹 및 설정 가져오기
         self.crawler_groups = CRAWLER_GROUPS
-        self.playwright_crawlers = PLAYWRIGHT_CRAWLERS
     
     def _get_crawler_params(self, crawler_name: str) -> Dict:
         """크롤러별 실행 파라미터 반환"""
@@ -111,26 +101,36 @@ class CrawlerManager:
         """단일 크롤러 실행"""
         result = CrawlerResult(crawler_name)
         self.results[crawler_name] = result
+        # 이 작업에서 보내는 요청과 파이프라인 단계 지표를 크롤러 이름으로 집계
+        current_outlet.set(crawler_name)
+        result.metrics = get_crawl_metrics().outlet(crawler_name)
         
         try:
             console.print(f"🚀 {crawler_name} 크롤러 시작")
             result.start()
             
             # 크롤러 클래스 인스턴스 생성
-            crawler_class = self.crawler_classes.get(crawler_name)
-            if not crawler_class:
-                raise ValueError(f"크롤러 클래스를 찾을 수 없습니다: {crawler_name}")
+            crawler_class = load_crawler_class(crawler_name)
             
             crawler = crawler_class()
+            if hasattr(crawler, "http_client"):
+                crawler.http_client = self.http_client
+            if hasattr(crawler, "scheduler"):
+                crawler.scheduler = self.scheduler
+            if hasattr(crawler, "browser_pool"):
+                crawler.browser_pool = self.browser_pool
             params = self._get_crawler_params(crawler_name)
             
             # 크롤러 실행
             await crawler.run(**params)
             
-            # 성공적으로 완료
-            articles_count = len(getattr(crawler, 'articles', []))
+            # 성공적으로 완료 (발견한 기사가 아니라 DB에 새로 삽입된 기사 수, 중복/제외/저장 실패는 포함하지 않음)
+            counters = result.metrics.counters
+            articles_count = counters["saved"] if "saved" in counters else len(getattr(crawler, 'articles', []))
             result.finish(success=True, articles_count=articles_count)
-            console.print(f"✅ {crawler_name} 완료 - {articles_count}개 기사 수집")
+            console.print(f"✅ {crawler_name} 완료 - {articles_count}개 기사 저장")
+            if self.frontier:
+                self.frontier.mark_crawler_done(self.run_id, crawler_name)
             
         except Exception as e:
             error_msg = str(e)[:100] + "..." if len(str(e)) > 100 else str(e)
@@ -139,73 +139,41 @@ class CrawlerManager:
             
         return result
     
-    async def run_crawler_with_semaphore(self, crawler_name: str) -> CrawlerResult:
-        """세마포어를 사용한 크롤러 실행"""
-        if crawler_name in self.playwright_crawlers:
-            async with self.playwright_semaphore:
-                return await self.run_crawler(crawler_name)
-        else:
-            async with self.semaphore:
-                return await self.run_crawler(crawler_name)
-    
-    async def run_simple_crawlers(self):
-        """단순한 크롤러들 병렬 실행"""
-        stage_info = self.crawler_groups["simple"]
-        console.print(Panel.fit(f"🎯 1단계: {stage_info['description']}", style="bold blue"))
-        
-        crawlers = stage_info["crawlers"]
-        console.print(f"실행할 크롤러: {', '.join(crawlers)}")
-        
-        # 병렬 실행
-        tasks = [self.run_crawler_with_semaphore(crawler) for crawler in crawlers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 결과 출력
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                console.print(f"❌ {crawlers[i]} 예외 발생: {result}")
-            else:
-                status = "✅ 성공" if result.status == "success" else "❌ 실패"
-                console.print(f"{status} {result.crawler_name} - {result.articles_collected}개 기사")
+    def _build_jobs(self) -> List[ScheduledJob]:
+        """전체 크롤러를 스케줄러 작업으로 변환"""
+        jobs = []
+        for group in self.crawler_groups.values():
+            for crawler_name in group["crawlers"]:
+                if self.selected_crawlers is not None and crawler_name not in self.selected_crawlers:
+                    continue
+                if crawler_name in self.completed_crawlers:
+                    console.print(f"⏭️ {crawler_name}: 중단된 실행에서 이미 완료되어 건너뜀")
+                    continue
+                jobs.append(ScheduledJob(
+                    name=crawler_name,
+                    func=lambda name=crawler_name: self.run_crawler(name),
+                    resources=("http",),
+                ))
+        return jobs
     
-    async def run_progressive_crawlers(self):
-        """새로운 진보 성향 크롤러들 병렬 실행"""
-        stage_info = self.crawler_groups["progressive"]
-        console.print(Panel.fit(f"🎯 2단계: {stage_info['description']}", style="bold green"))
+    async def run_all_crawlers(self):
+        """모든 크롤러를 단계 구분 없이 스케줄러로 실행"""
+        self.scheduler = CrawlScheduler()
+        jobs = self._build_jobs()
+        for job in jobs:
+            self.scheduler.submit(job)
         
-        crawlers = stage_info["crawlers"]
-        console.print(f"실행할 크롤러: {', '.join(crawlers)}")
+        slots = ", ".join(f"{name} {count}" for name, count in self.scheduler.capacity.items())
+        console.print(Panel.fit(f"🎯 크롤러 {len(jobs)}개 실행 (슬롯: {slots})", style="bold blue"))
         
-        # 병렬 실행
-        tasks = [self.run_crawler_with_semaphore(crawler) for crawler in crawlers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self.scheduler.run()
         
         # 결과 출력
-        for i, result in enumerate(results):
+        for crawler_name, result in results.items():
             if isinstance(result, Exception):
-                console.print(f"❌ {crawlers[i]} 예외 발생: {result}")
-            else:
-                status = "✅ 성공" if result.status == "success" else "❌ 실패"
-                console.print(f"{status} {result.crawler_name} - {result.articles_collected}개 기사")
-    
-    async def run_complex_crawlers(self):
-        """복잡한 크롤러들 순차 실행 (Playwright 사용)"""
-        stage_info = self.crawler_groups["complex"]
-        console.print(Panel.fit(f"🎯 3단계: {stage_info['description']}", style="bold yellow"))
-        
-        crawlers = stage_info["crawlers"]
-        console.print(f"실행할 크롤러: {', '.join(crawlers)} (순차 실행)")
+                console.print(f"❌ {crawler_name} 예외 발생: {result}")
         
-        # 순차 실행 (Playwright 리소스 충돌 방지)
-        for crawler in crawlers:
-            console.print(f"🔄 {crawler} 실행 중...")
-            result = await self.run_crawler_with_semaphore(crawler)
-            
-            status = "✅ 성공" if result.status == "success" else "❌ 실패"
-            console.print(f"{status} {result.crawler_name} - {result.articles_collected}개 기사")
-            
-            # 크롤러 간 대기 시간
-            await asyncio.sleep(2)
+        self.scheduler = None
     
     def print_summary(self):
         """전체 실행 결과 요약 출력"""
@@ -214,7 +182,12 @@ class CrawlerManager:
         table = Table(title="크롤러 실행 결과")
         table.add_column("크롤러", style="cyan")
         table.add_column("상태", style="green")
-        table.add_column("수집 기사", style="blue")
+        table.add_column("발견", style="blue")
+        table.add_column("기존 기사", style="blue")
+        table.add_column("저장", style="blue")
+        table.add_column("중복", style="blue")
+        table.add_column("제외", style="blue")
+        table.add_column("실패", style="red")
         table.add_column("실행 시간", style="yellow")
         table.add_column("오류 메시지", style="red")
         
@@ -225,11 +198,18 @@ class CrawlerManager:
             status_icon = "✅" if result.status == "success" else "❌"
             duration_str = f"{result.duration:.1f}초" if result.duration else "N/A"
             error_str = result.error_message[:30] + "..." if result.error_message and len(result.error_message) > 30 else result.error_message or ""
+            counters = result.metrics.counters if result.metrics else {}
+            failed = sum(counters.get(key, 0) for key in ("fetch_failed", "parse_failed", "save_failed"))
             
             table.add_row(
                 crawler_name,
                 f"{status_icon} {result.status}",
+                str(counters.get("discovered", "-")),
+                str(counters.get("known_skipped", "-")),
                 str(result.articles_collected),
+                str(counters.get("save_duplicates", "-")),
+                str(counters.get("parse_skipped", 0) + counters.get("save_skipped", 0)) if counters else "-",
+                str(failed),
                 duration_str,
                 error_str
             )
@@ -245,33 +225,159 @@ class CrawlerManager:
         console.print(f"  총 크롤러: {len(self.results)}개")
         console.print(f"  성공: {success_count}개")
         console.print(f"  실패: {len(self.results) - success_count}개")
-        console.print(f"  총 수집 기사: {total_articles}개")
-        console.print(f"  성공률: {(success_count / len(self.results) * 100):.1f}%")
+        console.print(f"  총 저장 기사: {total_articles}개")
+        if self.results:
+            console.print(f"  성공률: {(success_count / len(self.results) * 100):.1f}%")
+        
+        self.print_phase_summary()
     
-    async def run_full_pipeline(self):
-        """전체 파이프라인 실행"""
+    def print_phase_summary(self):
+        """크롤러별 단계 소요 시간과 HTTP 요청 지표 출력"""
+        table = Table(title="크롤러별 단계 소요 시간 (워커 누적 초) / HTTP 요청")
+        table.add_column("크롤러", style="cyan")
+        for phase in PHASES:
+            table.add_column(phase, justify="right")
+        table.add_column("요청", justify="right", style="yellow")
+        table.add_column("수신 (MB)", justify="right", style="yellow")
+        table.add_column("재시도", justify="right", style="red")
+        table.add_column("캐시 재사용", justify="right", style="green")
+        
+        for crawler_name, result in self.results.items():
+            if not result.metrics:
+                continue
+            metrics = result.metrics
+            counters = metrics.counters
+            table.add_row(
+                crawler_name,
+                *(f"{metrics.phase_seconds[phase]:.1f}" if metrics.phase_calls[phase] else "-" for phase in PHASES),
+                str(counters["http_requests"]),
+                f"{counters['http_bytes'] / 1024 / 1024:.1f}",
+                str(counters["http_retries"]),
+                str(counters["http_cache_hits"]),
+            )
+        
+        console.print(table)
+    
+    def export_report(self, start_time: datetime, end_time: datetime):
+        """실행 보고서를 JSON / Prometheus 텍스트 파일로 저장 (METRICS_CONFIG)"""
+        report = {
+            "run_id": self.run_id,
+            "started_at": start_time.isoformat(),
+            "finished_at": end_time.isoformat(),
+            "finished_at_unix": int(end_time.timestamp()),
+            "duration": round((end_time - start_time).total_seconds(), 3),
+            "outlets": {name: result.to_dict() for name, result in self.results.items()},
+        }
+        try:
+            paths = write_report(report, METRICS_CONFIG["json_file"], METRICS_CONFIG["prometheus_file"])
+        except OSError as e:
+            console.print(f"⚠️ 실행 보고서 저장 실패: {e}")
+            return
+        for path in paths:
+            console.print(f"📝 실행 보고서 저장: {path}")
+    
+    def print_rate_limit_summary(self):
+        """호스트별 속도 제한기 최종 상태 출력"""
+        limiter = get_rate_limiter(self.http_client) if self.http_client else None
+        if not limiter:
+            return
+        
+        table = Table(title="호스트별 속도 제한 상태")
+        table.add_column("호스트", style="cyan")
+        table.add_column("동시성", style="green")
+        table.add_column("초당 요청", style="blue")
+        table.add_column("요청 수", style="yellow")
+        table.add_column("백오프", style="red")
+        
+        for host, state in sorted(limiter.snapshot().items()):
+            table.add_row(host, str(state["concurrency"]), str(state["rate"]), str(state["requests"]), str(state["backoffs"]))
+        
+        console.print(table)
+        
+        cache = get_http_cache(self.http_client)
+        if cache:
+            console.print(f"💾 HTTP 캐시: 304 재사용 {cache.revalidated}건, 신규 저장 {cache.stored}건")
+        
+        retry = get_retry_controller(self.http_client)
+        if retry:
+            console.print(f"🔁 재시도 {retry.retries}건 (예산 초과로 포기 {retry.budget_exhausted}건)")
+            for host, state in sorted(retry.snapshot().items()):
+                console.print(f"🚫 {host}: 회로 차단 {state['opened']}회, 즉시 실패 {state['rejected']}건 (현재 {state['state']})")
+    
+    def print_escalation_summary(self):
+        """언론사별 httpx → 브라우저 전환 비율 출력"""
+        for name, stats in get_escalation_stats().items():
+            total = stats["http"] + stats["browser"]
+            if total:
+                console.print(f"🪜 {name}: 브라우저 전환 {stats['browser']}/{total}건 ({stats['browser'] / total * 100:.1f}%)")
+    
+    async def run_full_pipeline(self, crawler_names: Optional[List[str]] = None):
+        """
+        전체 파이프라인 실행
+        
+        Args:
+            crawler_names: 실행할 크롤러 이름 (없으면 전체)
+        """
+        self.selected_crawlers = set(crawler_names) if crawler_names else None
         start_time = datetime.now(KST)
         console.print(Panel.fit("🚀 크롤러 파이프라인 시작", style="bold white"))
         console.print(f"시작 시간: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
+        # 픽스처 기록은 공유 클라이언트 생성 전에 시작해야 응답이 기록됨
+        if FIXTURE_CONFIG["record"]:
+            start_recording(FIXTURE_CONFIG["dir"])
+        
+        # 파이프라인 전체에서 재사용할 커넥션 풀 및 브라우저 풀 생성 (브라우저는 첫 사용 시 실행)
+        self.http_client = create_shared_client()
+        self.browser_pool = BrowserPool()
+        if MOCK_OUTLET_CONFIG["base_url"]:
+            console.print(f"🧪 모의 언론사 서버로 요청 전환: {MOCK_OUTLET_CONFIG['base_url']}")
+        
+        cache = get_http_cache(self.http_client)
+        if cache:
+            removed = cache.prune()
+            if removed:
+                console.print(f"🧹 만료된 HTTP 캐시 {removed}개 정리")
+        
+        archive = get_raw_archive()
+        if archive:
+            removed = archive.prune()
+            if removed:
+                console.print(f"🧹 보관 기간이 지난 원문 {removed}개 정리")
+        
+        # 중단된 실행이 있으면 완료된 크롤러는 건너뛰고 나머지는 멈춘 기사부터 이어서 수집
+        if self.frontier:
+            self.run_id, resumed = self.frontier.begin_run()
+            if resumed:
+                self.completed_crawlers = self.frontier.completed_crawlers(self.run_id)
+                console.print(f"⏯️ 중단된 실행 재개 (완료된 크롤러 {len(self.completed_crawlers)}개)")
+        
         try:
-            # 1단계: 단순한 크롤러들
-            await self.run_simple_crawlers()
-            await asyncio.sleep(STAGE_DELAYS["simple"])
-            
-            # 2단계: 새로운 진보 성향 크롤러들
-            await self.run_progressive_crawlers()
-            await asyncio.sleep(STAGE_DELAYS["progressive"])
-            
-            # 3단계: 복잡한 크롤러들
-            await self.run_complex_crawlers()
-            await asyncio.sleep(STAGE_DELAYS["complex"])
+            await self.run_all_crawlers()
+            # 모든 크롤러가 성공했을 때만 다음 실행을 새로 시작 (실패한 크롤러는 다음 실행에서 이어서 수집)
+            if self.frontier:
+                failed = [name for name, result in self.results.items() if result.status != "success"]
+                if failed:
+                    console.print(f"⏸️ 실패한 크롤러 {len(failed)}개는 다음 실행에서 이어서 수집: {', '.join(failed)}")
+                else:
+                    self.frontier.finish_run(self.run_id)
             
         except KeyboardInterrupt:
             console.print("⏹️ 사용자에 의해 중단되었습니다")
         except Exception as e:
             console.print(f"❌ 파이프라인 실행 중 오류: {e}")
         finally:
+            self.print_rate_limit_summary()
+            self.print_escalation_summary()
+            await self.http_client.aclose()
+            self.http_client = None
+            await self.browser_pool.close()
+            self.browser_pool = None
+            shutdown_parse_pool()
+            stop_recording()
+            close_raw_archive()
+            close_near_duplicate_index()
+            
             end_time = datetime.now(KST)
             total_duration = (end_time - start_time).total_seconds()
             
@@ -281,12 +387,26 @@ class CrawlerManager:
             
             # 결과 요약 출력
             self.print_summary()
+            self.export_report(start_time, end_time)
 
 
 async def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="정치 기사 크롤러 파이프라인")
+    parser.add_argument("crawlers", nargs="*", choices=available_crawlers(), metavar="crawler",
+                        help="실행할 크롤러 (기본: 전체, 예: hani_politics)")
+    parser.add_argument("--record-fixtures", metavar="DIR",
+                        help="받은 응답과 파싱 입력을 오프라인 픽스처로 기록할 경로")
+    parser.add_argument("--mock-outlets", metavar="URL",
+                        help="모든 HTTP 요청을 모의 언론사 서버로 전환 (예: http://127.0.0.1:8765)")
+    args = parser.parse_args()
+    if args.mock_outlets:
+        MOCK_OUTLET_CONFIG["base_url"] = args.mock_outlets
+    if args.record_fixtures:
+        FIXTURE_CONFIG.update(record=True, dir=args.record_fixtures)
+    
     manager = CrawlerManager()
-    await manager.run_full_pipeline()
+    await manager.run_full_pipeline(args.crawlers or None)
 
 
 if __name__ == "__main__":
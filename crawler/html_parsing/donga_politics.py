@@ -25,6 +25,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 # 내부 모듈
 from utils.supabase_manager import SupabaseManager
+from utils.http_client import open_client
+from utils.watermark import CrawlWatermark, iter_new_articles
+from utils.pipeline import CrawlPipeline
+from utils.browser_pool import BrowserPool, open_browser_pool
+from utils.tiered_fetch import TieredFetcher
+from utils.html_parser import make_soup
 
 console = Console()
 KST = pytz.timezone("Asia/Seoul")
@@ -37,6 +43,10 @@ class DongaPoliticsCollector:
         self.media_name = "동아일보"
         self.media_bias = "center"
         self.supabase_manager = SupabaseManager()
+        self.http_client = None  # CrawlerManager가 주입하는 공유 HTTP 클라이언트
+        self.scheduler = None  # CrawlerManager가 주입하는 스케줄러 (DB 슬롯 관리)
+        self.watermark = CrawlWatermark(self.media_name)  # 언론사별 증분 크롤링 워터마크
+        self.browser_pool = None  # CrawlerManager가 주입하는 공유 브라우저 풀
         self.articles: List[Dict] = []
         
         # HTTP 클라이언트 설정 (최적화)
@@ -49,8 +59,7 @@ class DongaPoliticsCollector:
             "Upgrade-Insecure-Requests": "1",
         }
         
-        # 동시성 제한 설정
-        self.semaphore = asyncio.Semaphore(10)  # 최대 10개 동시 요청
+        # 배치 설정 (동시성은 공유 클라이언트의 호스트별 속도 제한기가 조절)
         self.batch_size = 20  # DB 배치 저장 크기
 
     def _get_page_urls(self, num_pages: int = 15) -> List[str]:
@@ -66,11 +75,11 @@ class DongaPoliticsCollector:
         """특정 페이지에서 기사 목록 수집"""
         console.print(f"📡 페이지 수집: {page_url}")
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with open_client(self.http_client, timeout=10.0) as client:
             try:
                 resp = await client.get(page_url)
                 resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, 'html.parser')
+                soup = make_soup(resp.text)
                 
                 articles = []
                 
@@ -223,155 +232,161 @@ class DongaPoliticsCollector:
                 console.print(f"❌ 페이지 수집 실패: {e}")
                 return []
 
-    async def collect_articles_parallel(self, num_pages: int = 15):
-        """기사 수집 (병렬 처리)"""
-        console.print(f"📄 {num_pages}개 페이지에서 기사 수집 시작 (병렬 처리)...")
-        
+    async def _run_pipeline(self, num_pages: int = 15):
+        """목록 → 본문 → 파싱 → 저장 스트리밍 파이프라인 실행"""
         page_urls = self._get_page_urls(num_pages)
         
-        # 모든 페이지를 동시에 처리
-        tasks = [self._collect_page_articles_parallel(page_url, i + 1) for i, page_url in enumerate(page_urls)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async with open_client(self.http_client, timeout=15.0) as client, \
+                open_browser_pool(self.browser_pool) as pool:
+            # httpx로 먼저 추출하고 본문이 부족한 기사만 브라우저로 재수집
+            fetcher = TieredFetcher(
+                self.media_name,
+                http_fetch=lambda article: self._fetch_detail(client, article),
+                http_parse=self._parse_detail,
+                browser_fetch=lambda article: self._extract_content(pool, article["url"]),
+                browser_parse=self._parse_browser_result,
+            )
+            pipeline = CrawlPipeline(
+                self.media_name,
+                # 첫 실행은 전체 페이지를 동시에, 이후에는 워터마크에 닿을 때까지만 순서대로 수집
+                discover=iter_new_articles(
+                    lambda i: self._collect_page_articles_parallel(page_urls[i], i + 1), len(page_urls), self.watermark
+                ),
+                fetch_detail=fetcher.fetch_detail,
+                parse_detail=fetcher.parse_detail,
+                save_batch=self.save_articles_batch,
+                scheduler=self.scheduler,
+                parse_in_process=False,  # httpx 결과는 수집 단계에서 이미 파싱됨
+            )
+            self.articles = await pipeline.run()
+        fetcher.print_summary()
         
-        # 결과 수집
-        total_articles = 0
-        for i, result in enumerate(results, 1):
-            if isinstance(result, Exception):
-                console.print(f"❌ 페이지 {i} 처리 중 오류: {str(result)}")
-            else:
-                total_articles += result
-                
-        console.print(f"📊 총 {total_articles}개 기사 수집")
+        # 워터마크 갱신 (다음 실행은 이번에 처리한 기사까지만 순회)
+        self.watermark.advance(self.articles, failed=pipeline.failed, skipped=pipeline.skipped)
 
-    async def _collect_page_articles_parallel(self, page_url: str, page_num: int) -> int:
+    async def _collect_page_articles_parallel(self, page_url: str, page_num: int) -> List[Dict]:
         """단일 페이지에서 기사 수집 (병렬 처리용)"""
         console.print(f"📡 페이지 {page_num}: {page_url}")
 
-        async with self.semaphore:  # 동시성 제한
-            try:
-                async with httpx.AsyncClient(
-                    timeout=15.0,
-                    follow_redirects=True,
-                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-                ) as client:
-                    response = await client.get(page_url, headers=self.headers)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, 'html.parser')
+        try:
+            async with open_client(self.http_client, timeout=15.0) as client:
+                response = await client.get(page_url, headers=self.headers)
+                response.raise_for_status()
+                soup = make_soup(response.text)
                     
-                    articles = []
+                articles = []
                     
-                    # 동아일보 정치 섹션의 기사 링크 추출
-                    divide_area = soup.find('div', class_='divide_area')
+                # 동아일보 정치 섹션의 기사 링크 추출
+                divide_area = soup.find('div', class_='divide_area')
                     
-                    if divide_area:
-                        sub_news_sec = divide_area.find('section', class_='sub_news_sec')
-                        if sub_news_sec:
-                            row_list = sub_news_sec.find('ul', class_='row_list')
-                            if row_list:
-                                li_items = row_list.find_all('li')
+                if divide_area:
+                    sub_news_sec = divide_area.find('section', class_='sub_news_sec')
+                    if sub_news_sec:
+                        row_list = sub_news_sec.find('ul', class_='row_list')
+                        if row_list:
+                            li_items = row_list.find_all('li')
                                 
-                                # 각 페이지에서 최대 10개 기사 수집
-                                collected_count = 0
-                                max_articles_per_page = 10
+                            # 각 페이지에서 최대 10개 기사 수집
+                            collected_count = 0
+                            max_articles_per_page = 10
                                 
-                                for i, li in enumerate(li_items):
-                                    if collected_count >= max_articles_per_page:
-                                        break
+                            for i, li in enumerate(li_items):
+                                if collected_count >= max_articles_per_page:
+                                    break
                                         
-                                    news_card = li.find('article', class_='news_card')
+                                news_card = li.find('article', class_='news_card')
                                     
-                                    if news_card:
-                                        # 링크 찾기
-                                        link = None
+                                if news_card:
+                                    # 링크 찾기
+                                    link = None
                                         
-                                        # news_body의 .tit a에서 링크 찾기
-                                        news_body = news_card.find('div', class_='news_body')
-                                        if news_body:
-                                            tit_link = news_body.find('h4', class_='tit')
-                                            if tit_link:
-                                                link = tit_link.find('a', href=True)
+                                    # news_body의 .tit a에서 링크 찾기
+                                    news_body = news_card.find('div', class_='news_body')
+                                    if news_body:
+                                        tit_link = news_body.find('h4', class_='tit')
+                                        if tit_link:
+                                            link = tit_link.find('a', href=True)
                                         
-                                        # 대안: news_head에서 링크 찾기
-                                        if not link:
-                                            news_head = news_card.find('header', class_='news_head')
-                                            if news_head:
-                                                link = news_head.find('a', href=True)
+                                    # 대안: news_head에서 링크 찾기
+                                    if not link:
+                                        news_head = news_card.find('header', class_='news_head')
+                                        if news_head:
+                                            link = news_head.find('a', href=True)
                                         
-                                        # 대안: news_card에서 직접 링크 찾기
-                                        if not link:
-                                            link = news_card.find('a', href=True)
+                                    # 대안: news_card에서 직접 링크 찾기
+                                    if not link:
+                                        link = news_card.find('a', href=True)
                                         
-                                        if link:
-                                            href = link.get('href')
-                                            category = link.get('data-ep_button_category')
+                                    if link:
+                                        href = link.get('href')
+                                        category = link.get('data-ep_button_category')
                                             
-                                            # 정치 카테고리만 필터링
-                                            is_politics = False
-                                            if href and '/news/' in href and '/article/' in href:
-                                                if category == '정치':
-                                                    is_politics = True
+                                        # 정치 카테고리만 필터링
+                                        is_politics = False
+                                        if href and '/news/' in href and '/article/' in href:
+                                            if category == '정치':
+                                                is_politics = True
                                             
-                                            if is_politics:
-                                                # 상대 URL을 절대 URL로 변환
-                                                if href.startswith('/'):
-                                                    full_url = urljoin(self.base_url, href)
-                                                else:
-                                                    full_url = href
+                                        if is_politics:
+                                            # 상대 URL을 절대 URL로 변환
+                                            if href.startswith('/'):
+                                                full_url = urljoin(self.base_url, href)
+                                            else:
+                                                full_url = href
                                                 
-                                                # 제목 추출
-                                                title = link.get('data-ep_button_name', '').strip()
-                                                if not title:
-                                                    title = link.get('data-ep_contentdata_content_title', '').strip()
-                                                if not title:
-                                                    title_text = link.find(text=True, recursive=False)
-                                                    if title_text:
-                                                        title = title_text.strip()
-                                                if not title:
-                                                    img_tag = link.find('img')
-                                                    if img_tag:
-                                                        title = img_tag.get('alt', '').strip()
+                                            # 제목 추출
+                                            title = link.get('data-ep_button_name', '').strip()
+                                            if not title:
+                                                title = link.get('data-ep_contentdata_content_title', '').strip()
+                                            if not title:
+                                                title_text = link.find(text=True, recursive=False)
+                                                if title_text:
+                                                    title = title_text.strip()
+                                            if not title:
+                                                img_tag = link.find('img')
+                                                if img_tag:
+                                                    title = img_tag.get('alt', '').strip()
                                                 
-                                                if title and len(title) > 10:
-                                                    article = {
-                                                        'title': title,
-                                                        'url': full_url,
-                                                        'content': '',
-                                                        'published_at': ''
-                                                    }
-                                                    articles.append(article)
-                                                    collected_count += 1
-                                                    console.print(f"📰 발견: {title[:50]}...")
-                    else:
-                        # 전체 페이지에서 기사 링크 찾기
-                        links = soup.find_all('a', href=True)
-                        news_links = [link for link in links if link.get('href') and '/news/article/' in link.get('href')]
+                                            if title and len(title) > 10:
+                                                article = {
+                                                    'title': title,
+                                                    'url': full_url,
+                                                    'content': '',
+                                                    'published_at': ''
+                                                }
+                                                articles.append(article)
+                                                collected_count += 1
+                                                console.print(f"📰 발견: {title[:50]}...")
+                else:
+                    # 전체 페이지에서 기사 링크 찾기
+                    links = soup.find_all('a', href=True)
+                    news_links = [link for link in links if link.get('href') and '/news/article/' in link.get('href')]
                         
-                        for link in news_links:
-                            href = link.get('href')
-                            if href.startswith('/'):
-                                full_url = urljoin(self.base_url, href)
-                            else:
-                                full_url = href
+                    for link in news_links:
+                        href = link.get('href')
+                        if href.startswith('/'):
+                            full_url = urljoin(self.base_url, href)
+                        else:
+                            full_url = href
                             
-                            title = link.get_text(strip=True)
-                            if title and len(title) > 10:
-                                article = {
-                                    'title': title,
-                                    'url': full_url,
-                                    'content': '',
-                                    'published_at': ''
-                                }
-                                articles.append(article)
-                                console.print(f"📰 발견: {title[:50]}...")
-                                break
+                        title = link.get_text(strip=True)
+                        if title and len(title) > 10:
+                            article = {
+                                'title': title,
+                                'url': full_url,
+                                'content': '',
+                                'published_at': ''
+                            }
+                            articles.append(article)
+                            console.print(f"📰 발견: {title[:50]}...")
+                            break
                     
-                    self.articles.extend(articles)
-                    console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
-                    return len(articles)
+                console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
+                return articles
 
-            except Exception as e:
-                console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
-                return 0
+        except Exception as e:
+            console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
+            return []
 
     def _parse_article_data(self, article_data: Dict) -> Optional[Dict]:
         """기사 데이터 파싱"""
@@ -413,171 +428,129 @@ class DongaPoliticsCollector:
             console.print(f"❌ 데이터 파싱 실패: {e}")
             return None
 
-    async def _extract_content(self, url: str) -> Dict[str, str]:
-        """Playwright로 본문 전문 추출"""
-        page = None
+    async def _extract_content(self, pool: BrowserPool, url: str) -> Dict[str, str]:
+        """Playwright로 본문 전문 추출 (공유 브라우저 풀의 페이지 사용)"""
         try:
-            if not self._browser:
-                self._playwright = await async_playwright().start()
-                self._browser = await self._playwright.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox', 
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu',
-                        '--disable-web-security',
-                        '--disable-features=VizDisplayCompositor',
-                        '--memory-pressure-off'
-                    ]
-                )
-
-            page = await self._browser.new_page()
-            await page.set_viewport_size({"width": 1280, "height": 720})
-            await page.goto(url, wait_until="domcontentloaded", timeout=10000)
-
-            # 동아일보 본문 및 발행 시간 추출
-            result = {"content": "", "published_at": ""}
+            async with pool.page() as page:
+                await page.goto(url, wait_until="domcontentloaded", timeout=10000)
+
+                # 동아일보 본문 및 발행 시간 추출
+                result = {"content": "", "published_at": ""}
             
-            try:
-                result = await page.evaluate('''() => {
-                    // <section class="news_view"> 찾기
-                    const newsView = document.querySelector('section.news_view');
-                    if (!newsView) {
-                        return {content: '', published_at: ''};
-                    }
+                try:
+                    result = await page.evaluate('''() => {
+                        // <section class="news_view"> 찾기
+                        const newsView = document.querySelector('section.news_view');
+                        if (!newsView) {
+                            return {content: '', published_at: ''};
+                        }
                     
-                    // 발행 시간 추출 (<span aria-hidden="true">2025-09-04 15:33</span>)
-                    let publishedAt = '';
-                    const timeSpan = document.querySelector('span[aria-hidden="true"]');
-                    if (timeSpan) {
-                        const timeText = timeSpan.textContent.trim();
-                        // YYYY-MM-DD HH:MM 형식인지 확인
-                        if (/^\\d{4}-\\d{2}-\\d{2} \\d{2}:\\d{2}$/.test(timeText)) {
-                            publishedAt = timeText;
+                        // 발행 시간 추출 (<span aria-hidden="true">2025-09-04 15:33</span>)
+                        let publishedAt = '';
+                        const timeSpan = document.querySelector('span[aria-hidden="true"]');
+                        if (timeSpan) {
+                            const timeText = timeSpan.textContent.trim();
+                            // YYYY-MM-DD HH:MM 형식인지 확인
+                            if (/^\\d{4}-\\d{2}-\\d{2} \\d{2}:\\d{2}$/.test(timeText)) {
+                                publishedAt = timeText;
+                            }
                         }
-                    }
                     
-                    // 제외할 요소들 제거
-                    const excludeSelectors = [
-                        'h2.sub_tit',  // 기사 제목
-                        'figure',      // 이미지 관련
-                        'img',         // 이미지
-                        'figcaption',  // 이미지 캡션
-                        '.view_m_adK', // 광고 영역
-                        '.view_ad06',  // 광고 영역
-                        '.view_m_adA', // 광고 영역
-                        '.view_m_adB', // 광고 영역
-                        '.a1'          // 광고 영역
-                    ];
+                        // 제외할 요소들 제거
+                        const excludeSelectors = [
+                            'h2.sub_tit',  // 기사 제목
+                            'figure',      // 이미지 관련
+                            'img',         // 이미지
+                            'figcaption',  // 이미지 캡션
+                            '.view_m_adK', // 광고 영역
+                            '.view_ad06',  // 광고 영역
+                            '.view_m_adA', // 광고 영역
+                            '.view_m_adB', // 광고 영역
+                            '.a1'          // 광고 영역
+                        ];
                     
-                    // 제외할 요소들 제거
-                    excludeSelectors.forEach(selector => {
-                        const elements = newsView.querySelectorAll(selector);
-                        elements.forEach(el => el.remove());
-                    });
+                        // 제외할 요소들 제거
+                        excludeSelectors.forEach(selector => {
+                            const elements = newsView.querySelectorAll(selector);
+                            elements.forEach(el => el.remove());
+                        });
                     
-                    // 텍스트 노드들을 순서대로 수집
-                    const textNodes = [];
-                    const walker = document.createTreeWalker(
-                        newsView,
-                        NodeFilter.SHOW_TEXT,
-                        {
-                            acceptNode: function(node) {
-                                const text = node.textContent.trim();
-                                if (text.length === 0) {
-                                    return NodeFilter.FILTER_REJECT;
+                        // 텍스트 노드들을 순서대로 수집
+                        const textNodes = [];
+                        const walker = document.createTreeWalker(
+                            newsView,
+                            NodeFilter.SHOW_TEXT,
+                            {
+                                acceptNode: function(node) {
+                                    const text = node.textContent.trim();
+                                    if (text.length === 0) {
+                                        return NodeFilter.FILTER_REJECT;
+                                    }
+                                    return NodeFilter.FILTER_ACCEPT;
                                 }
-                                return NodeFilter.FILTER_ACCEPT;
                             }
-                        }
-                    );
+                        );
                     
-                    let node;
-                    while (node = walker.nextNode()) {
-                        textNodes.push(node.textContent.trim());
-                    }
+                        let node;
+                        while (node = walker.nextNode()) {
+                            textNodes.push(node.textContent.trim());
+                        }
                     
-                    // <br> 태그를 문단 구분자로 처리하고 텍스트 연결
-                    let content = textNodes.join(' ').replace(/\\s+/g, ' ').trim();
+                        // <br> 태그를 문단 구분자로 처리하고 텍스트 연결
+                        let content = textNodes.join(' ').replace(/\\s+/g, ' ').trim();
                     
-                    // <br> 태그를 문단 구분자로 변환
-                    content = content.replace(/<br\\s*\\/?>/gi, '\\n\\n');
+                        // <br> 태그를 문단 구분자로 변환
+                        content = content.replace(/<br\\s*\\/?>/gi, '\\n\\n');
                     
-                    // 연속된 공백 정리
-                    content = content.replace(/\\s+/g, ' ').trim();
+                        // 연속된 공백 정리
+                        content = content.replace(/\\s+/g, ' ').trim();
                     
-                    return {content: content, published_at: publishedAt};
-                }''')
+                        return {content: content, published_at: publishedAt};
+                    }''')
                 
-                if result.get("content") and len(result["content"].strip()) > 50:
-                    return result
+                    if result.get("content") and len(result["content"].strip()) > 50:
+                        return result
                     
-            except Exception as e:
-                console.print(f"⚠️ JavaScript 본문 추출 실패: {str(e)[:50]}")
+                except Exception as e:
+                    console.print(f"⚠️ JavaScript 본문 추출 실패: {str(e)[:50]}")
             
-            return result
+                return result
             
         except Exception as e:
             console.print(f"❌ 본문 추출 실패 ({url[:50]}...): {str(e)[:50]}")
             return {"content": "", "published_at": ""}
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except:
-                    pass
 
-    async def collect_contents_parallel(self):
-        """기사 본문 수집 (병렬 처리)"""
-        console.print(f"📖 {len(self.articles)}개 기사 본문 수집 시작 (병렬 처리)...")
+    async def _fetch_detail(self, client: httpx.AsyncClient, article: dict) -> str:
+        """기사 상세 페이지 HTML 요청"""
+        response = await client.get(article["url"], headers=self.headers)
+        response.raise_for_status()
+        return response.text
+
+    def _parse_detail(self, article: dict, html: str) -> dict:
+        """상세 페이지 HTML에서 기사 본문 및 발행시간 추출"""
+        soup = make_soup(html)
         
-        # 모든 기사를 동시에 처리 (배치로 나누어서)
-        batch_size = 20  # 한 번에 처리할 기사 수
-        total_batches = (len(self.articles) + batch_size - 1) // batch_size
+        # 발행시간 추출
+        published_at = self._extract_published_at(soup)
+        article["published_at"] = published_at
         
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(self.articles))
-            batch_articles = self.articles[start_idx:end_idx]
-            
-            console.print(f"📖 배치 {batch_num + 1}/{total_batches}: {len(batch_articles)}개 기사 처리 중...")
-            
-            # 배치 내에서 병렬 처리
-            async with httpx.AsyncClient(
-                timeout=15.0,
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-            ) as client:
-                tasks = [self._extract_content_httpx(client, article, i + start_idx + 1) for i, article in enumerate(batch_articles)]
-                await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 배치 간 짧은 딜레이 (서버 부하 방지)
-            if batch_num < total_batches - 1:
-                await asyncio.sleep(0.5)
+        # 본문 추출
+        content = self._extract_content_text(soup)
+        article["content"] = content
+        
+        console.print(f"✅ 완료: {len(content)}자 - {article['title'][:30]}...")
+        
+        return article
 
-    async def _extract_content_httpx(self, client: httpx.AsyncClient, article: dict, index: int):
-        """httpx로 기사 본문 및 발행시간 추출"""
-        try:
-            console.print(f"📖 [{index}] 시작: {article['title'][:40]}...")
-            
-            response = await client.get(article["url"], headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 발행시간 추출
-            published_at = self._extract_published_at(soup)
-            article["published_at"] = published_at
-            
-            # 본문 추출
-            content = self._extract_content_text(soup)
-            article["content"] = content
-            
-            console.print(f"✅ [{index}] 완료: {len(content)}자")
-            
-        except Exception as e:
-            console.print(f"❌ [{index}] 실패: {str(e)[:50]}...")
-            article["content"] = ""
-            article["published_at"] = datetime.now(pytz.UTC).isoformat()
+    def _parse_browser_result(self, article: dict, result: Dict[str, str]) -> dict:
+        """브라우저 추출 결과(본문 + "YYYY-MM-DD HH:MM" 발행시간)를 기사에 반영"""
+        article["content"] = result.get("content", "")
+        if result.get("published_at"):
+            article["published_at"] = self._parse_datetime(result["published_at"])
+        
+        console.print(f"✅ 완료(브라우저): {len(article['content'])}자 - {article['title'][:30]}...")
+        
+        return article
 
     def _extract_published_at(self, soup: BeautifulSoup) -> str:
         """발행시간 추출"""
@@ -713,13 +686,14 @@ class DongaPoliticsCollector:
             console.print(f"⚠️ 날짜 파싱 실패: {clean_time} - {str(e)}")
             return datetime.now(pytz.UTC).isoformat()
 
-    async def save_articles_batch(self):
-        """DB 배치 저장 (최적화)"""
-        if not self.articles:
+    def save_articles_batch(self, articles: List[Dict]) -> List[str]:
+        """DB 배치 저장 (최적화) - 입력 순서와 같은 기사별 저장 결과 반환 (inserted/duplicate/skipped/failed)"""
+        if not articles:
             console.print("⚠️ 저장할 기사가 없습니다.")
-            return
+            return []
             
-        console.print(f"💾 Supabase에 {len(self.articles)}개 기사 배치 저장 중...")
+        console.print(f"💾 Supabase에 {len(articles)}개 기사 배치 저장 중...")
+        statuses = ["failed"] * len(articles)
 
         try:
             # 언론사 확인
@@ -729,27 +703,17 @@ class DongaPoliticsCollector:
             else:
                 media_id = media["id"]
 
-            # 기존 URL 가져오기 (중복 체크)
-            existing_urls = set()
-            try:
-                result = self.supabase_manager.client.table("articles").select("url").eq("media_id", media_id).execute()
-                existing_urls = {article["url"] for article in result.data}
-            except Exception as e:
-                console.print(f"⚠️ 기존 URL 조회 실패: {str(e)}")
-
-            # 중복 제거 및 배치 준비
+            # 배치 준비 (이미 저장된 기사는 upsert 결과에서 중복으로 확인)
             new_articles = []
+            new_indices = []
             skip_count = 0
             short_content_count = 0
             
-            for article in self.articles:
-                if article["url"] in existing_urls:
-                    skip_count += 1
-                    continue
-                
+            for i, article in enumerate(articles):
                 # 본문 길이 체크 (20자 미만 제외)
                 content = article.get('content', '')
                 if len(content.strip()) < 20:
+                    statuses[i] = "skipped"
                     short_content_count += 1
                     continue
                     
@@ -757,10 +721,15 @@ class DongaPoliticsCollector:
                 parsed_article = self._parse_article_data_simple(article, media_id)
                 if parsed_article:
                     new_articles.append(parsed_article)
+                    new_indices.append(i)
 
             # 배치 저장
             if new_articles:
-                success_count = self._batch_insert_articles(new_articles)
+                results = self._batch_insert_articles(new_articles)
+                for i, status in zip(new_indices, results):
+                    statuses[i] = status
+                success_count = results.count("inserted")
+                skip_count = results.count("duplicate")
                 console.print(f"✅ 배치 저장 완료: {success_count}개 성공")
             else:
                 console.print("⚠️ 저장할 새 기사가 없습니다.")
@@ -769,6 +738,7 @@ class DongaPoliticsCollector:
             
         except Exception as e:
             console.print(f"❌ DB 저장 중 치명적 오류: {str(e)}")
+        return statuses
 
     def _parse_article_data_simple(self, article: dict, media_id: str) -> Optional[dict]:
         """기사 데이터 간단 파싱 (배치 저장용)"""
@@ -785,55 +755,22 @@ class DongaPoliticsCollector:
             console.print(f"❌ 기사 데이터 파싱 실패: {e}")
             return None
 
-    def _batch_insert_articles(self, articles: List[Dict]) -> int:
-        """배치로 기사 삽입"""
-        try:
-            # Supabase의 upsert 기능 사용
-            result = self.supabase_manager.client.table("articles").upsert(articles).execute()
-            return len(result.data) if result.data else 0
-        except Exception as e:
-            console.print(f"❌ 배치 저장 실패: {str(e)}")
-            # 개별 저장으로 폴백
-            success_count = 0
-            for article in articles:
-                try:
-                    if self.supabase_manager.insert_article(article):
-                        success_count += 1
-                except:
-                    continue
-            return success_count
-
-    async def cleanup(self):
-        """리소스 정리"""
-        try:
-            if self._browser:
-                await self._browser.close()
-                self._browser = None
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
-            console.print("🧹 Playwright 리소스 정리 완료")
-        except Exception as e:
-            console.print(f"⚠️ 리소스 정리 중 오류: {str(e)[:50]}")
+    def _batch_insert_articles(self, articles: List[Dict]) -> List[str]:
+        """배치로 기사 삽입 (청크 단위 일괄 upsert, 기사별 결과 반환)"""
+        return self.supabase_manager.insert_articles_bulk(articles)
 
     async def run(self, num_pages: int = 15):
         """실행 (최적화 버전)"""
         try:
             console.print(f"🚀 동아일보 정치 기사 크롤링 시작 (최적화 버전, 최대 {num_pages}페이지)")
             
-            # 1. 기사 목록 수집 (병렬 처리)
-            await self.collect_articles_parallel(num_pages)
+            # 목록 → 본문 → 파싱 → 저장을 스트리밍으로 처리 (배치 저장 시 DB 슬롯 점유)
+            await self._run_pipeline(num_pages)
             
             if not self.articles:
                 console.print("❌ 수집된 기사가 없습니다")
                 return
             
-            # 2. 기사 본문 수집 (병렬 처리)
-            await self.collect_contents_parallel()
-            
-            # 3. 기사 저장 (배치 처리)
-            await self.save_articles_batch()
-            
             console.print("🎉 크롤링 완료!")
             
         except KeyboardInterrupt:
@@ -844,7 +781,10 @@ class DongaPoliticsCollector:
 
 async def main():
     collector = DongaPoliticsCollector()
-    await collector.run(num_pages=15)  # 15페이지에서 각각 10개씩 총 150개 수집
+    # 단독 실행 시에도 하나의 커넥션 풀(속도 제한 포함)을 실행 내내 재사용
+    async with open_client() as client:
+        collector.http_client = client
+        await collector.run(num_pages=15)  # 15페이지에서 각각 10개씩 총 150개 수집
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -22,6 +22,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from utils.supabase_manager import SupabaseManager
+from utils.http_client import open_client
+from utils.watermark import CrawlWatermark, iter_new_articles
+from utils.pipeline import CrawlPipeline
+from utils.html_parser import make_soup
 
 console = Console()
 
@@ -33,6 +37,9 @@ class JoongangPoliticsCollector:
         self.base_url = "https://www.joongang.co.kr"
         self.articles = []
         self.supabase_manager = SupabaseManager()
+        self.http_client = None  # CrawlerManager가 주입하는 공유 HTTP 클라이언트
+        self.scheduler = None  # CrawlerManager가 주입하는 스케줄러 (DB 슬롯 관리)
+        self.watermark = CrawlWatermark(self.media_name)  # 언론사별 증분 크롤링 워터마크
         
         # HTTP 클라이언트 설정 (최적화)
         self.headers = {
@@ -44,8 +51,7 @@ class JoongangPoliticsCollector:
             "Upgrade-Insecure-Requests": "1",
         }
         
-        # 동시성 제한 설정
-        self.semaphore = asyncio.Semaphore(10)  # 최대 10개 동시 요청
+        # 배치 설정 (동시성은 공유 클라이언트의 호스트별 속도 제한기가 조절)
         self.batch_size = 20  # DB 배치 저장 크기
         
     async def _get_page_articles(self, page_num: int) -> list:
@@ -54,11 +60,11 @@ class JoongangPoliticsCollector:
             url = f"{self.base_url}/politics?page={page_num}"
             console.print(f"📡 페이지 수집: {url}")
             
-            async with httpx.AsyncClient() as client:
+            async with open_client(self.http_client) as client:
                 response = await client.get(url)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = make_soup(response.text)
                 
                 # 무시해야 하는 영역 제거
                 showcase = soup.find('section', class_='showcase_general')
@@ -190,160 +196,125 @@ class JoongangPoliticsCollector:
             console.print(f"❌ 기사 데이터 파싱 실패: {e}")
             return None
     
-    async def collect_articles_parallel(self, num_pages: int = 7):
-        """기사 수집 (병렬 처리)"""
-        console.print(f"📄 {num_pages}개 페이지에서 기사 수집 시작 (병렬 처리)...")
+    async def _run_pipeline(self, num_pages: int = 7):
+        """목록 → 본문 → 파싱 → 저장 스트리밍 파이프라인 실행"""
+        async with open_client(self.http_client, timeout=15.0) as client:
+            pipeline = CrawlPipeline(
+                self.media_name,
+                # 첫 실행은 전체 페이지를 동시에, 이후에는 워터마크에 닿을 때까지만 순서대로 수집
+                discover=iter_new_articles(
+                    lambda i: self._collect_page_articles_parallel(i + 1), num_pages, self.watermark
+                ),
+                fetch_detail=lambda article: self._fetch_detail(client, article),
+                parse_detail=self._parse_detail,
+                save_batch=self.save_articles_batch,
+                scheduler=self.scheduler,
+            )
+            self.articles = await pipeline.run()
         
-        # 모든 페이지를 동시에 처리
-        tasks = [self._collect_page_articles_parallel(page_num) for page_num in range(1, num_pages + 1)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 결과 수집
-        total_articles = 0
-        for i, result in enumerate(results, 1):
-            if isinstance(result, Exception):
-                console.print(f"❌ 페이지 {i} 처리 중 오류: {str(result)}")
-            else:
-                total_articles += result
-                
-        console.print(f"📊 총 {total_articles}개 기사 수집")
+        # 워터마크 갱신 (다음 실행은 이번에 처리한 기사까지만 순회)
+        self.watermark.advance(self.articles, failed=pipeline.failed, skipped=pipeline.skipped)
 
-    async def _collect_page_articles_parallel(self, page_num: int) -> int:
+    async def _collect_page_articles_parallel(self, page_num: int) -> List[Dict]:
         """단일 페이지에서 기사 수집 (병렬 처리용)"""
         url = f"{self.base_url}/politics?page={page_num}"
         console.print(f"📡 페이지 {page_num}: {url}")
 
-        async with self.semaphore:  # 동시성 제한
-            try:
-                async with httpx.AsyncClient(
-                    timeout=15.0,
-                    follow_redirects=True,
-                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-                ) as client:
-                    response = await client.get(url, headers=self.headers)
-                    response.raise_for_status()
+        try:
+            async with open_client(self.http_client, timeout=15.0) as client:
+                response = await client.get(url, headers=self.headers)
+                response.raise_for_status()
                     
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                soup = make_soup(response.text)
                     
-                    # 무시해야 하는 영역 제거
-                    showcase = soup.find('section', class_='showcase_general')
-                    if showcase:
-                        showcase.decompose()
+                # 무시해야 하는 영역 제거
+                showcase = soup.find('section', class_='showcase_general')
+                if showcase:
+                    showcase.decompose()
                     
-                    rank_list = soup.find('ul', class_='card_right_list rank_list')
-                    if rank_list:
-                        rank_list.decompose()
+                rank_list = soup.find('ul', class_='card_right_list rank_list')
+                if rank_list:
+                    rank_list.decompose()
                     
-                    # 수집 대상: <ul id="story_list"> 안의 <li class="card">
-                    story_list = soup.find('ul', id='story_list')
-                    if not story_list:
-                        console.print(f"❌ 페이지 {page_num}: story_list를 찾을 수 없습니다")
-                        return 0
+                # 수집 대상: <ul id="story_list"> 안의 <li class="card">
+                story_list = soup.find('ul', id='story_list')
+                if not story_list:
+                    console.print(f"❌ 페이지 {page_num}: story_list를 찾을 수 없습니다")
+                    return []
                     
-                    cards = story_list.find_all('li', class_='card')
-                    console.print(f"🔍 페이지 {page_num}: {len(cards)}개 카드 발견")
+                cards = story_list.find_all('li', class_='card')
+                console.print(f"🔍 페이지 {page_num}: {len(cards)}개 카드 발견")
                     
-                    articles = []
-                    max_articles_per_page = 24  # 각 페이지에서 24개 수집
-                    collected_count = 0
+                articles = []
+                max_articles_per_page = 24  # 각 페이지에서 24개 수집
+                collected_count = 0
                     
-                    for i, card in enumerate(cards):
-                        if collected_count >= max_articles_per_page:
-                            break
+                for i, card in enumerate(cards):
+                    if collected_count >= max_articles_per_page:
+                        break
                             
-                        try:
-                            # 제목과 URL 추출
-                            headline = card.find('h2', class_='headline')
-                            if not headline:
-                                continue
+                    try:
+                        # 제목과 URL 추출
+                        headline = card.find('h2', class_='headline')
+                        if not headline:
+                            continue
                                 
-                            link = headline.find('a')
-                            if not link:
-                                continue
+                        link = headline.find('a')
+                        if not link:
+                            continue
                             
-                            title = link.get_text(strip=True)
-                            article_url = link.get('href', '')
+                        title = link.get_text(strip=True)
+                        article_url = link.get('href', '')
                             
-                            if title and article_url:
-                                # 상대 URL을 절대 URL로 변환
-                                if article_url.startswith('/'):
-                                    full_url = urljoin(self.base_url, article_url)
-                                else:
-                                    full_url = article_url
+                        if title and article_url:
+                            # 상대 URL을 절대 URL로 변환
+                            if article_url.startswith('/'):
+                                full_url = urljoin(self.base_url, article_url)
+                            else:
+                                full_url = article_url
                                 
-                                article = {
-                                    'title': title,
-                                    'url': full_url,
-                                    'content': '',
-                                    'published_at': ''
-                                }
-                                articles.append(article)
-                                collected_count += 1
-                                console.print(f"📰 발견: {title[:50]}...")
+                            article = {
+                                'title': title,
+                                'url': full_url,
+                                'content': '',
+                                'published_at': ''
+                            }
+                            articles.append(article)
+                            collected_count += 1
+                            console.print(f"📰 발견: {title[:50]}...")
                         
-                        except Exception as e:
-                            console.print(f"⚠️ 카드 [{i}] 처리 중 오류: {e}")
-                            continue
+                    except Exception as e:
+                        console.print(f"⚠️ 카드 [{i}] 처리 중 오류: {e}")
+                        continue
                     
-                    self.articles.extend(articles)
-                    console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
-                    return len(articles)
+                console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
+                return articles
 
-            except Exception as e:
-                console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
-                return 0
+        except Exception as e:
+            console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
+            return []
     
-    async def collect_contents_parallel(self):
-        """기사 본문 수집 (병렬 처리)"""
-        console.print(f"📖 {len(self.articles)}개 기사 본문 수집 시작 (병렬 처리)...")
+    async def _fetch_detail(self, client: httpx.AsyncClient, article: dict) -> str:
+        """기사 상세 페이지 HTML 요청"""
+        response = await client.get(article["url"], headers=self.headers)
+        response.raise_for_status()
+        return response.text
+
+    def _parse_detail(self, article: dict, html: str) -> dict:
+        """상세 페이지 HTML에서 기사 본문 및 발행시간 추출"""
+        soup = make_soup(html)
         
-        # 모든 기사를 동시에 처리 (배치로 나누어서)
-        batch_size = 20  # 한 번에 처리할 기사 수
-        total_batches = (len(self.articles) + batch_size - 1) // batch_size
+        # 발행시간 추출
+        published_at = self._extract_published_at(soup)
+        article["published_at"] = published_at
         
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(self.articles))
-            batch_articles = self.articles[start_idx:end_idx]
-            
-            console.print(f"📖 배치 {batch_num + 1}/{total_batches}: {len(batch_articles)}개 기사 처리 중...")
-            
-            # 배치 내에서 병렬 처리
-            async with httpx.AsyncClient(
-                timeout=15.0,
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-            ) as client:
-                tasks = [self._extract_content_httpx(client, article, i + start_idx + 1) for i, article in enumerate(batch_articles)]
-                await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 배치 간 짧은 딜레이 (서버 부하 방지)
-            if batch_num < total_batches - 1:
-                await asyncio.sleep(0.5)
-
-    async def _extract_content_httpx(self, client: httpx.AsyncClient, article: dict, index: int):
-        """httpx로 기사 본문 및 발행시간 추출"""
-        try:
-            console.print(f"📖 [{index}] 시작: {article['title'][:40]}...")
-            
-            response = await client.get(article["url"], headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 발행시간 추출
-            published_at = self._extract_published_at(soup)
-            article["published_at"] = published_at
-            
-            # 본문 추출
-            content = self._extract_content_text(soup)
-            article["content"] = content
-            
-            console.print(f"✅ [{index}] 완료: {len(content)}자")
-            
-        except Exception as e:
-            console.print(f"❌ [{index}] 실패: {str(e)[:50]}...")
-            article["content"] = ""
-            article["published_at"] = datetime.now(pytz.UTC).isoformat()
+        # 본문 추출
+        content = self._extract_content_text(soup)
+        article["content"] = content
+        
+        console.print(f"✅ 완료: {len(content)}자 - {article['title'][:30]}...")
+        
+        return article
 
     def _extract_published_at(self, soup: BeautifulSoup) -> str:
         """발행시간 추출"""
@@ -508,13 +479,14 @@ class JoongangPoliticsCollector:
             console.print(f"⚠️ 날짜 파싱 실패: {clean_time} - {str(e)}")
             return datetime.now(pytz.UTC).isoformat()
     
-    async def save_articles_batch(self):
-        """DB 배치 저장 (최적화)"""
-        if not self.articles:
+    def save_articles_batch(self, articles: List[Dict]) -> List[str]:
+        """DB 배치 저장 (최적화) - 입력 순서와 같은 기사별 저장 결과 반환 (inserted/duplicate/skipped/failed)"""
+        if not articles:
             console.print("⚠️ 저장할 기사가 없습니다.")
-            return
+            return []
             
-        console.print(f"💾 Supabase에 {len(self.articles)}개 기사 배치 저장 중...")
+        console.print(f"💾 Supabase에 {len(articles)}개 기사 배치 저장 중...")
+        statuses = ["failed"] * len(articles)
 
         try:
             # 언론사 확인
@@ -528,27 +500,17 @@ class JoongangPoliticsCollector:
             else:
                 media_id = media["id"]
 
-            # 기존 URL 가져오기 (중복 체크)
-            existing_urls = set()
-            try:
-                result = self.supabase_manager.client.table("articles").select("url").eq("media_id", media_id).execute()
-                existing_urls = {article["url"] for article in result.data}
-            except Exception as e:
-                console.print(f"⚠️ 기존 URL 조회 실패: {str(e)}")
-
-            # 중복 제거 및 배치 준비
+            # 배치 준비 (이미 저장된 기사는 upsert 결과에서 중복으로 확인)
             new_articles = []
+            new_indices = []
             skip_count = 0
             short_content_count = 0
             
-            for article in self.articles:
-                if article["url"] in existing_urls:
-                    skip_count += 1
-                    continue
-                
+            for i, article in enumerate(articles):
                 # 본문 길이 체크 (20자 미만 제외)
                 content = article.get('content', '')
                 if len(content.strip()) < 20:
+                    statuses[i] = "skipped"
                     short_content_count += 1
                     continue
                     
@@ -556,10 +518,15 @@ class JoongangPoliticsCollector:
                 parsed_article = self._parse_article_data_simple(article, media_id)
                 if parsed_article:
                     new_articles.append(parsed_article)
+                    new_indices.append(i)
 
             # 배치 저장
             if new_articles:
-                success_count = self._batch_insert_articles(new_articles)
+                results = self._batch_insert_articles(new_articles)
+                for i, status in zip(new_indices, results):
+                    statuses[i] = status
+                success_count = results.count("inserted")
+                skip_count = results.count("duplicate")
                 console.print(f"✅ 배치 저장 완료: {success_count}개 성공")
             else:
                 console.print("⚠️ 저장할 새 기사가 없습니다.")
@@ -568,6 +535,7 @@ class JoongangPoliticsCollector:
             
         except Exception as e:
             console.print(f"❌ DB 저장 중 치명적 오류: {str(e)}")
+        return statuses
 
     def _parse_article_data_simple(self, article: dict, media_id: str) -> Optional[dict]:
         """기사 데이터 간단 파싱 (배치 저장용)"""
@@ -584,42 +552,22 @@ class JoongangPoliticsCollector:
             console.print(f"❌ 기사 데이터 파싱 실패: {e}")
             return None
 
-    def _batch_insert_articles(self, articles: List[Dict]) -> int:
-        """배치로 기사 삽입"""
-        try:
-            # Supabase의 upsert 기능 사용
-            result = self.supabase_manager.client.table("articles").upsert(articles).execute()
-            return len(result.data) if result.data else 0
-        except Exception as e:
-            console.print(f"❌ 배치 저장 실패: {str(e)}")
-            # 개별 저장으로 폴백
-            success_count = 0
-            for article in articles:
-                try:
-                    if self.supabase_manager.insert_article(article):
-                        success_count += 1
-                except:
-                    continue
-            return success_count
+    def _batch_insert_articles(self, articles: List[Dict]) -> List[str]:
+        """배치로 기사 삽입 (청크 단위 일괄 upsert, 기사별 결과 반환)"""
+        return self.supabase_manager.insert_articles_bulk(articles)
     
     async def run(self, num_pages: int = 7):
         """크롤러 실행 (최적화 버전)"""
         try:
             console.print("🚀 중앙일보 정치 기사 크롤링 시작 (최적화 버전)")
             
-            # 1. 기사 목록 수집 (병렬 처리)
-            await self.collect_articles_parallel(num_pages)
+            # 목록 → 본문 → 파싱 → 저장을 스트리밍으로 처리 (배치 저장 시 DB 슬롯 점유)
+            await self._run_pipeline(num_pages)
             
             if not self.articles:
                 console.print("❌ 수집된 기사가 없습니다")
                 return
             
-            # 2. 기사 본문 수집 (병렬 처리)
-            await self.collect_contents_parallel()
-            
-            # 3. 기사 저장 (배치 처리)
-            await self.save_articles_batch()
-            
             console.print("🎉 크롤링 완료!")
             
         except KeyboardInterrupt:
@@ -629,7 +577,10 @@ class JoongangPoliticsCollector:
 
 async def main():
     collector = JoongangPoliticsCollector()
-    await collector.run(num_pages=7)  # 7페이지에서 각각 24개씩 총 168개 기사 수집 (150개 목표)
+    # 단독 실행 시에도 하나의 커넥션 풀(속도 제한 포함)을 실행 내내 재사용
+    async with open_client() as client:
+        collector.http_client = client
+        await collector.run(num_pages=7)  # 7페이지에서 각각 24개씩 총 168개 기사 수집 (150개 목표)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -23,6 +23,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 # 내부 모듈
 from utils.supabase_manager import SupabaseManager
+from utils.http_client import open_client
+from utils.watermark import CrawlWatermark, iter_new_articles
+from utils.pipeline import CrawlPipeline
+from utils.html_parser import make_soup
+from utils.extraction import get_extractor
 
 console = Console()
 KST = pytz.timezone("Asia/Seoul")
@@ -34,6 +39,9 @@ class KhanPoliticsCollector:
         self.media_name = "경향신문"
         self.media_bias = "center-left"
         self.supabase_manager = SupabaseManager()
+        self.http_client = None  # CrawlerManager가 주입하는 공유 HTTP 클라이언트
+        self.scheduler = None  # CrawlerManager가 주입하는 스케줄러 (DB 슬롯 관리)
+        self.watermark = CrawlWatermark(self.media_name)  # 언론사별 증분 크롤링 워터마크
         self.articles: List[Dict] = []
         
         # HTTP 클라이언트 설정
@@ -46,8 +54,6 @@ class KhanPoliticsCollector:
             "Upgrade-Insecure-Requests": "1",
         }
         
-        # 동시성 제한 설정
-        self.semaphore = asyncio.Semaphore(10)
     def _get_page_urls(self, num_pages: int = 15) -> List[str]:
         """페이지 URL 목록 생성"""
         urls = []
@@ -60,92 +66,87 @@ class KhanPoliticsCollector:
         """특정 페이지에서 기사 목록 수집"""
         console.print(f"📡 페이지 {page_num}: HTML 파싱 중...")
 
-        async with self.semaphore:
-            try:
-                async with httpx.AsyncClient(
-                    timeout=15.0,
-                    follow_redirects=True,
-                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-                ) as client:
-                    response = await client.get(page_url, headers=self.headers)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, "html.parser")
+        try:
+            async with open_client(self.http_client, timeout=15.0) as client:
+                response = await client.get(page_url, headers=self.headers)
+                response.raise_for_status()
+                soup = make_soup(response.text)
                     
-                    articles = []
+                articles = []
                     
-                    # 기사 목록 추출 (ul#recentList li article)
-                    recent_list = soup.find('ul', id='recentList')
-                    if not recent_list:
-                        console.print(f"❌ 페이지 {page_num}: recentList를 찾을 수 없습니다")
-                        return []
+                # 기사 목록 추출 (ul#recentList li article)
+                recent_list = soup.find('ul', id='recentList')
+                if not recent_list:
+                    console.print(f"❌ 페이지 {page_num}: recentList를 찾을 수 없습니다")
+                    return []
                     
-                    article_items = recent_list.find_all('li')
+                article_items = recent_list.find_all('li')
                     
-                    for li in article_items:
-                        article_element = li.find('article')
-                        if not article_element:
-                            continue
+                for li in article_items:
+                    article_element = li.find('article')
+                    if not article_element:
+                        continue
                             
-                        try:
-                            # 제목과 URL 추출 (div > a)
-                            link = article_element.find('a', href=True)
-                            if not link:
-                                continue
+                    try:
+                        # 제목과 URL 추출 (div > a)
+                        link = article_element.find('a', href=True)
+                        if not link:
+                            continue
                                 
-                            href = link.get('href')
-                            if not href:
-                                continue
+                        href = link.get('href')
+                        if not href:
+                            continue
                             
-                            # 상대 URL을 절대 URL로 변환
-                            if href.startswith('http'):
-                                full_url = href
-                            else:
-                                full_url = urljoin(self.base_url, href)
+                        # 상대 URL을 절대 URL로 변환
+                        if href.startswith('http'):
+                            full_url = href
+                        else:
+                            full_url = urljoin(self.base_url, href)
                             
-                            title = link.get_text(strip=True)
+                        title = link.get_text(strip=True)
                             
-                            # 요약 추출 (p.desc)
-                            desc_element = article_element.find('p', class_='desc')
-                            description = desc_element.get_text(strip=True) if desc_element else ""
+                        # 요약 추출 (p.desc)
+                        desc_element = article_element.find('p', class_='desc')
+                        description = desc_element.get_text(strip=True) if desc_element else ""
                             
-                            # 날짜 추출 (p.date)
-                            date_element = article_element.find('p', class_='date')
-                            date_text = date_element.get_text(strip=True) if date_element else ""
-                            published_at = self._parse_relative_time(date_text)
+                        # 날짜 추출 (p.date)
+                        date_element = article_element.find('p', class_='date')
+                        date_text = date_element.get_text(strip=True) if date_element else ""
+                        published_at = self._parse_relative_time(date_text)
                             
-                            # 이미지 정보 추출 (선택적)
-                            img_element = article_element.find('img')
-                            image_url = ""
-                            image_alt = ""
-                            if img_element:
-                                image_url = img_element.get('src', '')
-                                image_alt = img_element.get('alt', '')
-                                if image_url and not image_url.startswith('http'):
-                                    image_url = urljoin(self.base_url, image_url)
+                        # 이미지 정보 추출 (선택적)
+                        img_element = article_element.find('img')
+                        image_url = ""
+                        image_alt = ""
+                        if img_element:
+                            image_url = img_element.get('src', '')
+                            image_alt = img_element.get('alt', '')
+                            if image_url and not image_url.startswith('http'):
+                                image_url = urljoin(self.base_url, image_url)
                             
-                            if title and len(title) > 10:
-                                article = {
-                                    'title': title,
-                                    'url': full_url,
-                                    'content': '',
-                                    'published_at': published_at,
-                                    'description': description,
-                                    'image_url': image_url,
-                                    'image_alt': image_alt
-                                }
-                                articles.append(article)
-                                console.print(f"📰 발견: {title[:50]}...")
+                        if title and len(title) > 10:
+                            article = {
+                                'title': title,
+                                'url': full_url,
+                                'content': '',
+                                'published_at': published_at,
+                                'description': description,
+                                'image_url': image_url,
+                                'image_alt': image_alt
+                            }
+                            articles.append(article)
+                            console.print(f"📰 발견: {title[:50]}...")
                         
-                        except Exception as e:
-                            console.print(f"⚠️ 기사 아이템 처리 중 오류: {str(e)}")
-                            continue
+                    except Exception as e:
+                        console.print(f"⚠️ 기사 아이템 처리 중 오류: {str(e)}")
+                        continue
                     
-                    console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
-                    return articles
+                console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
+                return articles
                     
-            except Exception as e:
-                console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
-                return []
+        except Exception as e:
+            console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
+            return []
 
     def _parse_relative_time(self, time_text: str) -> str:
         """상대 시간 텍스트를 UTC ISO 형식으로 변환"""
@@ -182,116 +183,56 @@ class KhanPoliticsCollector:
             console.print(f"⚠️ 시간 파싱 실패: {time_text} - {str(e)}")
             return datetime.now(pytz.UTC).isoformat()
 
-    async def collect_articles_parallel(self, num_pages: int = 15):
-        """기사 수집 (병렬 처리)"""
-        console.print(f"📄 {num_pages}개 페이지에서 기사 수집 시작 (병렬 처리)...")
-        
+    async def _run_pipeline(self, num_pages: int = 15):
+        """목록 → 본문 → 파싱 → 저장 스트리밍 파이프라인 실행"""
         page_urls = self._get_page_urls(num_pages)
         
-        # 모든 페이지를 동시에 처리
-        tasks = [self._get_page_articles(url, i + 1) for i, url in enumerate(page_urls)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async with open_client(self.http_client, timeout=15.0) as client:
+            pipeline = CrawlPipeline(
+                self.media_name,
+                # 첫 실행은 전체 페이지를 동시에, 이후에는 워터마크에 닿을 때까지만 순서대로 수집
+                discover=iter_new_articles(
+                    lambda i: self._get_page_articles(page_urls[i], i + 1), len(page_urls), self.watermark
+                ),
+                fetch_detail=lambda article: self._fetch_detail(client, article),
+                parse_detail=self._parse_detail,
+                save_batch=self.save_articles_batch,
+                scheduler=self.scheduler,
+            )
+            self.articles = await pipeline.run()
         
-        # 결과 수집
-        total_articles = 0
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                console.print(f"❌ 페이지 {i + 1} 처리 중 오류: {str(result)}")
-            else:
-                self.articles.extend(result)
-                total_articles += len(result)
-                
-        console.print(f"📊 총 {total_articles}개 기사 수집")
+        # 워터마크 갱신 (다음 실행은 이번에 처리한 기사까지만 순회)
+        self.watermark.advance(self.articles, failed=pipeline.failed, skipped=pipeline.skipped)
 
-    async def collect_contents_parallel(self):
-        """기사 본문 수집 (병렬 처리)"""
-        if not self.articles:
-            return
-            
-        console.print(f"📖 {len(self.articles)}개 기사 본문 수집 시작 (병렬 처리)...")
+    async def _fetch_detail(self, client: httpx.AsyncClient, article: dict) -> str:
+        """기사 상세 페이지 HTML 요청"""
+        response = await client.get(article["url"], headers=self.headers)
+        response.raise_for_status()
+        return response.text
+
+    def _parse_detail(self, article: dict, html: str) -> dict:
+        """상세 페이지 HTML에서 기사 본문 및 발행시간 추출"""
+        soup = make_soup(html)
         
-        # 모든 기사를 동시에 처리 (배치로 나누어서)
-        batch_size = 20
-        total_batches = (len(self.articles) + batch_size - 1) // batch_size
+        # 발행시간 추출 (더 정확한 시간이 있으면 업데이트)
+        published_at = self._extract_published_at(soup)
+        if published_at:
+            article["published_at"] = published_at
         
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(self.articles))
-            batch_articles = self.articles[start_idx:end_idx]
-            
-            console.print(f"📖 배치 {batch_num + 1}/{total_batches}: {len(batch_articles)}개 기사 처리 중...")
-            
-            # 배치 내에서 병렬 처리
-            async with httpx.AsyncClient(
-                timeout=15.0,
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-            ) as client:
-                tasks = [self._extract_content_httpx(client, article, i + start_idx + 1) for i, article in enumerate(batch_articles)]
-                await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 배치 간 짧은 딜레이
-            if batch_num < total_batches - 1:
-                await asyncio.sleep(0.5)
-
-    async def _extract_content_httpx(self, client: httpx.AsyncClient, article: dict, index: int):
-        """httpx로 기사 본문 및 발행시간 추출"""
-        try:
-            console.print(f"📖 [{index}] 시작: {article['title'][:40]}...")
-            
-            response = await client.get(article["url"], headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 발행시간 추출 (더 정확한 시간이 있으면 업데이트)
-            published_at = self._extract_published_at(soup)
-            if published_at:
-                article["published_at"] = published_at
-            
-            # 본문 추출
-            content = self._extract_content_text(soup)
-            article["content"] = content
-            
-            console.print(f"✅ [{index}] 완료: {len(content)}자")
-                
-        except Exception as e:
-            console.print(f"❌ [{index}] 실패: {str(e)[:50]}...")
-            article["content"] = ""
-            if not article.get("published_at"):
-                article["published_at"] = datetime.now(pytz.UTC).isoformat()
+        # 본문 추출
+        content = self._extract_content_text(soup)
+        article["content"] = content
+        
+        console.print(f"✅ 완료: {len(content)}자 - {article['title'][:30]}...")
+        
+        return article
 
     def _extract_published_at(self, soup: BeautifulSoup) -> str:
-        """발행시간 추출"""
+        """발행시간 추출 (config/extraction_specs.py의 후보 순서대로)"""
         try:
-            # 1. time 태그에서 추출
-            time_element = soup.find('time', datetime=True)
-            if time_element:
-                return self._parse_datetime(time_element.get('datetime', ''))
-            
-            # 2. meta 태그에서 추출
-            meta_date = soup.find('meta', property='article:published_time')
-            if meta_date:
-                return self._parse_datetime(meta_date.get('content', ''))
-            
-            # 3. 기사 날짜 영역에서 추출
-            date_selectors = [
-                            'a[title*="기사 입력/수정일"]',
-                            '.article-date',
-                            '.date',
-                '.publish_date'
-            ]
-            
-            for selector in date_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    # 입력/수정 시간 구분하여 추출
-                    paragraphs = element.find_all('p')
-                    for p in paragraphs:
-                        text = p.get_text(strip=True)
-                        if '입력' in text:
-                            time_text = text.replace('입력', '').strip()
-                            if time_text:
-                                return self._parse_datetime(time_text)
+            published_at = get_extractor("khan_politics").extract_published_at(soup)
+            if published_at:
+                return self._parse_datetime(published_at)
             
             return datetime.now(pytz.UTC).isoformat()
             
@@ -300,64 +241,16 @@ class KhanPoliticsCollector:
             return datetime.now(pytz.UTC).isoformat()
 
     def _extract_content_text(self, soup: BeautifulSoup) -> str:
-        """경향신문 본문 텍스트 추출 (p.content_text만 추출)"""
+        """경향신문 본문 텍스트 추출 (config/extraction_specs.py 명세)"""
         try:
-            # #articleBody 찾기
-            article_body = soup.find('div', id='articleBody')
-            if not article_body:
+            result = get_extractor("khan_politics").extract(soup)
+            if result is None:
                 console.print("⚠️ #articleBody를 찾을 수 없습니다")
                 return ""
             
-            # 제외할 요소들 완전 제거
-            exclude_selectors = [
-                'div.editor-subtitle',  # 부제목
-                'div.art_photo',  # 사진 영역
-                'p.caption',  # 사진 설명
-                'div[class*="banner-article"]',  # 광고 배너 (banner-article-left, banner-article-right 등)
-                'div.srch-kw',  # 관련 키워드
-                'div[class*="banner"]', 'div[class*="ad"]', 'div[class*="advertisement"]',
-                'script', 'style', 'noscript', 'iframe'
-            ]
-            
-            for selector in exclude_selectors:
-                elements = article_body.select(selector)
-                for el in elements:
-                    el.decompose()
-            
-            # p.content_text 태그만 선택적으로 추출
-            paragraphs = []
-            content_paragraphs = article_body.select('p.content_text')
-            
-            for p in content_paragraphs:
-                text = p.get_text(strip=True)
-                
-                # HTML 엔티티 처리 및 정규화
-                text = re.sub(r'&nbsp;', ' ', text)  # &nbsp; 제거
-                text = re.sub(r'\s+', ' ', text)  # 연속 공백 정규화
-                text = text.strip()
-                
-                # 필터링: 기자명, 이메일, 출처 제거
-                if (text and 
-                    len(text) > 10 and  # 10자 이상
-                    not re.search(r'[가-힣]+\s*기자', text) and  # 기자명 제외
-                    not re.search(r'[가-힣]+\s*특파원', text) and  # 특파원 제외
-                    not re.search(r'[가-힣]+\s*통신원', text) and  # 통신원 제외
-                    '@' not in text and  # 이메일 제외
-                    '[출처:' not in text and  # 출처 제외
-                    '[경향신문]' not in text):  # 출처 제외
-                    paragraphs.append(text)
-            
-            if not paragraphs:
+            if not result["text"]:
                 console.print("⚠️ 추출할 본문이 없습니다")
-                return ""
-            
-            # 문단들을 줄바꿈으로 연결
-            combined_text = '\n\n'.join(paragraphs)
-            
-            # 최종 정규화
-            combined_text = re.sub(r'\n\s*\n', '\n\n', combined_text)  # 연속 줄바꿈 정규화
-            
-            return combined_text.strip()
+            return result["text"]
             
         except Exception as e:
             console.print(f"⚠️ 본문 추출 실패: {str(e)}")
@@ -390,13 +283,14 @@ class KhanPoliticsCollector:
             console.print(f"⚠️ 날짜 파싱 실패: {clean_time} - {str(e)}")
             return datetime.now(pytz.UTC).isoformat()
 
-    async def save_articles_batch(self):
-        """DB 배치 저장"""
-        if not self.articles:
+    def save_articles_batch(self, articles: List[Dict]) -> List[str]:
+        """DB 배치 저장 - 입력 순서와 같은 기사별 저장 결과 반환 (inserted/duplicate/skipped/failed)"""
+        if not articles:
             console.print("⚠️ 저장할 기사가 없습니다.")
-            return
+            return []
             
-        console.print(f"💾 Supabase에 {len(self.articles)}개 기사 배치 저장 중...")
+        console.print(f"💾 Supabase에 {len(articles)}개 기사 배치 저장 중...")
+        statuses = ["failed"] * len(articles)
 
         try:
             # 언론사 확인
@@ -406,27 +300,17 @@ class KhanPoliticsCollector:
             else:
                 media_id = media["id"]
 
-            # 기존 URL 가져오기 (중복 체크)
-            existing_urls = set()
-            try:
-                result = self.supabase_manager.client.table("articles").select("url").eq("media_id", media_id).execute()
-                existing_urls = {article["url"] for article in result.data}
-            except Exception as e:
-                console.print(f"⚠️ 기존 URL 조회 실패: {str(e)}")
-
-            # 중복 제거 및 배치 준비
+            # 배치 준비 (이미 저장된 기사는 upsert 결과에서 중복으로 확인)
             new_articles = []
+            new_indices = []
             skip_count = 0
             short_content_count = 0
             
-            for article in self.articles:
-                if article["url"] in existing_urls:
-                    skip_count += 1
-                    continue
-                
+            for i, article in enumerate(articles):
                 # 본문 길이 체크 (20자 미만 제외)
                 content = article.get('content', '')
                 if len(content.strip()) < 20:
+                    statuses[i] = "skipped"
                     short_content_count += 1
                     continue
                     
@@ -434,10 +318,15 @@ class KhanPoliticsCollector:
                 parsed_article = self._parse_article_data_simple(article, media_id)
                 if parsed_article:
                     new_articles.append(parsed_article)
+                    new_indices.append(i)
 
             # 배치 저장
             if new_articles:
-                success_count = self._batch_insert_articles(new_articles)
+                results = self._batch_insert_articles(new_articles)
+                for i, status in zip(new_indices, results):
+                    statuses[i] = status
+                success_count = results.count("inserted")
+                skip_count = results.count("duplicate")
                 console.print(f"✅ 배치 저장 완료: {success_count}개 성공")
             else:
                 console.print("⚠️ 저장할 새 기사가 없습니다.")
@@ -446,6 +335,7 @@ class KhanPoliticsCollector:
             
         except Exception as e:
             console.print(f"❌ DB 저장 중 치명적 오류: {str(e)}")
+        return statuses
 
     def _parse_article_data_simple(self, article: dict, media_id: str) -> Optional[dict]:
         """기사 데이터 간단 파싱 (배치 저장용)"""
@@ -462,42 +352,22 @@ class KhanPoliticsCollector:
             console.print(f"❌ 기사 데이터 파싱 실패: {e}")
             return None
 
-    def _batch_insert_articles(self, articles: List[Dict]) -> int:
-        """배치로 기사 삽입"""
-        try:
-            # Supabase의 upsert 기능 사용
-            result = self.supabase_manager.client.table("articles").upsert(articles).execute()
-            return len(result.data) if result.data else 0
-        except Exception as e:
-            console.print(f"❌ 배치 저장 실패: {str(e)}")
-            # 개별 저장으로 폴백
-            success_count = 0
-            for article in articles:
-                try:
-                    if self.supabase_manager.insert_article(article):
-                        success_count += 1
-                except:
-                    continue
-            return success_count
+    def _batch_insert_articles(self, articles: List[Dict]) -> List[str]:
+        """배치로 기사 삽입 (청크 단위 일괄 upsert, 기사별 결과 반환)"""
+        return self.supabase_manager.insert_articles_bulk(articles)
         
     async def run(self, num_pages: int = 15):
         """실행"""
         try:
             console.print(f"🚀 경향신문 정치 기사 크롤링 시작 (최대 {num_pages}페이지)")
             
-            # 1. 기사 목록 수집 (병렬 처리)
-            await self.collect_articles_parallel(num_pages)
+            # 목록 → 본문 → 파싱 → 저장을 스트리밍으로 처리 (배치 저장 시 DB 슬롯 점유)
+            await self._run_pipeline(num_pages)
             
             if not self.articles:
                 console.print("❌ 수집된 기사가 없습니다")
                 return
             
-            # 2. 기사 본문 수집 (병렬 처리)
-            await self.collect_contents_parallel()
-            
-            # 3. 기사 저장 (배치 처리)
-            await self.save_articles_batch()
-            
             console.print("🎉 크롤링 완료!")
             
         except KeyboardInterrupt:
@@ -507,7 +377,10 @@ class KhanPoliticsCollector:
 
 async def main():
     collector = KhanPoliticsCollector()
-    await collector.run(num_pages=15)  # 15페이지에서 각각 10개씩 총 150개 기사 수집
+    # 단독 실행 시에도 하나의 커넥션 풀(속도 제한 포함)을 실행 내내 재사용
+    async with open_client() as client:
+        collector.http_client = client
+        await collector.run(num_pages=15)  # 15페이지에서 각각 10개씩 총 150개 기사 수집
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -22,6 +22,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 # 내부 모듈
 from utils.supabase_manager import SupabaseManager
+from utils.http_client import open_client
+from utils.watermark import CrawlWatermark, iter_new_articles
+from utils.pipeline import CrawlPipeline
+from utils.html_parser import make_soup
+from utils.extraction import get_extractor
 
 console = Console()
 KST = pytz.timezone("Asia/Seoul")
@@ -33,6 +38,9 @@ class PressianPoliticsCollector:
         self.media_name = "프레시안"
         self.media_bias = "left"  # 진보 성향
         self.supabase_manager = SupabaseManager()
+        self.http_client = None  # CrawlerManager가 주입하는 공유 HTTP 클라이언트
+        self.scheduler = None  # CrawlerManager가 주입하는 스케줄러 (DB 슬롯 관리)
+        self.watermark = CrawlWatermark(self.media_name)  # 언론사별 증분 크롤링 워터마크
         self.articles: List[Dict] = []
         
         # HTTP 클라이언트 설정
@@ -44,9 +52,6 @@ class PressianPoliticsCollector:
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
         }
-        
-        # 동시성 제한 설정
-        self.semaphore = asyncio.Semaphore(10)
 
     def _get_page_urls(self, num_pages: int = 8) -> List[str]:
         """페이지 URL 목록 생성 (page=1, 2, 3...)"""
@@ -60,102 +65,97 @@ class PressianPoliticsCollector:
         """특정 페이지에서 기사 목록 수집"""
         console.print(f"📡 페이지 {page_num}: HTML 파싱 중...")
 
-        async with self.semaphore:
-            try:
-                async with httpx.AsyncClient(
-                    timeout=15.0,
-                    follow_redirects=True,
-                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-                ) as client:
-                    response = await client.get(page_url, headers=self.headers)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, "html.parser")
+        try:
+            async with open_client(self.http_client, timeout=15.0) as client:
+                response = await client.get(page_url, headers=self.headers)
+                response.raise_for_status()
+                soup = make_soup(response.text)
                     
-                    articles = []
+                articles = []
                     
-                    # 기사 목록 추출 (.arl_022 ul.list > li)
-                    list_items = soup.select('.arl_022 ul.list > li')
+                # 기사 목록 추출 (.arl_022 ul.list > li)
+                list_items = soup.select('.arl_022 ul.list > li')
                     
-                    for li in list_items:
-                        try:
-                            # 제목과 URL 추출 (p.title a[href])
-                            title_link = li.select_one('p.title a[href]')
-                            if not title_link:
-                                continue
+                for li in list_items:
+                    try:
+                        # 제목과 URL 추출 (p.title a[href])
+                        title_link = li.select_one('p.title a[href]')
+                        if not title_link:
+                            continue
                                 
-                            href = title_link.get('href')
-                            if not href:
-                                continue
+                        href = title_link.get('href')
+                        if not href:
+                            continue
                             
-                            # 상대 URL을 절대 URL로 변환
-                            if href.startswith('http'):
-                                full_url = href
-                            else:
-                                full_url = urljoin(self.base_url, href)
+                        # 상대 URL을 절대 URL로 변환
+                        if href.startswith('http'):
+                            full_url = href
+                        else:
+                            full_url = urljoin(self.base_url, href)
                             
-                            title = title_link.get_text(strip=True)
+                        title = title_link.get_text(strip=True)
                             
-                            # article_id 추출 (/pages/articles/<digits>에서 숫자만)
-                            article_id_match = re.search(r'/pages/articles/(\d+)', href)
-                            article_id = article_id_match.group(1) if article_id_match else None
+                        # article_id 추출 (/pages/articles/<digits>에서 숫자만)
+                        article_id_match = re.search(r'/pages/articles/(\d+)', href)
+                        article_id = article_id_match.group(1) if article_id_match else None
                             
-                            # subtitle 추출 (p.sub_title a)
-                            subtitle = ""
-                            subtitle_element = li.select_one('p.sub_title a')
-                            if subtitle_element:
-                                subtitle = subtitle_element.get_text(strip=True)
+                        # subtitle 추출 (p.sub_title a)
+                        subtitle = ""
+                        subtitle_element = li.select_one('p.sub_title a')
+                        if subtitle_element:
+                            subtitle = subtitle_element.get_text(strip=True)
                             
-                            # excerpt 추출 (p.body a)
-                            excerpt = ""
-                            excerpt_element = li.select_one('p.body a')
-                            if excerpt_element:
-                                excerpt = excerpt_element.get_text(strip=True)
+                        # excerpt 추출 (p.body a)
+                        excerpt = ""
+                        excerpt_element = li.select_one('p.body a')
+                        if excerpt_element:
+                            excerpt = excerpt_element.get_text(strip=True)
                             
-                            # 썸네일 추출 (.thumb .arl_img style의 background-image)
-                            image_url = self._extract_thumbnail_url(li)
+                        # 썸네일 추출 (.thumb .arl_img style의 background-image)
+                        image_url = self._extract_thumbnail_url(li)
                             
-                            # 바이라인 추출 (.byline .name과 .byline .date)
-                            author, published_at_kst, published_date = self._extract_byline(li)
+                        # 바이라인 추출 (.byline .name과 .byline .date)
+                        author, published_at_kst, published_date = self._extract_byline(li)
                             
-                            # published_at_utc 계산
-                            published_at_utc = ""
-                            if published_at_kst:
-                                try:
-                                    kst_dt = datetime.fromisoformat(published_at_kst.replace('+09:00', ''))
-                                    kst_dt = KST.localize(kst_dt)
-                                    utc_dt = kst_dt.astimezone(pytz.UTC)
-                                    published_at_utc = utc_dt.isoformat()
-                                except:
-                                    published_at_utc = datetime.now(pytz.UTC).isoformat()
+                        # published_at_utc 계산
+                        published_at_utc = ""
+                        if published_at_kst:
+                            try:
+                                kst_dt = datetime.fromisoformat(published_at_kst.replace('+09:00', ''))
+                                kst_dt = KST.localize(kst_dt)
+                                utc_dt = kst_dt.astimezone(pytz.UTC)
+                                published_at_utc = utc_dt.isoformat()
+                            except:
+                                published_at_utc = datetime.now(pytz.UTC).isoformat()
                             
-                            if title and len(title) > 10:
-                                article = {
-                                    'source': 'pressian',
-                                    'article_id': article_id,
-                                    'title': title,
-                                    'url': full_url,
-                                    'content': '',
-                                    'subtitle': subtitle,
-                                    'excerpt': excerpt,
-                                    'author': author,
-                                    'published_date': published_date,
-                                    'published_at': published_at_utc,
-                                    'image_url': image_url,
-                                    'image_alt': None
-                                }
-                                articles.append(article)
-                                console.print(f"📰 발견: {title[:50]}...")
+                        if title and len(title) > 10:
+                            article = {
+                                'source': 'pressian',
+                                'article_id': article_id,
+                                'title': title,
+                                'url': full_url,
+                                'content': '',
+                                'subtitle': subtitle,
+                                'excerpt': excerpt,
+                                'author': author,
+                                'published_date': published_date,
+                                'published_at': published_at_utc,
+                                'image_url': image_url,
+                                'image_alt': None
+                            }
+                            articles.append(article)
+                            console.print(f"📰 발견: {title[:50]}...")
                         
-                        except Exception as e:
-                            console.print(f"⚠️ 기사 카드 처리 중 오류: {str(e)}")
-                            continue
+                    except Exception as e:
+                        console.print(f"⚠️ 기사 카드 처리 중 오류: {str(e)}")
+                        continue
                     
-                    console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
-                    return articles
+                console.print(f"📄 페이지 {page_num}: {len(articles)}개 기사 수집")
+                return articles
                     
-            except Exception as e:
-                console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
-                return []
+        except Exception as e:
+            console.print(f"❌ 페이지 {page_num} 처리 중 오류: {str(e)}")
+            return []
 
     def _extract_thumbnail_url(self, li) -> Optional[str]:
         """썸네일 URL 추출 (.thumb .arl_img style의 background-image)"""
@@ -218,136 +218,63 @@ class PressianPoliticsCollector:
             console.print(f"⚠️ 바이라인 추출 실패: {str(e)}")
             return "", "", ""
 
-    async def collect_articles_parallel(self, num_pages: int = 8):
-        """기사 수집 (병렬 처리)"""
-        console.print(f"📄 {num_pages}개 페이지에서 기사 수집 시작 (병렬 처리)...")
-        
+    async def _run_pipeline(self, num_pages: int = 8):
+        """목록 → 본문 → 파싱 → 저장 스트리밍 파이프라인 실행"""
         page_urls = self._get_page_urls(num_pages)
         
-        # 모든 페이지를 동시에 처리
-        tasks = [self._get_page_articles(url, i + 1) for i, url in enumerate(page_urls)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async with open_client(self.http_client, timeout=15.0) as client:
+            pipeline = CrawlPipeline(
+                self.media_name,
+                # 첫 실행은 전체 페이지를 동시에, 이후에는 워터마크에 닿을 때까지만 순서대로 수집
+                discover=iter_new_articles(
+                    lambda i: self._get_page_articles(page_urls[i], i + 1), len(page_urls), self.watermark
+                ),
+                fetch_detail=lambda article: self._fetch_detail(client, article),
+                parse_detail=self._parse_detail,
+                save_batch=self.save_articles_batch,
+                scheduler=self.scheduler,
+            )
+            self.articles = await pipeline.run()
         
-        # 결과 수집
-        total_articles = 0
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                console.print(f"❌ 페이지 {i + 1} 처리 중 오류: {str(result)}")
-            else:
-                self.articles.extend(result)
-                total_articles += len(result)
-                
-        console.print(f"📊 총 {total_articles}개 기사 수집")
+        # 워터마크 갱신 (다음 실행은 이번에 처리한 기사까지만 순회)
+        self.watermark.advance(self.articles, failed=pipeline.failed, skipped=pipeline.skipped)
 
-    async def collect_contents_parallel(self):
-        """기사 본문 수집 (병렬 처리)"""
-        if not self.articles:
-            return
-            
-        console.print(f"📖 {len(self.articles)}개 기사 본문 수집 시작 (병렬 처리)...")
+    async def _fetch_detail(self, client: httpx.AsyncClient, article: dict) -> str:
+        """기사 상세 페이지 HTML 요청"""
+        response = await client.get(article["url"], headers=self.headers)
+        response.raise_for_status()
+        return response.text
+
+    def _parse_detail(self, article: dict, html: str) -> dict:
+        """상세 페이지 HTML에서 기사 본문 추출"""
+        soup = make_soup(html)
         
-        # 모든 기사를 동시에 처리 (배치로 나누어서)
-        batch_size = 20
-        total_batches = (len(self.articles) + batch_size - 1) // batch_size
+        # 본문 추출
+        content_data = self._extract_content_text(soup)
+        article["content"] = content_data.get("text", "")
         
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(self.articles))
-            batch_articles = self.articles[start_idx:end_idx]
-            
-            console.print(f"📖 배치 {batch_num + 1}/{total_batches}: {len(batch_articles)}개 기사 처리 중...")
-            
-            # 배치 내에서 병렬 처리
-            async with httpx.AsyncClient(
-                timeout=15.0,
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
-            ) as client:
-                tasks = [self._extract_content_httpx(client, article, i + start_idx + 1) for i, article in enumerate(batch_articles)]
-                await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 배치 간 짧은 딜레이
-            if batch_num < total_batches - 1:
-                await asyncio.sleep(0.5)
-
-    async def _extract_content_httpx(self, client: httpx.AsyncClient, article: dict, index: int):
-        """httpx로 기사 본문 추출"""
-        try:
-            console.print(f"📖 [{index}] 시작: {article['title'][:40]}...")
-            
-            response = await client.get(article["url"], headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 본문 추출
-            content_data = self._extract_content_text(soup)
-            article["content"] = content_data.get("text", "")
-            
-            # 바이라인 정보 업데이트
-            byline_data = content_data.get("byline", {})
-            if byline_data.get("author"):
-                article["author"] = byline_data["author"]
-            
-            console.print(f"✅ [{index}] 완료: {len(article['content'])}자")
-            
-        except Exception as e:
-            console.print(f"❌ [{index}] 실패: {str(e)[:50]}...")
-            article["content"] = ""
+        # 바이라인 정보 업데이트
+        byline_data = content_data.get("byline", {})
+        if byline_data.get("author"):
+            article["author"] = byline_data["author"]
+        
+        console.print(f"✅ 완료: {len(article['content'])}자 - {article['title'][:30]}...")
+        
+        return article
 
     def _extract_content_text(self, soup: BeautifulSoup) -> Dict[str, any]:
-        """프레시안 본문 텍스트 추출"""
+        """프레시안 본문 텍스트 추출 (config/extraction_specs.py 명세)"""
         try:
-            # 1차: .section .article_body[itemprop="articleBody"] 찾기
-            content_container = soup.select_one('.section .article_body[itemprop="articleBody"]')
-            
-            # 2차 폴백: .article_body
-            if not content_container:
-                content_container = soup.select_one('.article_body')
+            # 바이라인은 컨테이너 밖(.list_author .byline)에 있으므로 본문 정리 전에 추출
+            byline_data = self._extract_article_byline(soup)
             
-            if not content_container:
+            result = get_extractor("pressian_politics").extract(soup)
+            if result is None:
                 console.print("⚠️ 본문 컨테이너를 찾을 수 없습니다")
                 return {"text": "", "byline": {}}
             
-            # 제외할 요소들 제거
-            exclude_selectors = [
-                'script', 'style', 'noscript', 'figure', 'figcaption', 'img',
-                '.article_ad', '.article_ad2', '[class^=ads]', 'ins.adsbygoogle', 
-                'iframe', '[id^=google_ads_]'
-            ]
-            
-            for selector in exclude_selectors:
-                elements = content_container.select(selector)
-                for el in elements:
-                    el.decompose()
-            
-            # <br> 태그를 줄바꿈으로 변환
-            for br in content_container.find_all('br'):
-                br.replace_with('\n')
-            
-            # paragraphs 수집 (컨테이너 후손의 <p>)
-            paragraphs = []
-            p_elements = content_container.find_all('p')
-            for element in p_elements:
-                text = element.get_text(strip=True)
-                # 비어 있는 단락과 광고/모듈 내부 단락 제외
-                if text and len(text) > 10:
-                    # &nbsp; 제거 및 다중 공백/개행 축약
-                    text = re.sub(r'&nbsp;', ' ', text)
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    if text:
-                        paragraphs.append(text)
-            
-            # 텍스트 결합
-            combined_text = '\n\n'.join(paragraphs)
-            
-            # 공백 정리
-            combined_text = re.sub(r'\n\s*\n', '\n\n', combined_text).strip()
-            
-            # 바이라인 추출 (컨테이너 밖의 .list_author .byline)
-            byline_data = self._extract_article_byline(soup)
-            
             return {
-                "text": combined_text,
+                "text": result["text"],
                 "byline": byline_data
             }
             
@@ -394,13 +321,14 @@ class PressianPoliticsCollector:
             console.print(f"⚠️ 바이라인 추출 실패: {str(e)}")
             return {"author": "", "author_email": ""}
 
-    async def save_articles_batch(self):
-        """DB 배치 저장"""
-        if not self.articles:
+    def save_articles_batch(self, articles: List[Dict]) -> List[str]:
+        """DB 배치 저장 - 입력 순서와 같은 기사별 저장 결과 반환 (inserted/duplicate/skipped/failed)"""
+        if not articles:
             console.print("⚠️ 저장할 기사가 없습니다.")
-            return
+            return []
             
-        console.print(f"💾 Supabase에 {len(self.articles)}개 기사 배치 저장 중...")
+        console.print(f"💾 Supabase에 {len(articles)}개 기사 배치 저장 중...")
+        statuses = ["failed"] * len(articles)
 
         try:
             # 언론사 확인
@@ -410,27 +338,17 @@ class PressianPoliticsCollector:
             else:
                 media_id = media["id"]
 
-            # 기존 URL 가져오기 (중복 체크)
-            existing_urls = set()
-            try:
-                result = self.supabase_manager.client.table("articles").select("url").eq("media_id", media_id).execute()
-                existing_urls = {article["url"] for article in result.data}
-            except Exception as e:
-                console.print(f"⚠️ 기존 URL 조회 실패: {str(e)}")
-
-            # 중복 제거 및 배치 준비
+            # 배치 준비 (이미 저장된 기사는 upsert 결과에서 중복으로 확인)
             new_articles = []
+            new_indices = []
             skip_count = 0
             short_content_count = 0
             
-            for article in self.articles:
-                if article["url"] in existing_urls:
-                    skip_count += 1
-                    continue
-                
+            for i, article in enumerate(articles):
                 # 본문 길이 체크 (20자 미만 제외)
                 content = article.get('content', '')
                 if len(content.strip()) < 20:
+                    statuses[i] = "skipped"
                     short_content_count += 1
                     continue
                     
@@ -438,10 +356,15 @@ class PressianPoliticsCollector:
                 parsed_article = self._parse_article_data_simple(article, media_id)
                 if parsed_article:
                     new_articles.append(parsed_article)
+                    new_indices.append(i)
 
             # 배치 저장
             if new_articles:
-                success_count = self._batch_insert_articles(new_articles)
+                results = self._batch_insert_articles(new_articles)
+                for i, status in zip(new_indices, results):
+                    statuses[i] = status
+                success_count = results.count("inserted")
+                skip_count = results.count("duplicate")
                 console.print(f"✅ 배치 저장 완료: {success_count}개 성공")
             else:
                 console.print("⚠️ 저장할 새 기사가 없습니다.")
@@ -450,6 +373,7 @@ class PressianPoliticsCollector:
             
         except Exception as e:
             console.print(f"❌ DB 저장 중 치명적 오류: {str(e)}")
+        return statuses
 
     def _parse_article_data_simple(self, article: dict, media_id: str) -> Optional[dict]:
         """기사 데이터 간단 파싱 (배치 저장용)"""
@@ -466,42 +390,22 @@ class PressianPoliticsCollector:
             console.print(f"❌ 기사 데이터 파싱 실패: {e}")
             return None
 
-    def _batch_insert_articles(self, articles: List[Dict]) -> int:
-        """배치로 기사 삽입"""
-        try:
-            # Supabase의 upsert 기능 사용
-            result = self.supabase_manager.client.table("articles").upsert(articles).execute()
-            return len(result.data) if result.data else 0
-        except Exception as e:
-            console.print(f"❌ 배치 저장 실패: {str(e)}")
-            # 개별 저장으로 폴백
-            success_count = 0
-            for article in articles:
-                try:
-                    if self.supabase_manager.insert_article(article):
-                        success_count += 1
-                except:
-                    continue
-            return success_count
+    def _batch_insert_articles(self, articles: List[Dict]) -> List[str]:
+        """배치로 기사 삽입 (청크 단위 일괄 upsert, 기사별 결과 반환)"""
+        return self.supabase_manager.insert_articles_bulk(articles)
 
     async def run(self, num_pages: int = 8):
         """실행"""
         try:
             console.print(f"🚀 프레시안 정치 기사 크롤링 시작 (최대 {num_pages}페이지)")
             
-            # 1. 기사 목록 수집 (병렬 처리)
-            await self.collect_articles_parallel(num_pages)
+            # 목록 → 본문 → 파싱 → 저장을 스트리밍으로 처리 (배치 저장 시 DB 슬롯 점유)
+            await self._run_pipeline(num_pages)
             
             if not self.articles:
                 console.print("❌ 수집된 기사가 없습니다")
                 return
             
-            # 2. 기사 본문 수집 (병렬 처리)
-            await self.collect_contents_parallel()
-            
-            # 3. 기사 저장 (배치 처리)
-            await self.save_articles_batch()
-            
             console.print("🎉 크롤링 완료!")
             
         except KeyboardInterrupt:
@@ -512,7 +416,10 @@ class PressianPoliticsCollector:
 
 async def main():
     collector = PressianPoliticsCollector()
-    await collector.run(num_pages=16)  # 16페이지에서 각각 10개씩 총 160개 수집
+    # 단독 실행 시에도 하나의 커넥션 풀(속도 제한 포함)을 실행 내내 재사용
+    async with open_client() as client:
+        collector.http_client = client
+        await collector.run(num_pages=16)  # 16페이지에서 각각 10개씩 총 160개 수집
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -6,12 +6,12 @@
 
 import asyncio
 import httpx
+import math
 import re
-import html
 import sys
 import os
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, AsyncIterator
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from rich.console import Console
@@ -20,11 +20,21 @@ from rich.console import Console
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from utils.supabase_manager import SupabaseManager
+from utils.http_client import open_client
+from utils.watermark import CrawlWatermark
+from utils.pipeline import CrawlPipeline
+from utils.parse_pool import SkipArticle
+from utils.html_parser import make_soup
+from utils.extraction import get_extractor
 
 console = Console()
 
 
 class SisainPoliticsCollector:
+    # 수집 제외 조건: 제목 조건은 목록 단계에서, 본문 조건은 본문 추출 후 확인
+    SKIP_TITLE_SUFFIXES = ("[김은지의 뉴스IN]",)
+    SKIP_CONTENT_PREFIXES = ("■ 방송", "〈시사IN〉은")
+    
     def __init__(self):
         self.base_url = "https://www.sisain.co.kr"
         self.politics_url = "https://www.sisain.co.kr/news/articleList.html?sc_section_code=S1N6&view_type=sm"
@@ -40,6 +50,10 @@ class SisainPoliticsCollector:
         }
         
         self.supabase = SupabaseManager()
+        self.http_client = None  # CrawlerManager가 주입하는 공유 HTTP 클라이언트
+        self.scheduler = None  # CrawlerManager가 주입하는 스케줄러 (DB 슬롯 관리)
+        self.watermark = CrawlWatermark("시사IN")  # 언론사별 증분 크롤링 워터마크
+        self.title_skipped: List[Dict[str, Any]] = []  # 제목 조건으로 제외한 기사 (워터마크에 처리한 기사로 기록)
         self.media_outlet = None
         
     def initialize(self):
@@ -83,7 +97,7 @@ class SisainPoliticsCollector:
             )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text)
             articles = []
             
             # 디버깅: 응답 내용 확인
@@ -195,264 +209,206 @@ class SisainPoliticsCollector:
         console.print(f"📊 총 {len(unique_articles)}개 기사 수집")
         return unique_articles
 
-    async def _collect_page_articles_with_target(self, client: httpx.AsyncClient, num_pages: int, target_articles: int) -> List[Dict[str, Any]]:
-        """목표 기사 수에 도달하면 중단하는 페이지별 기사 수집"""
-        all_articles = []
+    async def _iter_page_articles_with_target(self, client: httpx.AsyncClient, num_pages: int, target_articles: int,
+                                              page_window: int = 4) -> AsyncIterator[Dict[str, Any]]:
+        """
+        목표 기사 수에 도달하면 중단하는 페이지별 기사 수집 (파이프라인 목록 단계)
+        
+        다음 페이지들을 미리 동시에 요청해 두고(최대 page_window개) 앞 페이지부터 순서대로 처리합니다.
+        미리 요청하는 페이지 수는 남은 목표 수와 지금까지 페이지당 수집한 기사 수로 정하며,
+        목표 달성/워터마크 도달/수집 중단 시 아직 끝나지 않은 페이지 요청은 취소합니다.
+        제목 조건에 해당하는 기사는 본문을 요청하기 전에 여기서 제외하고 self.title_skipped에 모아
+        다음 실행에서 이미 처리한 기사로 보도록 합니다 (제외 기사만 남은 페이지에서도 순회가 멈추도록).
+        """
         collected_count = 0
+        self.title_skipped = []
+        pages_done = 0
         seen_urls = set()
+        pending: Dict[int, asyncio.Task] = {}
+        next_page = 1
+        per_page = int(self._get_api_params(1)["list_per_page"])
         
-        for page in range(1, num_pages + 1):
-            console.print(f"📄 페이지 {page} 수집 중...")
-            
-            try:
-                page_articles = await self._get_page_articles(client, page)
+        try:
+            for page in range(1, num_pages + 1):
+                # 남은 목표를 채우는 데 필요한 만큼만 다음 페이지를 미리 요청
+                rate = collected_count / pages_done if pages_done else per_page
+                needed = math.ceil((target_articles - collected_count) / max(rate, 1))
+                while next_page <= num_pages and len(pending) < min(page_window, max(needed, 1)):
+                    pending[next_page] = asyncio.create_task(self._get_page_articles(client, next_page))
+                    next_page += 1
                 
-                if page_articles:
-                    # 필터링 적용 및 중복 제거
-                    for article in page_articles:
-                        if article["url"] in seen_urls:
-                            continue
-                        
-                        if not self._should_skip_article(article):
-                            seen_urls.add(article["url"])
-                            all_articles.append(article)
-                            collected_count += 1
-                            
-                            # 목표 달성 시 즉시 종료
-                            if collected_count >= target_articles:
-                                console.print(f"🎯 목표 {target_articles}개 달성! 크롤링 종료")
-                                return all_articles
-                    
-                    console.print(f"📰 페이지 {page}: {len([a for a in page_articles if a['url'] not in seen_urls and not self._should_skip_article(a)])}개 기사 수집 (총 {collected_count}개)")
-                else:
+                console.print(f"📄 페이지 {page} 수집 중... (동시 요청 {len(pending)}개)")
+                try:
+                    page_articles = await pending.pop(page)
+                except Exception as e:
+                    console.print(f"❌ 페이지 {page} 처리 중 오류: {e}")
+                    continue
+                pages_done += 1
+                
+                if not page_articles:
                     console.print(f"⚠️ 페이지 {page}에서 기사를 찾을 수 없음")
+                    continue
+                
+                # 필터링 적용 및 중복 제거
+                page_count = 0
+                for article in page_articles:
+                    if article["url"] in seen_urls or self.watermark.is_seen(article):
+                        continue
+                    if self._should_skip_title(article):
+                        seen_urls.add(article["url"])
+                        self.title_skipped.append(article)
+                        continue
                     
-            except Exception as e:
-                console.print(f"❌ 페이지 {page} 처리 중 오류: {e}")
-                continue
-        
-        console.print(f"📊 총 {len(all_articles)}개 기사 수집 완료 (목표: {target_articles}개)")
-        return all_articles
+                    seen_urls.add(article["url"])
+                    collected_count += 1
+                    page_count += 1
+                    yield article
+                    
+                    # 목표 달성 시 즉시 종료 (미리 요청한 페이지는 finally에서 취소)
+                    if collected_count >= target_articles:
+                        console.print(f"🎯 목표 {target_articles}개 달성! 크롤링 종료")
+                        return
+                
+                console.print(f"📰 페이지 {page}: {page_count}개 기사 수집 (총 {collected_count}개)")
+                
+                # 페이지 전체가 워터마크 이전이면 이후 페이지도 이미 처리된 기사
+                if self.watermark.is_page_stale(page_articles):
+                    console.print(f"🔖 페이지 {page}에서 워터마크 도달 - 크롤링 종료")
+                    break
+            
+            console.print(f"📊 총 {collected_count}개 기사 수집 완료 (목표: {target_articles}개)")
+        finally:
+            in_flight = [task for task in pending.values() if not task.done()]
+            for task in in_flight:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending.values(), return_exceptions=True)
+            if in_flight:
+                console.print(f"🛑 미리 요청한 페이지 {len(in_flight)}개 취소")
+            if self.title_skipped:
+                console.print(f"⏭️ 제목 조건으로 본문 요청 전 제외: {len(self.title_skipped)}개")
     
     def _extract_content_text(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """시사IN 본문 텍스트 추출"""
+        """시사IN 본문 텍스트 추출 (config/extraction_specs.py 명세)"""
         try:
-            # 본문 컨테이너 찾기
-            content_container = soup.select_one('article#article-view-content-div.article-veiw-body[itemprop="articleBody"]')
-            if not content_container:
-                content_container = soup.select_one('article.article-veiw-body[itemprop="articleBody"]')
-            
-            if not content_container:
+            result = get_extractor("sisain_politics").extract(soup)
+            if result is None:
                 console.print("⚠️ 본문 컨테이너를 찾을 수 없습니다")
-                return {"paragraphs": [], "text": "", "headings": [], "images": [], "links": [], "appendix": None}
-            
-            # 광고/장식 요소 제거
-            exclude_selectors = [
-                'script', 'style', 'noscript', 'iframe', 
-                '.ad-template', 'ins.adsbygoogle', '[id^="AD"]', 
-                '.IMGFLOATING', '[style*="display:none"]'
-            ]
-            
-            for selector in exclude_selectors:
-                elements = content_container.select(selector)
-                for el in elements:
-                    el.decompose()
-            
-            # 래퍼 div 풀기
-            wrapper_divs = content_container.select('div[style*="text-align:center"]')
-            for wrapper in wrapper_divs:
-                # 자식 요소들을 부모로 이동
-                parent = wrapper.parent
-                if parent:
-                    for child in list(wrapper.children):
-                        parent.insert(wrapper.index(child), child)
-                    wrapper.decompose()
-            
-            # <br> 태그를 줄바꿈으로 변환
-            for br in content_container.find_all('br'):
-                br.replace_with('\n')
-            
-            # 공백 정리 함수
-            def clean_text(text: str) -> str:
-                text = text.replace('&nbsp;', ' ')
-                text = re.sub(r'\s+', ' ', text)
-                return text.strip()
-            
-            # 제목 수집
-            headings = []
-            for i in range(1, 7):
-                for h in content_container.find_all(f'h{i}'):
-                    heading_text = h.get_text(strip=True)
-                    if heading_text:
-                        headings.append(f"h{i} {heading_text}")
-            
-            # 이미지 수집
-            images = []
-            lead_image = None
-            figures = content_container.find_all('figure.photo-layout')
-            
-            for i, figure in enumerate(figures):
-                img = figure.find('img')
-                if img:
-                    src = img.get('src', '')
-                    alt = img.get('alt', '')
-                    if src and not src.startswith('http'):
-                        src = urljoin(self.base_url, src)
-                    
-                    figcaption = figure.find('figcaption')
-                    caption = figcaption.get_text(strip=True) if figcaption else ""
-                    
-                    idxno = figure.get('data-idxno')
-                    
-                    image_data = {
-                        "src": src,
-                        "alt": alt,
-                        "caption": caption,
-                        "idxno": idxno
-                    }
-                    
-                    images.append(image_data)
-                    
-                    # 첫 번째 이미지를 lead_image로 설정
-                    if i == 0:
-                        lead_image = image_data
-            
-            # 링크 수집
-            links = []
-            seen_hrefs = set()
-            
-            # 단락 수집
-            paragraphs = []
-            
-            for p in content_container.find_all('p'):
-                # 앵커 태그 처리
-                for a in p.find_all('a'):
-                    href = a.get('href', '')
-                    text = a.get_text(strip=True)
-                    
-                    if href and href not in seen_hrefs:
-                        seen_hrefs.add(href)
-                        if not href.startswith('http'):
-                            href = urljoin(self.base_url, href)
-                        links.append({"text": text, "href": href})
-                    
-                    # 링크 텍스트만 남기고 href는 제거
-                    a.replace_with(text)
-                
-                text = p.get_text(strip=True)
-                if text and len(text) > 10:  # 의미 있는 단락만
-                    text = clean_text(text)
-                    if text:
-                        paragraphs.append(text)
+                return {"text": ""}
             
-            # appendix 처리 ("■ 이렇게 조사했다" 블록)
-            appendix = None
-            for p in content_container.find_all('p'):
-                span = p.find('span', style=lambda x: x and 'color:#2980b9' in x)
-                if span and "■ 이렇게 조사했다" in span.get_text():
-                    # <br> 기준으로 줄바꿈 유지
-                    methodology_text = span.get_text(separator='\n')
-                    appendix = {"methodology": methodology_text}
-                    break
-            
-            # 텍스트 결합
-            combined_text = '\n\n'.join(paragraphs)
-            
-            return {
-                "paragraphs": paragraphs,
-                "text": combined_text,
-                "headings": headings if headings else None,
-                "images": images if images else None,
-                "lead_image": lead_image,
-                "links": links if links else None,
-                "appendix": appendix
-            }
+            return {"text": result["text"]}
             
         except Exception as e:
             console.print(f"⚠️ 본문 추출 실패: {str(e)}")
-            return {"paragraphs": [], "text": "", "headings": None, "images": None, "lead_image": None, "links": None, "appendix": None}
+            return {"text": ""}
     
-    def _should_skip_article(self, article: Dict[str, Any]) -> bool:
-        """기사 필터링 조건 확인"""
+    def _should_skip_title(self, article: Dict[str, Any]) -> bool:
+        """제목만으로 제외할 기사인지 확인 (목록 단계, 본문 요청 전)"""
         title = article.get("title", "")
+        
+        # 타이틀이 "[김은지의 뉴스IN]"으로 끝나는 경우
+        return title.endswith(self.SKIP_TITLE_SUFFIXES)
+    
+    def _should_skip_article(self, article: Dict[str, Any]) -> bool:
+        """기사 필터링 조건 확인 (본문 추출 후)"""
         content = article.get("content", "")
         
-        # 조건 1: 본문이 "■ 방송"으로 시작하는 경우
-        if content.startswith("■ 방송"):
-            return True
-            
-        # 조건 2: 본문이 "〈시사IN〉은"으로 시작하는 경우  
-        if content.startswith("〈시사IN〉은"):
-            return True
-            
-        # 조건 3: 타이틀이 "[김은지의 뉴스IN]"으로 끝나는 경우
-        if title.endswith("[김은지의 뉴스IN]"):
+        # 본문이 "■ 방송" 또는 "〈시사IN〉은"으로 시작하는 경우
+        if content.startswith(self.SKIP_CONTENT_PREFIXES):
             return True
-            
-        return False
+        
+        return self._should_skip_title(article)
     
-    async def _extract_content_httpx(self, client: httpx.AsyncClient, article: Dict[str, Any], index: int):
-        """httpx로 기사 본문 추출"""
-        try:
-            console.print(f"📖 [{index}] 시작: {article['title'][:40]}...")
-            
-            response = await client.get(article["url"], headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 본문 추출
-            content_data = self._extract_content_text(soup)
-            article["content"] = content_data.get("text", "")
-            
-            # 바이라인은 별도로 추출하지 않음 (본문에 포함)
-            article["byline"] = None
-            
-            # lead_image 설정
-            lead_image = content_data.get("lead_image")
-            if lead_image:
-                article["lead_image"] = lead_image
-            
-            # 필터링 조건 확인
-            if self._should_skip_article(article):
-                console.print(f"⏭️ [{index}] 스킵: 필터링 조건에 해당")
-                article["content"] = ""  # 스킵된 기사로 표시
-                return
-            
-            console.print(f"✅ [{index}] 완료: {len(article['content'])}자")
-            
-        except Exception as e:
-            console.print(f"❌ [{index}] 실패: {str(e)[:50]}...")
-            article["content"] = ""
-            article["byline"] = None
-            article["lead_image"] = None
+    async def _fetch_detail(self, client: httpx.AsyncClient, article: Dict[str, Any]) -> str:
+        """기사 상세 페이지 HTML 요청"""
+        response = await client.get(article["url"], headers=self.headers)
+        response.raise_for_status()
+        return response.text
     
-    async def _extract_all_contents(self, articles: List[Dict[str, Any]]) -> None:
-        """모든 기사의 본문 추출"""
-        console.print(f"📖 {len(articles)}개 기사 본문 수집 시작 (병렬 처리)...")
+    def _parse_detail(self, article: Dict[str, Any], html: str) -> Optional[Dict[str, Any]]:
+        """상세 페이지 HTML에서 기사 본문 추출 (제외 조건에 해당하면 SkipArticle)"""
+        soup = make_soup(html)
+        
+        # 본문 추출
+        content_data = self._extract_content_text(soup)
+        article["content"] = content_data.get("text", "")
+        
+        # 바이라인은 별도로 추출하지 않음 (본문에 포함)
+        article["byline"] = None
         
-        batch_size = 20
-        total_batches = (len(articles) + batch_size - 1) // batch_size
+        # 필터링 조건 확인
+        if self._should_skip_article(article):
+            console.print(f"⏭️ 스킵: 필터링 조건에 해당 - {article['title'][:30]}...")
+            raise SkipArticle(article["url"])
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for batch_idx in range(total_batches):
-                start_idx = batch_idx * batch_size
-                end_idx = min(start_idx + batch_size, len(articles))
-                batch_articles = articles[start_idx:end_idx]
+        console.print(f"✅ 완료: {len(article['content'])}자 - {article['title'][:30]}...")
+        return article
+    
+    def _save_articles(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """수집한 기사를 Supabase에 저장 (입력 순서와 같은 기사별 저장 결과 반환)"""
+        console.print("💾 Supabase에 기사 저장 중...")
+        
+        saved_count = 0
+        skipped_count = 0
+        short_content_count = 0
+        rows, row_indices = [], []
+        results = ["failed"] * len(articles)
+        
+        for i, article in enumerate(articles):
+            try:
+                # 필터링된 기사는 건너뛰기
+                if not article.get("content") or article["content"] == "":
+                    results[i] = "skipped"
+                    skipped_count += 1
+                    continue
                 
-                console.print(f"📖 배치 {batch_idx + 1}/{total_batches}: {len(batch_articles)}개 기사 처리 중...")
+                # 본문 길이 체크 (20자 미만 제외)
+                content = article.get('content', '')
+                if len(content.strip()) < 20:
+                    results[i] = "skipped"
+                    short_content_count += 1
+                    console.print(f"⚠️ 짧은 본문 제외: {article.get('title', '')[:30]}...")
+                    continue
                 
-                tasks = []
-                for i, article in enumerate(batch_articles):
-                    task = self._extract_content_httpx(client, article, start_idx + i + 1)
-                    tasks.append(task)
+                # published_at 설정 (KST 기준)
+                if article["published_date"]:
+                    try:
+                        date_obj = datetime.strptime(article["published_date"], "%Y-%m-%d")
+                        kst_time = date_obj.replace(tzinfo=timezone(timedelta(hours=9)))
+                        article["published_at"] = kst_time.isoformat()
+                    except ValueError:
+                        article["published_at"] = None
+                else:
+                    article["published_at"] = None
                 
-                await asyncio.gather(*tasks, return_exceptions=True)
+                # Supabase에 저장
+                article_data = {
+                    "media_id": self.media_outlet["id"],
+                    "url": article["url"],
+                    "title": article["title"],
+                    "content": article["content"],
+                    "published_at": article["published_at"],
+                    "created_at": datetime.now(timezone.utc).isoformat()
+                }
                 
-                # 배치 간 잠시 대기
-                if batch_idx < total_batches - 1:
-                    await asyncio.sleep(1)
+                rows.append(article_data)
+                row_indices.append(i)
+                    
+            except Exception as e:
+                console.print(f"❌ 기사 저장 실패: {str(e)[:50]}...")
+                skipped_count += 1
+        
+        # 청크 단위 일괄 저장 (행별 결과 반환)
+        statuses = self.supabase.insert_articles_bulk(rows) if rows else []
+        for index, status in zip(row_indices, statuses):
+            results[index] = status
+        saved_count += statuses.count("inserted")
+        skipped_count += len(statuses) - statuses.count("inserted")
+        
+        console.print(f"📊 저장 결과: 성공 {saved_count}, 스킵 {skipped_count}, 짧은본문 제외 {short_content_count}")
+        return results
     
-    async def run(self, num_pages: int = 8, target_articles: int = 160):
+    async def run(self, num_pages: int = 8, target_articles: int = 160, page_window: int = 4):
         """크롤링 실행"""
         try:
             if not self.initialize():
@@ -460,72 +416,29 @@ class SisainPoliticsCollector:
             
             console.print(f"🚀 시사IN 정치 기사 크롤링 시작 (목표: {target_articles}개)")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # 기사 목록 수집 (페이지별로 체크하며 목표 달성 시 종료)
-                articles = await self._collect_page_articles_with_target(client, num_pages, target_articles)
-                
-                if not articles:
-                    console.print("❌ 수집된 기사가 없습니다")
-                    return
-                
-                # 본문 추출
-                await self._extract_all_contents(articles)
-                
-                # Supabase에 저장
-                console.print("💾 Supabase에 기사 저장 중...")
-                
-                saved_count = 0
-                skipped_count = 0
-                short_content_count = 0
-                
-                for article in articles:
-                    try:
-                        # 필터링된 기사는 건너뛰기
-                        if not article.get("content") or article["content"] == "":
-                            skipped_count += 1
-                            continue
-                        
-                        # 본문 길이 체크 (20자 미만 제외)
-                        content = article.get('content', '')
-                        if len(content.strip()) < 20:
-                            short_content_count += 1
-                            console.print(f"⚠️ 짧은 본문 제외: {article.get('title', '')[:30]}...")
-                            continue
-                        
-                        # published_at 설정 (KST 기준)
-                        if article["published_date"]:
-                            try:
-                                date_obj = datetime.strptime(article["published_date"], "%Y-%m-%d")
-                                kst_time = date_obj.replace(tzinfo=timezone(timedelta(hours=9)))
-                                article["published_at"] = kst_time.isoformat()
-                            except ValueError:
-                                article["published_at"] = None
-                        else:
-                            article["published_at"] = None
-                        
-                        # Supabase에 저장
-                        article_data = {
-                            "media_id": self.media_outlet["id"],
-                            "url": article["url"],
-                            "title": article["title"],
-                            "content": article["content"],
-                            "published_at": article["published_at"],
-                            "created_at": datetime.now(timezone.utc).isoformat()
-                        }
-                        
-                        result = self.supabase.insert_article(article_data)
-                        
-                        if result:
-                            saved_count += 1
-                        else:
-                            skipped_count += 1
-                            
-                    except Exception as e:
-                        console.print(f"❌ 기사 저장 실패: {str(e)[:50]}...")
-                        skipped_count += 1
-                
-                console.print(f"📊 저장 결과: 성공 {saved_count}, 스킵 {skipped_count}, 짧은본문 제외 {short_content_count}")
-                console.print("🎉 크롤링 완료!")
+            async with open_client(self.http_client, timeout=30.0) as client:
+                # 목록 → 본문 → 파싱 → 저장을 스트리밍으로 처리 (배치 저장 시 DB 슬롯 점유)
+                pipeline = CrawlPipeline(
+                    "시사IN",
+                    # 기사 목록은 다음 페이지를 미리 요청하며 순서대로 체크하고 목표 달성 시 종료
+                    discover=self._iter_page_articles_with_target(client, num_pages, target_articles, page_window),
+                    fetch_detail=lambda article: self._fetch_detail(client, article),
+                    parse_detail=self._parse_detail,
+                    save_batch=self._save_articles,
+                    scheduler=self.scheduler,
+                    media_id=self.media_outlet["id"],
+                )
+                self.articles = await pipeline.run()
+            
+            # 워터마크 갱신 (다음 실행은 이번에 처리한 기사까지만 순회, 실패한 기사는 다시 확인)
+            self.watermark.advance(self.articles, failed=pipeline.failed,
+                                   skipped=pipeline.skipped + self.title_skipped)
+            
+            if not self.articles:
+                console.print("❌ 수집된 기사가 없습니다")
+                return
+            
+            console.print("🎉 크롤링 완료!")
                 
         except KeyboardInterrupt:
             console.print("⏹️ 사용자에 의해 중단되었습니다")
@@ -535,7 +448,10 @@ class SisainPoliticsCollector:
 
 async def main():
     collector = SisainPoliticsCollector()
-    await collector.run(num_pages=20, target_articles=160)  # 최대 20페이지, 목표 160개 기사
+    # 단독 실행 시에도 하나의 커넥션 풀(속도 제한 포함)을 실행 내내 재사용
+    async with open_client() as client:
+        collector.http_client = client
+        await collector.run(num_pages=20, target_articles=160)  # 최대 20페이지, 목표 160개 기사
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+크롤러 레지스트리 (이름 → 모듈 지연 로딩)
+크롤러 이름과 모듈/클래스 경로만 들고 있다가 처음 사용할 때 해당 모듈만 import합니다.
+- 패키지 import나 단일 언론사 실행 시 다른 언론사 모듈(및 Playwright)을 불러오지 않음
+- 존재하지 않는 모듈은 해당 크롤러를 실행할 때만 오류 (패키지 전체가 깨지지 않음)
+"""
+
+import importlib
+from typing import Dict, List, Tuple
+
+# 크롤러 이름 → (모듈 경로, 클래스 이름)
+CRAWLER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    # 기존 크롤러들
+    "ohmynews_politics": ("crawler.html_parsing.ohmynews_politics", "OhmyNewsPoliticsCollector"),
+    "yonhap_politics": ("crawler.html_parsing.yonhap_politics", "YonhapPoliticsCollector"),
+    "hani_politics": ("crawler.html_parsing.hani_politics", "HaniPoliticsCrawler"),
+    "khan_politics": ("crawler.html_parsing.khan_politics", "KhanPoliticsCollector"),
+    "donga_politics": ("crawler.html_parsing.donga_politics", "DongaPoliticsCollector"),
+    "joongang_politics": ("crawler.html_parsing.joongang_politics", "JoongangPoliticsCollector"),
+    "newsis_politics": ("crawler.html_parsing.newsis_politics", "NewsisPoliticsCollector"),
+    "chosun_politics": ("crawler.api_based.chosun_politics", "ChosunPoliticsCollector"),
+
+    # 새로운 진보 성향 크롤러들
+    "segye_politics": ("crawler.hybrid.segye_politics", "SegyePoliticsCollector"),
+    "munhwa_politics": ("crawler.html_parsing.munhwa_politics", "MunhwaPoliticsCollector"),
+    "naeil_politics": ("crawler.html_parsing.naeil_politics", "NaeilPoliticsCollector"),
+    "pressian_politics": ("crawler.html_parsing.pressian_politics", "PressianPoliticsCollector"),
+    "hankyung_politics": ("crawler.html_parsing.hankyung_politics", "HankyungPoliticsCollector"),
+    "sisain_politics": ("crawler.html_parsing.sisain_politics", "SisainPoliticsCollector"),
+}
+
+# 이미 불러온 크롤러 클래스
+_loaded: Dict[str, type] = {}
+
+
+def available_crawlers() -> List[str]:
+    """등록된 크롤러 이름 목록 (모듈은 import하지 않음)"""
+    return list(CRAWLER_REGISTRY)
+
+
+def load_crawler_class(name: str) -> type:
+    """
+    크롤러 클래스 반환 (첫 호출 시 해당 모듈만 import)
+
+    Args:
+        name: 크롤러 이름 (예: "hani_politics")
+
+    Returns:
+        type: 크롤러 클래스
+
+    Raises:
+        ValueError: 등록되지 않은 크롤러 이름
+    """
+    if name in _loaded:
+        return _loaded[name]
+    if name not in CRAWLER_REGISTRY:
+        raise ValueError(f"크롤러 클래스를 찾을 수 없습니다: {name}")
+
+    module_path, class_name = CRAWLER_REGISTRY[name]
+    crawler_class = getattr(importlib.import_module(module_path), class_name)
+    _loaded[name] = crawler_class
+    return crawler_class
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+공유 HTTP 클라이언트 점검 스크립트
+로컬 HTTP 서버를 띄운 뒤 create_shared_client()로 실제 요청을 보내
+전송 계층 전체(지표 → 캐시 → 재시도 → 속도 제한 → httpx)를 거친 응답을 확인합니다.
+- 상태 코드와 본문(gzip 압축 응답 포함)이 서버가 보낸 그대로인지
+- 언론사 지표에 요청 수와 수신 바이트(압축된 전송 크기)가 기록되는지
+- 하나라도 다르면 종료 코드 1
+
+사용법:
+    python scripts/http_client_check.py
+"""
+
+import asyncio
+import gzip
+import os
+import sys
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+from rich.console import Console
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from utils.http_client import create_shared_client
+from utils.crawl_metrics import current_outlet, get_crawl_metrics
+
+console = Console()
+
+OUTLET_NAME = "http-client-check"
+PLAIN_BODY = "정치 기사 본문 ".encode("utf-8") * 200
+GZIP_BODY = gzip.compress(PLAIN_BODY)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """경로별로 평문/gzip/404 응답을 돌려주는 점검용 핸들러"""
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/plain":
+            self._reply(200, PLAIN_BODY)
+        elif path == "/gzip":
+            self._reply(200, GZIP_BODY, {"Content-Encoding": "gzip"})
+        else:
+            self._reply(404, b"not found")
+
+    def _reply(self, status: int, body: bytes, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def run_checks(base_url: str) -> List[Tuple[str, bool, str]]:
+    """공유 클라이언트로 요청을 보내고 (항목, 통과 여부, 상세) 목록 반환"""
+    # 실행마다 다른 쿼리로 이전 실행의 HTTP 캐시 항목을 재사용하지 않음
+    token = uuid.uuid4().hex
+    metrics = get_crawl_metrics()
+    metrics.reset()
+    current_outlet.set(OUTLET_NAME)
+
+    results = []
+    async with create_shared_client() as client:
+        cases = (
+            ("평문 응답", "/plain", 200, PLAIN_BODY, len(PLAIN_BODY)),
+            ("gzip 응답", "/gzip", 200, PLAIN_BODY, len(GZIP_BODY)),
+            ("404 응답", "/missing", 404, b"not found", len(b"not found")),
+        )
+        expected_bytes = 0
+        for label, path, status, body, wire_size in cases:
+            try:
+                response = await client.get(f"{base_url}{path}?t={token}")
+            except Exception as e:
+                results.append((label, False, f"{type(e).__name__}: {e}"))
+                continue
+            ok = response.status_code == status and response.content == body
+            detail = f"상태 {response.status_code}, 본문 {len(response.content)}B"
+            results.append((label, ok, detail))
+            expected_bytes += wire_size
+
+    counters = metrics.outlet(OUTLET_NAME).counters
+    results.append((
+        "요청 수 집계",
+        counters["http_requests"] == len(cases),
+        f"http_requests={counters['http_requests']} (기대 {len(cases)})",
+    ))
+    results.append((
+        "수신 바이트 집계",
+        counters["http_bytes"] == expected_bytes,
+        f"http_bytes={counters['http_bytes']} (기대 {expected_bytes})",
+    ))
+    return results
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    console.print(f"🌐 로컬 점검 서버: {base_url}")
+
+    try:
+        results = asyncio.run(run_checks(base_url))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    failed = 0
+    for label, ok, detail in results:
+        console.print(f"{'✅' if ok else '❌'} {label}: {detail}")
+        failed += 0 if ok else 1
+
+    if failed:
+        console.print(f"❌ {failed}개 항목 실패")
+        sys.exit(1)
+    console.print("🎉 공유 HTTP 클라이언트 점검 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+크롤러 import 시간 측정 스크립트
+새 파이썬 프로세스에서 시나리오별 import 시간을 반복 측정해 중앙값을 비교합니다.
+- 패키지 import / 단일 언론사 로딩은 다른 언론사 모듈과 Playwright를 불러오지 않아야 함
+- "전체 크롤러" 시나리오는 레지스트리 도입 전(모든 모듈을 즉시 import)과 같은 비용
+
+사용법:
+    python scripts/import_benchmark.py                    # 기본 5회 반복
+    python scripts/import_benchmark.py --repeat 10 --outlet khan_politics
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from crawler.registry import available_crawlers
+
+console = Console()
+
+# 측정 코드: import 전후 시간과 Playwright 로딩 여부 출력
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+{code}
+elapsed = (time.perf_counter() - started) * 1000
+print(f"{{elapsed:.3f}} {{int('playwright' in sys.modules)}} {{len(sys.modules)}}")
+"""
+
+
+def _scenarios(outlet: str) -> Dict[str, str]:
+    return {
+        "crawler 패키지": "import crawler",
+        f"단일 언론사 ({outlet})": f"from crawler.registry import load_crawler_class; load_crawler_class({outlet!r})",
+        "CrawlerManager": "from crawler.crawler_manager import CrawlerManager",
+        "전체 크롤러": (
+            "from crawler.registry import available_crawlers, load_crawler_class\n"
+            "for name in available_crawlers(): load_crawler_class(name)"
+        ),
+    }
+
+
+def measure(code: str, repeat: int) -> Optional[Dict]:
+    """새 프로세스에서 반복 측정 (실패 시 None)"""
+    times: List[float] = []
+    playwright = False
+    modules = 0
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(code=code)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            console.print(f"❌ 측정 실패: {result.stderr.strip().splitlines()[-1] if result.stderr else '알 수 없는 오류'}")
+            return None
+        elapsed, loaded, count = result.stdout.split()[-3:]
+        times.append(float(elapsed))
+        playwright = playwright or loaded == "1"
+        modules = int(count)
+    return {"median": statistics.median(times), "min": min(times), "playwright": playwright, "modules": modules}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 import 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="시나리오별 반복 횟수")
+    parser.add_argument("--outlet", default="hani_politics", choices=available_crawlers(),
+                        help="단일 언론사 시나리오에 사용할 크롤러")
+    args = parser.parse_args()
+
+    table = Table(title=f"크롤러 import 시간 (새 프로세스, {args.repeat}회 중앙값)")
+    table.add_column("시나리오", style="cyan")
+    table.add_column("중앙값 (ms)", justify="right")
+    table.add_column("최소 (ms)", justify="right")
+    table.add_column("모듈 수", justify="right")
+    table.add_column("Playwright", justify="center")
+
+    for label, code in _scenarios(args.outlet).items():
+        console.print(f"⏱️ {label} 측정 중...")
+        stats = measure(code, args.repeat)
+        if stats is None:
+            table.add_row(label, "-", "-", "-", "-")
+            continue
+        table.add_row(
+            label, f"{stats['median']:.1f}", f"{stats['min']:.1f}", str(stats["modules"]),
+            "[red]로딩[/red]" if stats["playwright"] else "[green]-[/green]",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+모의 언론사 서버
+--record-fixtures로 기록한 목록/본문/API 응답을 언론사별로 그대로 돌려주는 로컬 HTTP 서버입니다.
+실제 언론사에 요청하지 않고 CrawlerManager 전체의 처리량과 꼬리 지연을 측정할 수 있습니다.
+- 요청한 언론사는 Host / X-Original-URL 헤더로 구분 (공유 클라이언트의 주소 전환과 함께 사용)
+- 응답 지연(기본 + 지수 분포 추가 지연), 연결당 전송 속도, 500/503 및 429 비율을 언론사별로 설정
+- 기록에 없는 주소는 404 (목록 페이지 순회는 기록된 페이지까지만 진행)
+- 종료(Ctrl+C) 시 언론사별 응답 수와 지연 분포(p50/p95/p99) 출력
+
+사용법:
+    python scripts/mock_outlet_server.py --fixtures fixtures/recorded --throttle-rate 0.05
+    python -m crawler.crawler_manager --mock-outlets http://127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from rich.console import Console
+from rich.table import Table
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from config.crawler_config import MOCK_OUTLET_CONFIG
+from utils.fixtures import decode_body, iter_records
+
+console = Console()
+
+_REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error",
+            503: "Service Unavailable"}
+_PROFILE_KEYS = ("latency_ms", "jitter_ms", "bandwidth_kbps", "error_rate", "throttle_rate", "retry_after")
+_CHUNK_SIZE = 16 * 1024
+
+
+class FixtureIndex:
+    """기록된 응답을 주소로 찾는 색인 (전체 URL → 호스트+경로+쿼리 순으로 검색, 쿼리까지 일치해야 함)"""
+
+    def __init__(self, directory: str):
+        self.by_url: Dict[str, Dict] = {}
+        self.by_path: Dict[Tuple[str, str], Dict] = {}
+        for path in sorted(glob.glob(os.path.join(directory, "responses", "*.jsonl.gz"))):
+            for record in iter_records(path):
+                parts = urlsplit(record["url"])
+                self.by_url[record["url"]] = record
+                self.by_path[(parts.hostname, parts.path + ("?" + parts.query if parts.query else ""))] = record
+
+    def __len__(self) -> int:
+        return len(self.by_url)
+
+    def find(self, host: str, target: str, original_url: Optional[str]) -> Optional[Dict]:
+        if original_url and original_url in self.by_url:
+            return self.by_url[original_url]
+        return self.by_path.get((host, target))
+
+
+class MockOutletServer:
+    """기록된 응답을 지연/오류를 섞어 돌려주는 HTTP/1.1 서버"""
+
+    def __init__(self, index: FixtureIndex, config: Dict, seed: Optional[int] = None):
+        self.index = index
+        self.config = config
+        self.random = random.Random(seed)
+
+        # 통계 (호스트별)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.bytes_sent: Counter = Counter()
+
+    def profile(self, host: str) -> Dict:
+        """언론사별 설정 (기본값 + outlets 덮어쓰기)"""
+        return {
+            **{k: self.config[k] for k in _PROFILE_KEYS},
+            **self.config.get("outlets", {}).get(host, {}),
+        }
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나에서 keep-alive 요청을 순서대로 처리"""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                keep_alive = await self._respond(writer, *request)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0) or 0)
+        if length:
+            await reader.readexactly(length)
+        return method, target, headers
+
+    async def _respond(self, writer: asyncio.StreamWriter, method: str, target: str, headers: Dict) -> bool:
+        started = time.perf_counter()
+        original_url = headers.get("x-original-url")
+        host = urlsplit(original_url).hostname if original_url else headers.get("host", "").split(":")[0]
+        profile = self.profile(host)
+
+        # 응답 지연: 기본 지연 + 지수 분포 추가 지연
+        delay = profile["latency_ms"]
+        if profile["jitter_ms"]:
+            delay += self.random.expovariate(1 / profile["jitter_ms"])
+        await asyncio.sleep(delay / 1000)
+
+        extra_headers = {}
+        roll = self.random.random()
+        if roll < profile["throttle_rate"]:
+            status, body = 429, b""
+            extra_headers["Retry-After"] = str(profile["retry_after"])
+        elif roll < profile["throttle_rate"] + profile["error_rate"]:
+            status, body = self.random.choice((500, 503)), b""
+        else:
+            record = self.index.find(host, target, original_url)
+            if record is None:
+                status, body = 404, b""
+            else:
+                status = record["status"]
+                body = decode_body(record)
+                body = body.encode("utf-8") if isinstance(body, str) else body
+                extra_headers.update(record.get("headers", {}))
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        extra_headers.update({
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+        })
+        head = f"HTTP/1.1 {status} {_REASONS.get(status, 'Mocked')}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in extra_headers.items()
+        ) + "\r\n"
+        writer.write(head.encode("latin-1", "replace"))
+        if method != "HEAD":
+            await self._send_body(writer, body, profile["bandwidth_kbps"])
+        await writer.drain()
+
+        self.latencies[host].append((time.perf_counter() - started) * 1000)
+        self.statuses[host][status] += 1
+        self.bytes_sent[host] += len(body)
+        return keep_alive
+
+    async def _send_body(self, writer: asyncio.StreamWriter, body: bytes, bandwidth_kbps: float):
+        if not bandwidth_kbps:
+            writer.write(body)
+            return
+        # 전송 속도 제한: 조각마다 해당 크기를 보내는 데 걸리는 시간만큼 대기
+        for offset in range(0, len(body), _CHUNK_SIZE):
+            chunk = body[offset:offset + _CHUNK_SIZE]
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(len(chunk) / (bandwidth_kbps * 1024))
+
+    def print_summary(self):
+        """언론사별 응답 수, 상태 코드, 지연 분포 출력"""
+        if not self.latencies:
+            console.print("📭 처리한 요청이 없습니다")
+            return
+
+        table = Table(title="모의 언론사 서버 응답 통계")
+        table.add_column("호스트", style="cyan")
+        table.add_column("요청", justify="right")
+        table.add_column("상태 코드")
+        table.add_column("전송 (MB)", justify="right")
+        table.add_column("p50 (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+        table.add_column("p99 (ms)", justify="right")
+
+        for host in sorted(self.latencies):
+            samples = sorted(self.latencies[host])
+            pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]
+            statuses = ", ".join(f"{code}×{count}" for code, count in sorted(self.statuses[host].items()))
+            table.add_row(
+                host or "-", str(len(samples)), statuses, f"{self.bytes_sent[host] / 1024 / 1024:.1f}",
+                f"{pick(0.5):.0f}", f"{pick(0.95):.0f}", f"{pick(0.99):.0f}",
+            )
+        console.print(table)
+
+
+async def serve(server: MockOutletServer, host: str, port: int):
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    console.print(f"🧪 모의 언론사 서버 시작: http://{host}:{port} (응답 {len(server.index)}건)")
+    console.print(f"   크롤러 연결: python -m crawler.crawler_manager --mock-outlets http://{host}:{port}")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 픽스처를 재생하는 모의 언론사 서버")
+    parser.add_argument("--fixtures", default=MOCK_OUTLET_CONFIG["fixtures_dir"], help="픽스처 경로")
+    parser.add_argument("--host", default=MOCK_OUTLET_CONFIG["host"])
+    parser.add_argument("--port", type=int, default=MOCK_OUTLET_CONFIG["port"])
+    parser.add_argument("--latency-ms", type=float, help="기본 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, help="추가 지연 평균 (지수 분포)")
+    parser.add_argument("--bandwidth-kbps", type=float, help="연결당 전송 속도 제한 (0이면 무제한)")
+    parser.add_argument("--error-rate", type=float, help="500/503 응답 비율")
+    parser.add_argument("--throttle-rate", type=float, help="429 응답 비율")
+    parser.add_argument("--seed", type=int, help="지연/오류 난수 시드 (같은 시드면 같은 순서로 재현)")
+    args = parser.parse_args()
+
+    # 명령행에서 지정한 값만 설정 기본값을 덮어씀
+    config = dict(MOCK_OUTLET_CONFIG)
+    for key in _PROFILE_KEYS:
+        value = getattr(args, key, None)
+        if value is not None:
+            config[key] = value
+
+    index = FixtureIndex(os.path.join(PROJECT_ROOT, args.fixtures))
+    if not len(index):
+        console.print(f"❌ 재생할 응답이 없습니다: {args.fixtures} (--record-fixtures로 먼저 기록)")
+        sys.exit(1)
+
+    server = MockOutletServer(index, config, seed=args.seed)
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        console.print("⏹️ 모의 언론사 서버 종료")
+    finally:
+        server.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+오프라인 파싱 성능 측정 스크립트
+--record-fixtures로 기록한 픽스처를 사이트 접속 없이 재생해 파서 백엔드별 성능을 측정합니다.
+- 크롤러별: 기록된 본문 원문을 실제 파싱/추출 메서드(파싱 워커와 같은 경로)로 재생
+- 호스트별: 기록된 모든 HTML 응답(목록 페이지 포함)의 soup 생성 비용
+- 페이지/초는 메모리 추적 없이, 할당량/최대 메모리는 tracemalloc으로 따로 측정
+- --save로 기준 결과를 저장하고 --compare로 비교해 느려지면 종료 코드 1
+
+사용법:
+    python scripts/parse_benchmark.py fixtures/recorded
+    python scripts/parse_benchmark.py fixtures/recorded --backend lxml --save .cache/parse_baseline.json
+    python scripts/parse_benchmark.py fixtures/recorded --compare .cache/parse_baseline.json --tolerance 0.15
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from utils.fixtures import decode_body, iter_records, load_parse_inputs
+from utils.html_parser import BACKENDS, LXML_AVAILABLE, make_soup, use_backend
+from utils.parse_pool import ParseTask, SkipArticle, parse_in_worker
+
+console = Console()
+
+
+def _timed(run: Callable[[Any], Any], items: List[Any], repeat: int) -> float:
+    """반복 실행 중 가장 빠른 회차의 초당 처리 건수"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in items:
+            run(item)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(items) / best if best else 0.0
+
+
+def _traced(run: Callable[[Any], Any], items: List[Any]) -> Dict:
+    """페이지별 할당량(처리 중 최대 증가분) 평균과 가장 큰 페이지의 최대 증가분 측정"""
+    tracemalloc.start()
+    per_page = []
+    try:
+        for item in items:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            run(item)
+            per_page.append(tracemalloc.get_traced_memory()[1] - before)
+        peak = max(per_page, default=0)
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_kb": sum(per_page) / len(per_page) / 1024 if per_page else 0.0,
+        "peak_mb": peak / 1024 / 1024,
+    }
+
+
+def measure(run: Callable[[Any], Any], items: List[Any], repeat: int) -> Dict:
+    run(items[0])  # 선택자/정규식 컴파일 등 첫 호출 비용 제외
+    return {"pages": len(items), "pages_per_sec": _timed(run, items, repeat), **_traced(run, items)}
+
+
+def _replay(task: ParseTask, item) -> Optional[Dict]:
+    """기록된 입력 하나를 파싱 (제외 조건에 해당하는 기사도 같은 비용으로 측정)"""
+    try:
+        return parse_in_worker(task, dict(item[0]), item[1])
+    except SkipArticle:
+        return None
+
+
+def collector_cases(directory: str) -> Dict:
+    """크롤러별 파싱 재생 (항목 이름 → (실행 함수, 입력 목록))"""
+    cases = {}
+    for path in sorted(glob.glob(os.path.join(directory, "parse_inputs", "*.jsonl.gz"))):
+        try:
+            task, inputs = load_parse_inputs(path)
+        except (StopIteration, ImportError, AttributeError, ValueError) as e:
+            console.print(f"⚠️ {os.path.basename(path)} 읽기 실패: {str(e)[:60]}")
+            continue
+        if not inputs:
+            continue
+        # 재생 중 크롤러의 진행 로그는 숨김
+        module_console = getattr(sys.modules.get(task.cls.__module__), "console", None)
+        if module_console is not None:
+            module_console.quiet = True
+        label = f"{task.cls.__name__}.{task.method}"
+        cases[label] = (lambda item, task=task: _replay(task, item), inputs)
+    return cases
+
+
+def response_cases(directory: str) -> Dict:
+    """호스트별 HTML 응답 soup 생성 (목록/본문/기타 페이지 전체)"""
+    cases = {}
+    for path in sorted(glob.glob(os.path.join(directory, "responses", "*.jsonl.gz"))):
+        pages = [
+            decode_body(record) for record in iter_records(path)
+            if record.get("status") == 200
+            and "html" in {k.lower(): v for k, v in record.get("headers", {}).items()}.get("content-type", "")
+        ]
+        if pages:
+            host = os.path.basename(path)[:-len(".jsonl.gz")]
+            cases[f"soup:{host}"] = (lambda page: make_soup(page), pages)
+    return cases
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """기준 결과 대비 처리량이 허용 범위 이상 떨어진 항목"""
+    regressions = []
+    for key, stats in results.items():
+        base = baseline.get(key)
+        if not base or not base.get("pages_per_sec"):
+            continue
+        change = stats["pages_per_sec"] / base["pages_per_sec"] - 1
+        if change < -tolerance:
+            regressions.append(f"{key}: {base['pages_per_sec']:.1f} → {stats['pages_per_sec']:.1f} 페이지/초 ({change * 100:+.1f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 픽스처 파싱 성능 측정")
+    parser.add_argument("directory", help="--record-fixtures로 기록한 픽스처 경로")
+    parser.add_argument("--backend", action="append", choices=BACKENDS,
+                        help="측정할 파서 백엔드 (여러 번 지정 가능, 기본: 설치된 전체)")
+    parser.add_argument("--repeat", type=int, default=3, help="처리량 측정 반복 횟수 (가장 빠른 회차 사용)")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 항목만 측정")
+    parser.add_argument("--save", metavar="JSON", help="측정 결과를 기준값으로 저장")
+    parser.add_argument("--compare", metavar="JSON", help="저장된 기준값과 비교")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="허용 처리량 감소 비율 (기본 0.1 = 10%%)")
+    args = parser.parse_args()
+
+    directory = os.path.join(PROJECT_ROOT, args.directory)
+    backends = args.backend or [b for b in BACKENDS if b != "lxml" or LXML_AVAILABLE]
+    cases = {**collector_cases(directory), **response_cases(directory)}
+    if args.only:
+        cases = {label: case for label, case in cases.items() if args.only in label}
+    if not cases:
+        console.print(f"❌ 재생할 픽스처가 없습니다: {directory}")
+        sys.exit(1)
+
+    table = Table(title=f"파싱 성능 ({args.repeat}회 중 최고 처리량)")
+    table.add_column("항목", style="cyan")
+    table.add_column("백엔드")
+    table.add_column("페이지", justify="right")
+    table.add_column("페이지/초", justify="right")
+    table.add_column("페이지당 할당 (KB)", justify="right")
+    table.add_column("최대 메모리 (MB)", justify="right")
+
+    results = {}
+    for label, (run, items) in cases.items():
+        for backend in backends:
+            console.print(f"⏱️ {label} [{backend}] 측정 중... ({len(items)}페이지)")
+            with use_backend(backend):
+                try:
+                    stats = measure(run, items, args.repeat)
+                except Exception as e:
+                    console.print(f"❌ {label} [{backend}] 재생 실패: {str(e)[:80]}")
+                    continue
+            results[f"{label}|{backend}"] = stats
+            table.add_row(
+                label, backend, str(stats["pages"]), f"{stats['pages_per_sec']:.1f}",
+                f"{stats['alloc_kb']:.0f}", f"{stats['peak_mb']:.1f}",
+            )
+
+    console.print(table)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        console.print(f"💾 기준값 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            console.print(f"❌ 처리량 감소 {len(regressions)}건 (허용 {args.tolerance * 100:.0f}%)")
+            for line in regressions:
+                console.print(f"  - {line}")
+            sys.exit(1)
+        console.print("✅ 기준값 대비 처리량 감소 없음")
+
+
+if __name__ == "__main__":
+    main()
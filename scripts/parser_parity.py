@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 비교 스크립트
+각 크롤러의 본문 파싱(_parse_detail)을 html.parser / lxml 백엔드로 각각 실행하고
+추출 결과와 파싱 시간을 비교합니다.
+- --fixtures: --record-fixtures로 기록한 파싱 입력을 크롤러별로 재생 (사이트/DB 접속 없이 반복 실행 가능)
+- 기본: 언론사별로 최근 저장된 기사 페이지를 받아 비교 (현재 사이트 구조 확인용)
+- 모든 언론사에서 결과가 같아야 HTML_PARSER_CONFIG의 백엔드를 바꿀 수 있음
+- 결과가 다른 언론사가 있으면 종료 코드 1
+
+사용법:
+    python scripts/parser_parity.py --fixtures fixtures/recorded   # 기록된 픽스처 재생
+    python scripts/parser_parity.py                                # 전체 언론사, 언론사별 5개 기사
+    python scripts/parser_parity.py --outlets khan_politics hani_politics --samples 10
+"""
+
+import argparse
+import asyncio
+import copy
+import glob
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from crawler.registry import CRAWLER_REGISTRY, available_crawlers, load_crawler_class
+from utils.fixtures import load_parse_inputs
+from utils.http_client import open_client
+from utils.html_parser import BACKENDS, LXML_AVAILABLE, use_backend
+from utils.parse_pool import ParseTask, parse_in_worker
+
+console = Console()
+
+# 비교 대상 크롤러 (레지스트리 이름) - 본문 파싱이 HTML 문자열을 받는 크롤러만 대상
+# (조선일보는 API 응답을 파싱하므로 제외)
+OUTLETS = [name for name in available_crawlers() if name != "chosun_politics"]
+
+# 레지스트리 크롤러의 본문 파싱이 HTML이 아닌 경우, 같은 모듈에서 HTML을 파싱하는 클래스로 대체
+# (뉴시스 기본 크롤러는 브라우저 렌더링 결과를 파싱)
+HTML_PARSER_CLASSES = {
+    "newsis_politics": "NewsisFastCollector",
+}
+
+# 백엔드 간에 같아야 하는 필드
+COMPARED_FIELDS = ("content", "published_at")
+
+
+def _load_collector(key: str):
+    """크롤러 인스턴스와 모듈 생성 (파싱 로그는 출력하지 않음)"""
+    crawler_class = load_crawler_class(key)
+    module = sys.modules[crawler_class.__module__]
+    if key in HTML_PARSER_CLASSES:
+        crawler_class = getattr(module, HTML_PARSER_CLASSES[key])
+    module.console.quiet = True
+    return module, crawler_class()
+
+
+def _media_id(collector) -> Optional[Any]:
+    """크롤러가 저장하는 언론사 ID"""
+    if hasattr(collector, "initialize") and collector.initialize():
+        return collector.media_outlet["id"]
+    manager = getattr(collector, "supabase_manager", None) or getattr(collector, "supabase", None)
+    media_outlet = manager.get_media_outlet(getattr(collector, "media_name", "뉴시스"))
+    return media_outlet["id"] if media_outlet else None
+
+
+def _sample_articles(collector, samples: int) -> List[Dict]:
+    """최근 저장된 기사 제목/URL 조회"""
+    media_id = _media_id(collector)
+    if media_id is None:
+        return []
+    manager = getattr(collector, "supabase_manager", None) or getattr(collector, "supabase", None)
+    result = manager.client.table("articles").select("title, url, published_at") \
+        .eq("media_id", media_id).order("created_at", desc=True).limit(samples).execute()
+    return result.data or []
+
+
+def _parse(parse: Callable[[Dict, Any], Optional[Dict]], article: Dict, raw: Any,
+           backend: str) -> Tuple[Optional[Dict], float]:
+    """지정한 백엔드로 본문 파싱 후 (결과, 소요 시간 ms) 반환"""
+    started = time.perf_counter()
+    with use_backend(backend):
+        try:
+            parsed = parse(copy.deepcopy(article), raw)
+        except Exception as e:
+            parsed = {"error": f"{type(e).__name__}: {str(e)[:80]}"}
+    return parsed, (time.perf_counter() - started) * 1000
+
+
+def _compare_backends(report: Dict, parse: Callable[[Dict, Any], Optional[Dict]], article: Dict, raw: Any,
+                      backends: List[str]):
+    """기사 하나를 백엔드별로 파싱해 기준 백엔드(첫 번째)와 다른 필드를 보고서에 기록"""
+    results = {}
+    for backend in backends:
+        parsed, elapsed = _parse(parse, article, raw, backend)
+        results[backend] = parsed
+        report["ms"][backend] += elapsed
+    report["samples"] += 1
+
+    baseline = results[backends[0]] or {}
+    for backend in backends[1:]:
+        other = results[backend] or {}
+        for field in COMPARED_FIELDS + ("error",):
+            if baseline.get(field) != other.get(field):
+                report["mismatches"].append((article.get("url"), backend, field))
+
+
+def _crawler_name(task: ParseTask) -> str:
+    """파싱 작업의 크롤러 클래스를 레지스트리 이름으로 변환 (등록되지 않은 클래스는 클래스 이름)"""
+    for name, (module_path, class_name) in CRAWLER_REGISTRY.items():
+        if module_path == task.cls.__module__ and class_name == task.cls.__name__:
+            return name
+    return task.cls.__name__
+
+
+def check_fixtures(directory: str, backends: List[str], outlets: Optional[List[str]] = None) -> List[Dict]:
+    """기록된 파싱 입력 파일별 백엔드 비교 (파싱 워커와 같은 경로로 재생)"""
+    reports = []
+    for path in sorted(glob.glob(os.path.join(directory, "parse_inputs", "*.jsonl.gz"))):
+        try:
+            task, inputs = load_parse_inputs(path)
+        except (StopIteration, ImportError, AttributeError, ValueError) as e:
+            console.print(f"⚠️ {os.path.basename(path)} 읽기 실패: {str(e)[:60]}")
+            continue
+        name = _crawler_name(task)
+        if not inputs or (outlets and name not in outlets):
+            continue
+        # 재생 중 크롤러의 진행 로그는 숨김
+        module_console = getattr(sys.modules.get(task.cls.__module__), "console", None)
+        if module_console is not None:
+            module_console.quiet = True
+
+        console.print(f"🔍 {name} 픽스처 {len(inputs)}건 비교 중...")
+        report = {"outlet": f"{name}.{task.method}", "samples": 0, "mismatches": [], "ms": {b: 0.0 for b in backends}}
+        parse = lambda article, raw, task=task: parse_in_worker(task, article, raw)
+        for article, raw in inputs:
+            _compare_backends(report, parse, article, raw, backends)
+        reports.append(report)
+    return reports
+
+
+async def check_outlet(key: str, samples: int, backends: List[str]) -> Dict:
+    """한 언론사의 백엔드별 파싱 결과 비교"""
+    _, collector = _load_collector(key)
+    articles = _sample_articles(collector, samples)
+    report = {"outlet": key, "samples": 0, "mismatches": [], "ms": {b: 0.0 for b in backends}}
+
+    async with open_client(timeout=15.0) as client:
+        for article in articles:
+            try:
+                response = await client.get(article["url"], headers=getattr(collector, "headers", None))
+                response.raise_for_status()
+            except Exception as e:
+                console.print(f"⚠️ {key}: 기사 요청 실패 - {article['url']} ({str(e)[:50]})")
+                continue
+
+            _compare_backends(report, collector._parse_detail, article, response.text, backends)
+
+    return report
+
+
+def print_reports(reports: List[Dict], backends: List[str]):
+    table = Table(title="HTML 파서 백엔드 비교")
+    table.add_column("언론사", style="cyan")
+    table.add_column("기사", justify="right")
+    for backend in backends:
+        table.add_column(f"{backend} (ms/건)", justify="right")
+    table.add_column("속도 향상", justify="right")
+    table.add_column("불일치", justify="right")
+
+    for report in reports:
+        n = report["samples"] or 1
+        times = [report["ms"][b] / n for b in backends]
+        speedup = f"{times[0] / times[-1]:.1f}x" if times[-1] else "-"
+        mismatch = len(report["mismatches"])
+        table.add_row(
+            report["outlet"], str(report["samples"]),
+            *[f"{t:.1f}" for t in times], speedup,
+            f"[red]{mismatch}[/red]" if mismatch else "[green]0[/green]",
+        )
+    console.print(table)
+
+    for report in reports:
+        for url, backend, field in report["mismatches"][:5]:
+            console.print(f"❌ {report['outlet']}: {backend}의 {field} 결과가 다름 - {url}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드별 본문 추출 결과 비교")
+    parser.add_argument("--outlets", nargs="+", choices=OUTLETS, help="비교할 언론사 (기본: 전체)")
+    parser.add_argument("--samples", type=int, default=5, help="언론사별 비교할 기사 수 (사이트 비교)")
+    parser.add_argument("--fixtures", metavar="DIR", help="--record-fixtures로 기록한 픽스처 경로 (오프라인 재생)")
+    args = parser.parse_args()
+
+    if not LXML_AVAILABLE:
+        console.print("❌ lxml이 설치되어 있지 않습니다: pip install lxml")
+        sys.exit(1)
+
+    # 기준 백엔드(html.parser)를 먼저 실행
+    backends = ["html.parser"] + [b for b in BACKENDS if b != "html.parser"]
+    if args.fixtures:
+        reports = check_fixtures(os.path.join(PROJECT_ROOT, args.fixtures), backends, args.outlets)
+        if not reports:
+            console.print(f"❌ 재생할 파싱 입력이 없습니다: {args.fixtures}")
+            sys.exit(1)
+        print_reports(reports, backends)
+        if any(report["mismatches"] for report in reports):
+            sys.exit(1)
+        return
+
+    reports = []
+    for key in args.outlets or list(OUTLETS):
+        console.print(f"🔍 {key} 비교 중...")
+        try:
+            reports.append(await check_outlet(key, args.samples, backends))
+        except Exception as e:
+            console.print(f"❌ {key} 비교 실패: {str(e)[:80]}")
+
+    print_reports(reports, backends)
+    if any(report["mismatches"] for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,6 +6,7 @@
 - UMAP 차원축소 + HDBSCAN 클러스터링
 - 카테고리별 상위 3개 클러스터를 issues 테이블에 저장 (20개 기사 이상만)
 - 하이브리드 처리: 대용량 순차, 소량 병렬
+- 유사 중복 기사는 대표 기사와 같은 이슈로 연결하고 언론사 성향 집계에도 포함
 """
 
 import sys
@@ -56,6 +57,9 @@ class MultiCategoryClusterer:
             console.print(f"❌ OpenAI 클라이언트 초기화 실패: {str(e)}")
             raise Exception("OpenAI 연결 실패")
         
+        # 유사 중복 기사 (대표 기사 URL → 중복 기사 목록, 카테고리별 기사 조회 시 해당 기사분만 채움)
+        self.duplicates_by_canonical: Dict[str, List[Dict[str, Any]]] = {}
+        
         # 정치 카테고리 정의
         self.categories = {
             # 대용량 카테고리 (순차 처리)
@@ -79,7 +83,7 @@ class MultiCategoryClusterer:
             
             while True:
                 result = self.supabase_manager.client.table('articles').select(
-                    'id, title, media_id, political_category, embedding, published_at'
+                    'id, url, title, media_id, political_category, embedding, published_at'
                 ).eq('political_category', category).not_.is_('embedding', 'null').range(
                     offset, offset + page_size - 1
                 ).execute()
@@ -96,6 +100,15 @@ class MultiCategoryClusterer:
                 console.print(f"📄 페이지 조회 중... {len(all_articles)}개 수집됨")
             
             console.print(f"✅ {category} 카테고리 기사 {len(all_articles)}개 조회 완료")
+            
+            # 이 기사들을 대표로 하는 유사 중복 연결만 조회
+            links = self.supabase_manager.fetch_duplicate_links(
+                [a['url'] for a in all_articles if a.get('url')], column='canonical_url'
+            )
+            for link in links:
+                self.duplicates_by_canonical.setdefault(link['canonical_url'], []).append(link)
+            if links:
+                console.print(f"✅ 유사 중복 연결 {len(links)}개 조회 완료")
             return all_articles
             
         except Exception as e:
@@ -197,20 +210,11 @@ class MultiCategoryClusterer:
             return np.array([])
     
     def get_media_bias_mapping(self) -> Dict[str, str]:
-        """언론사 ID별 bias 매핑 조회"""
-        try:
-            result = self.supabase_manager.client.table('media_outlets').select('id, bias').execute()
-            
-            bias_mapping = {}
-            for outlet in result.data:
-                bias_mapping[outlet['id']] = outlet['bias']
-            
+        """언론사 ID별 bias 매핑 조회 (프로세스 공용 캐시 사용)"""
+        bias_mapping = self.supabase_manager.get_media_bias_mapping()
+        if bias_mapping:
             console.print(f"✅ 언론사 bias 매핑 {len(bias_mapping)}개 조회 완료")
-            return bias_mapping
-            
-        except Exception as e:
-            console.print(f"❌ 언론사 bias 매핑 조회 실패: {str(e)}")
-            return {}
+        return bias_mapping
     
     def generate_dynamic_patterns_with_llm(self, cluster_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """LLM을 활용한 동적 사건 패턴 생성"""
@@ -648,13 +652,21 @@ JSON 형태로 응답해주세요:
             console.print(f"\n🔄 2.3단계: 소그룹 재병합")
             final_groups = self.merge_similar_subgroups(all_subgroups)
             
-            # 언론사별 bias 통계 계산
+            # 언론사별 bias 통계 계산 (대표 기사에 연결된 유사 중복 기사의 언론사도 포함)
+            # 통신사 기사를 거의 그대로 실은 언론사도 그 이슈를 보도한 것이므로, 중복 기사는 임베딩/클러스터링만
+            # 건너뛰고 성향 집계에서는 게재한 언론사마다 한 번씩 셈 (중복을 빼면 통신사 기사를 받아 쓴 언론사의 보도가 누락됨)
+            bias_by_id = {str(k): v for k, v in bias_mapping.items()}
             for group in final_groups:
                 bias_counts = {'left': 0, 'center': 0, 'right': 0}
-                for article in group['articles']:
-                    media_id = article.get('media_id')
-                    if media_id and media_id in bias_mapping:
-                        bias = bias_mapping[media_id]
+                group['duplicates'] = [
+                    duplicate for article in group['articles']
+                    for duplicate in self.duplicates_by_canonical.get(article.get('url'), [])
+                ]
+                # 중복 연결의 media_id는 문자열로 저장되므로 문자열 키로 비교
+                media_ids = [a.get('media_id') for a in group['articles']] + [d.get('media_id') for d in group['duplicates']]
+                for media_id in media_ids:
+                    if media_id and str(media_id) in bias_by_id:
+                        bias = bias_by_id[str(media_id)]
                         if bias in bias_counts:
                             bias_counts[bias] += 1
                 
@@ -701,7 +713,8 @@ JSON 형태로 응답해주세요:
                 result.append({
                     'cluster_id': group.get('group_id', f'final_{i}'),
                     'articles': group['articles'],
-                    'total_articles': group['article_count'],
+                    'duplicates': group['duplicates'],
+                    'total_articles': group['article_count'] + len(group['duplicates']),
                     'title': group['title'],
                     'left_source': group['left_source'],
                     'center_source': group['center_source'],
@@ -754,27 +767,28 @@ JSON 형태로 응답해주세요:
     
     def update_articles_with_issue_ids(self, top_clusters: List[Dict[str, Any]], 
                                      issue_ids: List[str]) -> int:
-        """클러스터 소속 기사들에 issue_id 업데이트"""
+        """클러스터 소속 기사들에 issue_id 업데이트 (클러스터별로 묶어서 요청)"""
         try:
             console.print("🔄 기사들에 issue_id 업데이트 중...")
             
             total_updated = 0
+            chunk_size = 100
             
             for cluster, issue_id in zip(top_clusters, issue_ids):
-                cluster_articles = cluster['articles']
+                article_ids = [article['id'] for article in cluster['articles']]
+                # 유사 중복 기사도 대표 기사와 같은 이슈로 연결
+                duplicate_urls = [duplicate['url'] for duplicate in cluster.get('duplicates', [])]
                 updated_count = 0
                 
-                for article in cluster_articles:
-                    try:
-                        result = self.supabase_manager.client.table('articles').update({
-                            'issue_id': issue_id
-                        }).eq('id', article['id']).execute()
-                        
-                        if result.data:
-                            updated_count += 1
-                        
-                    except Exception as e:
-                        console.print(f"❌ 기사 업데이트 실패: {article.get('id', 'Unknown')} - {str(e)}")
+                for column, values in (('id', article_ids), ('url', duplicate_urls)):
+                    for start in range(0, len(values), chunk_size):
+                        try:
+                            result = self.supabase_manager.client.table('articles').update({
+                                'issue_id': issue_id
+                            }).in_(column, values[start:start + chunk_size]).execute()
+                            updated_count += len(result.data or [])
+                        except Exception as e:
+                            console.print(f"❌ 기사 업데이트 실패 ({column} {len(values[start:start + chunk_size])}개): {str(e)}")
                 
                 total_updated += updated_count
                 console.print(f"✅ 클러스터 {cluster['cluster_id']}: {updated_count}개 기사 업데이트")
@@ -5,6 +5,7 @@
 - 리드문단만을 대상으로 임베딩 생성 (편향성 제거)
 - articles 테이블의 embedding 컬럼에 저장
 - 배치 처리로 효율성 향상
+- 유사 중복 기사(통신사 기사 재게재)는 대표 기사만 임베딩 (article_duplicates 테이블)
 """
 
 import time
@@ -57,8 +58,10 @@ class EmbeddingGenerator:
             
             while True:
                 result = self.supabase_manager.client.table('articles').select(
-                    'id, title, lead_paragraph, political_category'
-                ).eq('is_preprocessed', True).is_('embedding', 'null').range(offset, offset + page_size - 1).execute()
+                    'id, url, title, lead_paragraph, political_category'
+                ).eq('is_preprocessed', True).is_('embedding', 'null').eq('is_duplicate', False).range(
+                    offset, offset + page_size - 1
+                ).execute()
                 
                 if not result.data:
                     break
@@ -72,6 +75,17 @@ class EmbeddingGenerator:
                 offset += page_size
                 print(f"📄 페이지 조회 중... {len(all_articles)}개 수집됨")
             
+            # 유사 중복 기사는 대표 기사의 임베딩/클러스터 결과를 따르므로 건너뜀
+            # (전처리에서 is_duplicate로 표시된 중복은 위 조회에서 빠지고, 표시 전에 전처리된 중복은
+            #  여기서 찾아 표시해 다음 실행부터 조회하지 않음)
+            links = self.supabase_manager.fetch_duplicate_links([a['url'] for a in all_articles if a.get('url')])
+            duplicate_urls = {link['url'] for link in links}
+            if duplicate_urls:
+                duplicates = [a for a in all_articles if a.get('url') in duplicate_urls]
+                all_articles = [a for a in all_articles if a.get('url') not in duplicate_urls]
+                marked = self.supabase_manager.mark_duplicate_articles([a['id'] for a in duplicates])
+                print(f"⏭️ 유사 중복 기사 {len(duplicates)}개 제외 ({marked}개 중복 표시)")
+            
             print(f"🔍 조회된 미처리 임베딩 기사 수: {len(all_articles)}개")
             return all_articles
             
@@ -77,19 +77,14 @@ class PerspectiveGenerator:
                 console.print(f"⚠️ 이슈 {issue_id}에 기사가 없습니다.")
                 return []
             
-            # 2. 언론사 bias 정보 조회
-            media_result = self.supabase_manager.client.table('media_outlets').select(
-                'id, bias'
-            ).execute()
+            # 2. 언론사 bias 매핑 조회 (프로세스 공용 캐시 사용)
+            bias_mapping = self.supabase_manager.get_media_bias_mapping()
             
-            if not media_result.data:
+            if not bias_mapping:
                 console.print("❌ 언론사 정보를 찾을 수 없습니다.")
                 return []
             
-            # 3. bias 매핑 생성
-            bias_mapping = {outlet['id']: outlet['bias'] for outlet in media_result.data}
-            
-            # 4. 해당 성향 기사만 필터링
+            # 3. 해당 성향 기사만 필터링
             filtered_articles = []
             for article in all_articles_result.data:
                 media_id = article.get('media_id')
@@ -199,7 +199,7 @@ class FastPreprocessor:
             
             while True:
                 result = self.supabase_manager.client.table('articles').select(
-                    'id, title, content, media_id, published_at, is_preprocessed'
+                    'id, url, title, content, media_id, published_at, is_preprocessed'
                 ).eq('is_preprocessed', False).range(offset, offset + page_size - 1).execute()
                 
                 if not result.data:
@@ -214,6 +214,15 @@ class FastPreprocessor:
                 offset += page_size
                 print(f"📄 페이지 조회 중... {len(all_articles)}개 수집됨")
             
+            # 유사 중복 기사(대표 기사에 연결된 통신사 재게재)는 대표 기사만 전처리
+            links = self.supabase_manager.fetch_duplicate_links([a['url'] for a in all_articles if a.get('url')])
+            duplicate_urls = {link['url'] for link in links}
+            if duplicate_urls:
+                duplicates = [a for a in all_articles if a.get('url') in duplicate_urls]
+                all_articles = [a for a in all_articles if a.get('url') not in duplicate_urls]
+                marked = self.mark_duplicates_processed(duplicates)
+                print(f"⏭️ 유사 중복 기사 {len(duplicates)}개 제외 ({marked}개 처리 완료 표시)")
+            
             print(f"🔍 조회된 false 기사 수: {len(all_articles)}개")
             return all_articles
             
@@ -222,6 +231,18 @@ class FastPreprocessor:
             return []
     
     
+    def mark_duplicates_processed(self, duplicates: List[Dict[str, Any]]) -> int:
+        """
+        유사 중복 기사를 처리 완료로 표시 (다음 실행에서 본문까지 다시 조회하지 않도록)
+        
+        is_duplicate도 함께 표시하므로 임베딩 단계의 조회 대상에서도 빠집니다.
+        """
+        return self.supabase_manager.mark_duplicate_articles(
+            [article['id'] for article in duplicates],
+            fields={'is_preprocessed': True, 'preprocessed_at': datetime.now().isoformat()},
+            chunk_size=self.batch_size,
+        )
+    
     def update_articles_batch(self, updates: List[Dict[str, Any]]) -> int:
         """배치로 기사 업데이트"""
         if not updates:
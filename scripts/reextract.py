@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+보관된 원문 재추출 스크립트
+원문 보관소(.cache/archive)에 저장된 상세 페이지를 현재 크롤러 코드로 다시 파싱합니다.
+선택자를 고친 뒤 사이트를 다시 수집하지 않고 지난 기사 본문을 복구할 때 사용합니다.
+- 파싱은 프로세스 풀에서 병렬 실행 (파이프라인 파싱 워커와 같은 경로, 네트워크 요청 없음)
+- 기본은 결과만 집계 (DB 변경 없음), --update로 DB 반영
+  - 이미 저장된 기사: 본문(content)과 발행시간(published_at) 갱신
+  - 저장되지 않은 기사(당시 추출 실패): 크롤러의 저장 메서드로 새로 저장
+
+사용법:
+    python scripts/reextract.py --outlet hani_politics --since 2026-09-01 --show 3
+    python scripts/reextract.py --outlet hani_politics --since 2026-09-01 --update
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from utils.parse_pool import ParseTask, SkipArticle, parse_in_worker
+from utils.raw_archive import RawArchive, close_raw_archive, decode_raw, read_object
+from utils.near_duplicate import close_near_duplicate_index
+
+console = Console()
+
+_UPDATE_CHUNK = 100
+
+
+def reextract_page(task: ParseTask, page: Dict) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """워커 프로세스: 원문 압축 해제 후 파싱 (URL, 결과, 오류)"""
+    # 재추출 중 크롤러의 기사별 진행 로그는 숨김
+    module_console = getattr(sys.modules.get(task.cls.__module__), "console", None)
+    if module_console is not None:
+        module_console.quiet = True
+    try:
+        raw = decode_raw(page["kind"], read_object(page["path"]))
+        return page["url"], parse_in_worker(task, dict(page["article"]), raw), None
+    except SkipArticle:
+        # 크롤러의 제외 조건에 해당하는 기사는 빈 결과로 집계
+        return page["url"], None, None
+    except Exception as e:
+        return page["url"], None, f"{type(e).__name__}: {str(e)[:80]}"
+
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+    return datetime.strptime(value, "%Y-%m-%d").timestamp() if value else None
+
+
+def run_reextract(archive: RawArchive, pages: List[Dict], workers: Optional[int]) -> Dict[str, Dict]:
+    """
+    보관된 페이지를 병렬로 재추출
+
+    Returns:
+        Dict[str, Dict]: 언론사별 결과 (stats: ok/empty/error 수, articles: 추출된 기사, errors: 오류 예시)
+    """
+    tasks = archive.tasks()
+    results: Dict[str, Dict] = defaultdict(lambda: {"stats": Counter(), "articles": [], "errors": []})
+
+    jobs = []
+    for page in pages:
+        task = tasks.get((page["outlet"], page["method"]))
+        if task is None:
+            results[page["outlet"]]["stats"]["no_task"] += 1
+            continue
+        jobs.append((task, page))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(page["outlet"], pool.submit(reextract_page, task, page)) for task, page in jobs]
+        for outlet, future in futures:
+            url, article, error = future.result()
+            result = results[outlet]
+            if error:
+                result["stats"]["error"] += 1
+                if len(result["errors"]) < 3:
+                    result["errors"].append(f"{url}: {error}")
+            elif article and article.get("content"):
+                result["stats"]["ok"] += 1
+                result["articles"].append(article)
+            else:
+                result["stats"]["empty"] += 1
+    return dict(results)
+
+
+def apply_updates(outlet: str, articles: List[Dict], save_method: Optional[str]) -> Counter:
+    """재추출 결과를 DB에 반영 (기존 기사는 본문 갱신, 없는 기사는 크롤러 저장 메서드로 저장)"""
+    from crawler.registry import load_crawler_class
+    from utils.supabase_manager import get_supabase_client
+
+    stats = Counter()
+    manager = get_supabase_client()
+    if not manager.client:
+        console.print("❌ Supabase에 연결할 수 없어 DB를 갱신하지 않습니다")
+        return stats
+
+    existing = set()
+    urls = [article["url"] for article in articles]
+    for start in range(0, len(urls), _UPDATE_CHUNK):
+        result = manager.client.table('articles').select('url').in_(
+            'url', urls[start:start + _UPDATE_CHUNK]
+        ).execute()
+        existing.update(row['url'] for row in result.data or [])
+
+    new_articles = []
+    for article in articles:
+        if article["url"] not in existing:
+            new_articles.append(article)
+            continue
+        update = {"content": article["content"]}
+        if article.get("published_at"):
+            update["published_at"] = article["published_at"]
+        try:
+            manager.client.table('articles').update(update).eq('url', article["url"]).execute()
+            stats["updated"] += 1
+        except Exception as e:
+            stats["update_failed"] += 1
+            console.print(f"⚠️ 본문 갱신 실패: {article['url']} - {str(e)[:60]}")
+
+    if new_articles:
+        if not save_method:
+            console.print(f"⚠️ {outlet}: 저장 메서드 기록이 없어 새 기사 {len(new_articles)}개를 저장하지 않습니다")
+            stats["not_saved"] += len(new_articles)
+            return stats
+        try:
+            crawler = load_crawler_class(outlet)()
+        except ValueError as e:
+            console.print(f"⚠️ {e}")
+            stats["not_saved"] += len(new_articles)
+            return stats
+        statuses = getattr(crawler, save_method)(new_articles)
+        stats["inserted"] += statuses.count("inserted") if isinstance(statuses, list) else 0
+    return stats
+
+
+def print_results(results: Dict[str, Dict], updates: Dict[str, Counter], show: int):
+    table = Table(title="원문 재추출 결과")
+    table.add_column("언론사", style="cyan")
+    table.add_column("추출 성공", justify="right", style="green")
+    table.add_column("본문 없음", justify="right", style="yellow")
+    table.add_column("오류", justify="right", style="red")
+    table.add_column("파서 없음", justify="right")
+    if updates:
+        table.add_column("본문 갱신", justify="right")
+        table.add_column("새로 저장", justify="right")
+
+    for outlet, result in sorted(results.items()):
+        stats = result["stats"]
+        row = [outlet, str(stats["ok"]), str(stats["empty"]), str(stats["error"]), str(stats["no_task"])]
+        if updates:
+            update = updates.get(outlet, Counter())
+            row += [str(update["updated"]), str(update["inserted"])]
+        table.add_row(*row)
+    console.print(table)
+
+    for outlet, result in sorted(results.items()):
+        for error in result["errors"]:
+            console.print(f"❌ {outlet} {error}")
+        for article in result["articles"][:show]:
+            console.print(f"📰 {outlet} {article.get('title', '')[:40]} ({len(article['content'])}자)")
+            console.print(f"   {article['content'][:200]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 원문을 현재 추출 코드로 다시 파싱")
+    parser.add_argument("--outlet", action="append", help="재추출할 크롤러 이름 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--since", help="이 날짜 이후 수집한 원문만 (YYYY-MM-DD)")
+    parser.add_argument("--until", help="이 날짜 이전 수집한 원문만 (YYYY-MM-DD, 해당 날짜 제외)")
+    parser.add_argument("--all-versions", action="store_true", help="URL별 최신 원문뿐 아니라 모든 수집본 재추출")
+    parser.add_argument("--workers", type=int, help="파싱 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--limit", type=int, help="재추출할 최대 페이지 수")
+    parser.add_argument("--update", action="store_true", help="재추출 결과를 DB에 반영")
+    parser.add_argument("--show", type=int, default=0, help="언론사별로 추출 결과 N개 미리보기")
+    args = parser.parse_args()
+
+    if args.update and args.all_versions:
+        parser.error("--update는 URL별 최신 원문으로만 실행할 수 있습니다 (--all-versions 제외)")
+
+    archive = RawArchive()
+    try:
+        pages = list(archive.iter_pages(
+            outlets=args.outlet, since=_parse_date(args.since), until=_parse_date(args.until),
+            latest_only=not args.all_versions,
+        ))
+        if args.limit:
+            pages = pages[:args.limit]
+        if not pages:
+            console.print("📭 조건에 맞는 보관 원문이 없습니다")
+            return
+
+        console.print(f"🔁 보관 원문 {len(pages)}개 재추출 시작")
+        started = time.perf_counter()
+        results = run_reextract(archive, pages, args.workers)
+        elapsed = time.perf_counter() - started
+        console.print(f"⏱️ {elapsed:.1f}초 ({len(pages) / elapsed:.1f} 페이지/초)")
+
+        updates: Dict[str, Counter] = {}
+        if args.update:
+            savers = archive.savers()
+            for outlet, result in sorted(results.items()):
+                if result["articles"]:
+                    updates[outlet] = apply_updates(outlet, result["articles"], savers.get(outlet))
+        print_results(results, updates, args.show)
+    finally:
+        archive.close()
+        # 저장 메서드가 맡긴 유사 중복 연결 작업까지 끝낸 뒤 종료
+        close_raw_archive()
+        close_near_duplicate_index()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+-- 유사 중복 기사(통신사 기사 재게재) 연결 (utils/near_duplicate.py, NEAR_DUP_CONFIG["table"])
+-- Supabase SQL Editor에서 한 번 실행
+
+create table if not exists article_duplicates (
+    url text primary key,
+    canonical_url text not null,
+    media_id text,
+    canonical_media_id text,
+    distance integer,
+    title_match boolean,
+    created_at timestamptz default now()
+);
+create index if not exists article_duplicates_canonical_url_idx on article_duplicates (canonical_url);
+
+-- 대표 기사에 연결된 중복 기사 표시 (전처리 단계에서 설정, 임베딩 조회 대상에서 제외)
+alter table articles add column if not exists is_duplicate boolean not null default false;
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+공유 Playwright 브라우저 풀
+CrawlerManager가 하나의 Chromium을 소유하고 Playwright 크롤러들에 주입합니다.
+- 브라우저 1개 + 재사용 가능한 컨텍스트/페이지 묶음
+- 요청 가로채기로 이미지/폰트/미디어/광고 등 문서 외 리소스 차단
+- 페이지는 제한된 풀에서 대여/반납 (동시 렌더링 수 제한)
+"""
+
+import asyncio
+import sys
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import BROWSER_POOL_CONFIG
+
+console = Console()
+
+
+class BrowserPool:
+    """컨텍스트와 페이지를 재사용하는 Chromium 풀"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**BROWSER_POOL_CONFIG, **(config or {})}
+        self._playwright = None
+        self._browser = None
+        self._contexts: List = []
+        self._pages: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+
+        # 통계
+        self.blocked_requests = 0
+        self.pages_served = 0
+
+    @property
+    def size(self) -> int:
+        """동시에 대여 가능한 페이지 수"""
+        return self.config["contexts"] * self.config["pages_per_context"]
+
+    async def start(self):
+        """브라우저 실행 및 페이지 풀 준비 (처음 사용할 때 한 번만)"""
+        async with self._start_lock:
+            if self._browser:
+                return
+
+            # Playwright는 브라우저가 실제로 필요할 때만 import (크롤러 모듈 import 비용 절감)
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.config["headless"],
+                args=self.config["launch_args"],
+            )
+
+            self._pages = asyncio.Queue()
+            for _ in range(self.config["contexts"]):
+                context = await self._new_context()
+                self._contexts.append(context)
+                for _ in range(self.config["pages_per_context"]):
+                    self._pages.put_nowait(await context.new_page())
+
+            console.print(f"🌐 브라우저 풀 시작 (컨텍스트 {self.config['contexts']}개, 페이지 {self.size}개)")
+
+    async def _new_context(self):
+        """리소스 차단 규칙이 적용된 브라우저 컨텍스트 생성"""
+        context = await self._browser.new_context(viewport=self.config["viewport"])
+        context.set_default_navigation_timeout(self.config["navigation_timeout"])
+        await context.route("**/*", self._handle_route)
+        return context
+
+    async def _handle_route(self, route):
+        """문서/스크립트 등 본문 추출에 필요한 요청만 통과"""
+        request = route.request
+        if request.resource_type in self.config["blocked_resource_types"] or \
+                any(pattern in request.url for pattern in self.config["blocked_url_patterns"]):
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        풀에서 페이지를 대여하고 사용 후 반납
+
+        Yields:
+            Page: 재사용되는 Playwright 페이지
+        """
+        await self.start()
+        page = await self._pages.get()
+        try:
+            # 이전 사용 중 닫힌 페이지는 같은 컨텍스트에서 새로 생성
+            if page.is_closed():
+                page = await page.context.new_page()
+            self.pages_served += 1
+            yield page
+        finally:
+            self._pages.put_nowait(page)
+
+    async def close(self):
+        """브라우저 및 Playwright 종료"""
+        try:
+            for context in self._contexts:
+                await context.close()
+            self._contexts = []
+            if self._browser:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+            if self.pages_served:
+                console.print(f"🧹 브라우저 풀 정리 완료 (페이지 {self.pages_served}회 사용, 차단 요청 {self.blocked_requests}개)")
+        except Exception as e:
+            console.print(f"⚠️ 브라우저 풀 정리 중 오류: {str(e)[:50]}")
+
+
+@asynccontextmanager
+async def open_browser_pool(shared_pool: Optional[BrowserPool] = None):
+    """
+    공유 브라우저 풀이 있으면 그대로 사용하고, 없으면 임시 풀 생성
+
+    Args:
+        shared_pool: CrawlerManager가 주입한 브라우저 풀
+
+    Yields:
+        BrowserPool: 페이지를 대여할 풀
+    """
+    if shared_pool is not None:
+        yield shared_pool
+        return
+
+    pool = BrowserPool()
+    try:
+        yield pool
+    finally:
+        await pool.close()
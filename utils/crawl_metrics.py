@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+크롤링 단계별 지표 수집 / 실행 보고서 출력
+언론사별로 어느 단계에서 시간이 쓰였는지와 요청/저장 결과를 모아 JSON과 Prometheus 텍스트 파일로 남깁니다.
+- 단계: list(목록 수집), dedup(기존 기사 확인), fetch(본문 요청), parse(파싱), save(DB 저장)
+  (단계 시간은 워커별 소요 시간의 합계이므로 동시에 실행된 만큼 실제 경과 시간보다 클 수 있음)
+- HTTP: 요청 수, 수신 바이트, 재시도, 캐시(304) 재사용, 오류 응답
+- 기사: 발견/재개/기존 기사 건너뜀/요청 실패/파싱 실패/저장/저장 실패
+- CrawlerManager가 크롤러 실행마다 current_outlet을 지정하므로 공유 클라이언트 요청도 언론사별로 집계
+"""
+
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# 현재 실행 중인 크롤러 이름 (CrawlerManager가 크롤러 작업마다 지정, 하위 작업에 상속)
+current_outlet: ContextVar[Optional[str]] = ContextVar("current_outlet", default=None)
+
+PHASES = ("list", "dedup", "fetch", "parse", "save")
+
+
+class OutletMetrics:
+    """언론사 하나의 단계별 시간과 카운터"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.phase_seconds: Counter = Counter()
+        self.phase_calls: Counter = Counter()
+        self.phase_max: Dict[str, float] = {}
+        self.counters: Counter = Counter()
+
+    def observe(self, phase: str, seconds: float):
+        """단계 1회 소요 시간 기록"""
+        self.phase_seconds[phase] += seconds
+        self.phase_calls[phase] += 1
+        if seconds > self.phase_max.get(phase, 0.0):
+            self.phase_max[phase] = seconds
+
+    def count(self, key: str, amount: int = 1):
+        self.counters[key] += amount
+
+    def to_dict(self) -> Dict:
+        return {
+            "phases": {
+                phase: {
+                    "seconds": round(self.phase_seconds[phase], 4),
+                    "calls": self.phase_calls[phase],
+                    "max_seconds": round(self.phase_max.get(phase, 0.0), 4),
+                }
+                for phase in PHASES if self.phase_calls[phase]
+            },
+            "counters": dict(self.counters),
+        }
+
+
+class CrawlMetrics:
+    """실행 전체의 언론사별 지표 모음"""
+
+    def __init__(self):
+        self.outlets: Dict[str, OutletMetrics] = {}
+
+    def outlet(self, name: Optional[str] = None) -> OutletMetrics:
+        """언론사 지표 반환 (이름이 없으면 현재 실행 중인 크롤러)"""
+        name = name or current_outlet.get() or "-"
+        metrics = self.outlets.get(name)
+        if metrics is None:
+            metrics = OutletMetrics(name)
+            self.outlets[name] = metrics
+        return metrics
+
+    def reset(self):
+        self.outlets.clear()
+
+    def to_dict(self) -> Dict:
+        return {name: metrics.to_dict() for name, metrics in sorted(self.outlets.items())}
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """요청 수/수신 바이트/재시도/캐시 재사용을 현재 언론사 지표에 기록하는 전송 계층 래퍼"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: "CrawlMetrics"):
+        self._transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        outlet = self.metrics.outlet()
+        outlet.count("http_requests")
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            outlet.count("http_errors")
+            raise
+        finally:
+            # 재시도 횟수는 RetryingTransport가 요청 확장 정보에 남김
+            outlet.count("http_retries", request.extensions.get("retries", 0))
+
+        if response.extensions.get("from_cache"):
+            outlet.count("http_cache_hits")
+            return response
+        if response.status_code >= 400:
+            outlet.count("http_errors")
+        # 안쪽 계층(속도 제한기 등)이 이미 본문을 읽었으면 스트림을 다시 감싸지 않고 읽은 크기를 기록
+        if response.is_stream_consumed:
+            outlet.count("http_bytes", response.num_bytes_downloaded or len(response.content))
+            return response
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, outlet),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """응답 본문을 읽는 동안 수신 바이트 집계 (압축된 전송 크기 기준)"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, outlet: OutletMetrics):
+        self._stream = stream
+        self._outlet = outlet
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._outlet.count("http_bytes", len(chunk))
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+async def timed_iter(iterator: AsyncIterator, outlet: OutletMetrics, phase: str) -> AsyncIterator:
+    """비동기 이터레이터의 다음 항목을 기다린 시간을 단계 시간으로 기록"""
+    iterator = iterator.__aiter__()
+    while True:
+        started = time.perf_counter()
+        try:
+            item = await iterator.__anext__()
+        except StopAsyncIteration:
+            outlet.observe(phase, time.perf_counter() - started)
+            return
+        outlet.observe(phase, time.perf_counter() - started)
+        yield item
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus(report: Dict) -> str:
+    """
+    실행 보고서를 Prometheus 텍스트 형식으로 변환 (node_exporter textfile collector용)
+
+    배치 실행마다 새로 쓰는 파일이므로 모든 값은 "마지막 실행" 기준 게이지로 내보냅니다.
+    """
+    lines = [
+        "# HELP crawler_phase_seconds Worker seconds spent per crawl phase in the last run.",
+        "# TYPE crawler_phase_seconds gauge",
+    ]
+    outlets = report["outlets"]
+    for name, data in outlets.items():
+        for phase, stats in data["metrics"].get("phases", {}).items():
+            lines.append(f'crawler_phase_seconds{{outlet="{_escape(name)}",phase="{phase}"}} {stats["seconds"]}')
+    lines += ["# HELP crawler_phase_calls Calls per crawl phase in the last run.", "# TYPE crawler_phase_calls gauge"]
+    for name, data in outlets.items():
+        for phase, stats in data["metrics"].get("phases", {}).items():
+            lines.append(f'crawler_phase_calls{{outlet="{_escape(name)}",phase="{phase}"}} {stats["calls"]}')
+    lines += ["# HELP crawler_events Article and HTTP counts per outlet in the last run.", "# TYPE crawler_events gauge"]
+    for name, data in outlets.items():
+        for key, value in sorted(data["metrics"].get("counters", {}).items()):
+            lines.append(f'crawler_events{{outlet="{_escape(name)}",event="{key}"}} {value}')
+    lines += ["# HELP crawler_run_duration_seconds Wall-clock duration of the last run per outlet.",
+              "# TYPE crawler_run_duration_seconds gauge"]
+    for name, data in outlets.items():
+        if data.get("duration") is not None:
+            lines.append(f'crawler_run_duration_seconds{{outlet="{_escape(name)}"}} {data["duration"]}')
+    lines += ["# HELP crawler_run_success Whether the last run of the outlet succeeded.",
+              "# TYPE crawler_run_success gauge"]
+    for name, data in outlets.items():
+        lines.append(f'crawler_run_success{{outlet="{_escape(name)}"}} {int(data.get("status") == "success")}')
+    lines += ["# HELP crawler_last_run_timestamp_seconds Unix time the last run finished.",
+              "# TYPE crawler_last_run_timestamp_seconds gauge",
+              f"crawler_last_run_timestamp_seconds {report['finished_at_unix']}"]
+    return "\n".join(lines) + "\n"
+
+
+def write_report(report: Dict, json_file: Optional[str] = None, prometheus_file: Optional[str] = None):
+    """실행 보고서 저장 (임시 파일에 쓴 뒤 교체해 수집기가 쓰다 만 파일을 읽지 않도록 함)"""
+    outputs = []
+    if json_file:
+        outputs.append((json_file, json.dumps(report, ensure_ascii=False, indent=2)))
+    if prometheus_file:
+        outputs.append((prometheus_file, to_prometheus(report)))
+    for path, content in outputs:
+        path = os.path.join(PROJECT_ROOT, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    return [path for path, _ in outputs]
+
+
+# 전역 인스턴스 - 공유 클라이언트와 모든 파이프라인이 같은 지표에 기록
+_metrics = CrawlMetrics()
+
+
+def get_crawl_metrics() -> CrawlMetrics:
+    return _metrics
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+선언형 본문 추출 엔진
+언론사별 추출 명세(config/extraction_specs.py)를 한 번 컴파일해 두고 모든 크롤러가 같은 엔진으로 실행합니다.
+- 제외 선택자는 하나의 CSS 선택자로 합쳐 컨테이너를 한 번만 순회하며 제거
+- 선택자/정규식은 프로세스당 한 번만 컴파일 (파싱 워커 프로세스도 첫 사용 시 한 번)
+- 언론사 추가/수정은 명세(데이터) 변경만으로 처리
+"""
+
+import html
+import json
+import re
+import sys
+import os
+from typing import Dict, List, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.extraction_specs import EXTRACTION_SPECS
+
+_WHITESPACE = re.compile(r'\s+')
+_BLANK_LINES = re.compile(r'\n\s*\n')
+
+
+def _compile_patterns(patterns: List[str]) -> List[re.Pattern]:
+    return [re.compile(p, re.MULTILINE) for p in patterns]
+
+
+class ParagraphRule:
+    """문단 수집 규칙 (선택자 또는 빈 줄 기준 분할 + 정리/필터)"""
+
+    def __init__(self, rule: Dict):
+        self.selector = soupsieve.compile(rule["selector"]) if rule.get("selector") else None
+        self.separator = rule.get("separator", "")
+        self.strip = rule.get("strip", True)
+        self.split_lines = rule.get("split") == "lines"
+        self.min_length = rule.get("min_length", 0)
+        self.measure_raw = rule.get("measure", "clean") == "raw"  # raw: 정리 전 길이로 판단
+        self.unescape = rule.get("unescape", False)
+        self.normalize = rule.get("normalize", True)
+        self.strip_patterns = _compile_patterns(rule.get("strip_patterns", []))
+        self.drop_patterns = _compile_patterns(rule.get("drop_patterns", []))
+
+    def _raw_texts(self, container: Tag) -> List[str]:
+        if self.selector is None:
+            # 문단 태그가 없는 본문: 빈 줄(또는 줄바꿈)을 문단 경계로 간주
+            text = container.get_text(self.separator)
+            blocks = text.splitlines() if self.split_lines else _BLANK_LINES.split(text)
+            return [block.strip() for block in blocks]
+        return [el.get_text(self.separator, strip=self.strip) for el in self.selector.select(container)]
+
+    def collect(self, container: Tag) -> List[str]:
+        paragraphs = []
+        for raw in self._raw_texts(container):
+            if not raw or (self.measure_raw and len(raw) <= self.min_length):
+                continue
+
+            text = html.unescape(raw) if self.unescape else raw
+            for pattern in self.strip_patterns:
+                text = pattern.sub('', text)
+            if self.normalize:
+                text = _WHITESPACE.sub(' ', text.replace('&nbsp;', ' '))
+            text = text.strip()
+
+            if not text or (not self.measure_raw and len(text) <= self.min_length):
+                continue
+            if any(pattern.search(text) for pattern in self.drop_patterns):
+                continue
+            paragraphs.append(text)
+        return paragraphs
+
+
+class DateSource:
+    """발행시간 후보 위치 (속성값 또는 조건에 맞는 텍스트)"""
+
+    def __init__(self, source: Dict):
+        self.json_ld = source.get("json_ld")
+        self.selector = soupsieve.compile(source["selector"]) if source.get("selector") else None
+        self.attr = source.get("attr")
+        self.children = soupsieve.compile(source["children"]) if source.get("children") else None
+        self.contains = source.get("contains")
+        self.pattern = re.compile(source["pattern"]) if source.get("pattern") else None
+        self.remove = source.get("remove")
+
+    def find(self, soup: BeautifulSoup) -> Optional[str]:
+        if self.json_ld:
+            return self._from_json_ld(soup)
+
+        element = self.selector.select_one(soup)
+        if element is None:
+            return None
+        if self.attr:
+            return element.get(self.attr) or None
+
+        texts = [c.get_text(strip=True) for c in self.children.select(element)] if self.children \
+            else [element.get_text(strip=True)]
+        for text in texts:
+            if self.contains and self.contains not in text:
+                continue
+            if self.pattern and not self.pattern.search(text):
+                continue
+            if self.remove:
+                text = text.replace(self.remove, '').strip()
+            if text:
+                return text
+        return None
+
+    def _from_json_ld(self, soup: BeautifulSoup) -> Optional[str]:
+        script = soup.find('script', type='application/ld+json')
+        if not script or not script.string:
+            return None
+        try:
+            data = json.loads(script.string)
+        except ValueError:
+            return None
+        return data.get(self.json_ld) if isinstance(data, dict) else None
+
+
+class Extractor:
+    """컴파일된 언론사 추출 명세"""
+
+    def __init__(self, name: str, spec: Dict):
+        self.name = name
+        self.containers = [soupsieve.compile(s) for s in spec["container"]]
+        removals = spec.get("remove", [])
+        self.remove = soupsieve.compile(", ".join(removals)) if removals else None
+        self.br_to_newline = spec.get("br_to_newline", False)
+        self.paragraphs = ParagraphRule(spec["paragraphs"])
+        self.fallback = ParagraphRule(spec["fallback"]) if spec.get("fallback") else None
+        self.byline = re.compile(spec["byline"]) if spec.get("byline") else None
+        self.join = spec.get("join", "\n\n")
+        self.post_replace = [(re.compile(p), r) for p, r in spec.get("post_replace", [])]
+        self.dates = [DateSource(d) for d in spec.get("dates", [])]
+
+    def find_container(self, soup: BeautifulSoup) -> Optional[Tag]:
+        for selector in self.containers:
+            container = selector.select_one(soup)
+            if container is not None:
+                return container
+        return None
+
+    def extract(self, soup: BeautifulSoup) -> Optional[Dict[str, str]]:
+        """
+        본문 추출 (soup의 컨테이너 내부를 직접 정리하므로 soup은 재사용하지 않음)
+
+        Returns:
+            Optional[Dict]: {"text", "byline"} (본문 컨테이너가 없으면 None)
+        """
+        container = self.find_container(soup)
+        if container is None:
+            return None
+
+        if self.remove is not None:
+            # 합친 선택자로 한 번에 찾아 제거 (이미 제거된 요소의 후손은 건너뜀)
+            for element in self.remove.select(container):
+                if not element.decomposed:
+                    element.decompose()
+
+        if self.br_to_newline:
+            for br in container.find_all('br'):
+                br.replace_with('\n')
+
+        paragraphs = self.paragraphs.collect(container)
+        if not paragraphs and self.fallback:
+            paragraphs = self.fallback.collect(container)
+
+        byline = ""
+        if self.byline and paragraphs and self.byline.search(paragraphs[-1]):
+            byline = paragraphs.pop()
+
+        text = self.join.join(paragraphs)
+        for pattern, repl in self.post_replace:
+            text = pattern.sub(repl, text)
+        text = _BLANK_LINES.sub('\n\n', text).strip()
+
+        return {"text": text, "byline": byline}
+
+    def extract_published_at(self, soup: BeautifulSoup) -> Optional[str]:
+        """명세 순서대로 발행시간 원문 검색 (변환은 크롤러의 _parse_datetime이 담당)"""
+        for source in self.dates:
+            value = source.find(soup)
+            if value:
+                return value
+        return None
+
+
+# 컴파일된 추출기 (프로세스별 캐시)
+_extractors: Dict[str, Extractor] = {}
+
+
+def get_extractor(name: str) -> Extractor:
+    """언론사 추출기 반환 (첫 호출 시 명세 컴파일)"""
+    extractor = _extractors.get(name)
+    if extractor is None:
+        extractor = Extractor(name, EXTRACTION_SPECS[name])
+        _extractors[name] = extractor
+    return extractor
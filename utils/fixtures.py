@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+오프라인 HTML 픽스처 기록 / 읽기
+실제 실행의 응답을 압축 파일로 남겨 파싱 성능/결과를 사이트 접속 없이 재현합니다.
+- responses/<호스트>.jsonl.gz: 공유 HTTP 클라이언트가 받은 GET 응답 (목록/본문/API, 헤더+본문)
+- parse_inputs/<크롤러 클래스>.jsonl.gz: 파싱 함수에 들어간 입력 (기사 정보 + 원문)
+  첫 줄은 파싱 전용 인스턴스를 복원할 ParseTask 명세 ("모듈.클래스.메서드" 이름 + 단순 속성, JSON)
+  (scripts/parse_benchmark.py가 현재 코드의 크롤러 클래스로 다시 구성해 재생)
+- 한 줄에 한 건씩 기록하는 gzip JSON Lines (중간에 중단되어도 기록된 줄까지는 읽을 수 있음)
+- 같은 디렉터리에 다시 기록하면 이번 실행에서 쓴 파일은 새로 덮어씀
+
+사용법:
+    python -m crawler.crawler_manager --record-fixtures fixtures/2025-09-18
+"""
+
+import base64
+import gzip
+import json
+import pickle
+import re
+import sys
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import httpx
+from rich.console import Console
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+from utils.parse_pool import ParseTask
+
+console = Console()
+
+# 기록 시 제외할 헤더 (본문은 디코딩된 상태로 저장)
+_EXCLUDED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+
+
+def encode_body(raw: Any) -> Dict:
+    """원문을 JSON으로 기록할 수 있는 형태로 변환 (문자열/바이트/JSON 객체)"""
+    if isinstance(raw, bytes):
+        return {"bytes": base64.b64encode(raw).decode("ascii")}
+    if isinstance(raw, str):
+        return {"text": raw}
+    return {"json": raw}
+
+
+def decode_body(record: Dict) -> Any:
+    if "bytes" in record:
+        return base64.b64decode(record["bytes"])
+    if "text" in record:
+        return record["text"]
+    return record.get("json")
+
+
+class FixtureRecorder:
+    """응답과 파싱 입력을 압축 JSON Lines로 기록하는 클래스"""
+
+    def __init__(self, directory: str):
+        self.directory = os.path.join(PROJECT_ROOT, directory)
+        os.makedirs(os.path.join(self.directory, "responses"), exist_ok=True)
+        os.makedirs(os.path.join(self.directory, "parse_inputs"), exist_ok=True)
+        self._files: Dict[str, gzip.GzipFile] = {}
+        self._tasks: Dict[Any, Optional[str]] = {}  # 파싱 함수 → 기록 파일 이름 (기록 불가면 None)
+
+        # 통계
+        self.responses = 0
+        self.parse_inputs = 0
+
+    def _write(self, path: str, record: Dict):
+        f = self._files.get(path)
+        if f is None:
+            # 실행마다 새로 기록 (이전 실행에 이어 쓰면 명세 줄이 중복됨)
+            f = gzip.open(path, "wt", encoding="utf-8")
+            self._files[path] = f
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def record_response(self, request: httpx.Request, response: httpx.Response):
+        """HTTP 응답 기록 (본문까지 읽은 응답만)"""
+        path = os.path.join(self.directory, "responses", _safe_name(request.url.host) + ".jsonl.gz")
+        self._write(path, {
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _EXCLUDED_HEADERS},
+            "fetched_at": time.time(),
+            **encode_body(response.content),
+        })
+        self.responses += 1
+
+    def record_parse_input(self, parse_detail: Callable, article: Dict, raw: Any):
+        """파싱 함수 입력 기록 (크롤러 메서드이고 원문이 문자열/바이트/JSON일 때만)"""
+        if not isinstance(raw, (str, bytes, dict, list)):
+            return
+        key = (getattr(parse_detail, "__self__", None).__class__, getattr(parse_detail, "__name__", None))
+        if key not in self._tasks:
+            self._tasks[key] = self._start_parse_file(parse_detail)
+        path = self._tasks[key]
+        if path is None:
+            return
+        self._write(path, {"article": article, **encode_body(raw)})
+        self.parse_inputs += 1
+
+    def _start_parse_file(self, parse_detail: Callable) -> Optional[str]:
+        """크롤러별 파싱 입력 파일 생성 (첫 줄: ParseTask 명세)"""
+        try:
+            task = ParseTask(parse_detail)
+        except (TypeError, pickle.PicklingError, AttributeError):
+            return None
+        name = _safe_name(f"{task.cls.__module__.rsplit('.', 1)[-1]}.{task.cls.__name__}.{task.method}")
+        path = os.path.join(self.directory, "parse_inputs", name + ".jsonl.gz")
+        self._write(path, {"task": task.to_spec()})
+        return path
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        console.print(f"🎞️ 픽스처 기록: 응답 {self.responses}건, 파싱 입력 {self.parse_inputs}건 → {self.directory}")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """GET 응답을 픽스처로 기록하는 전송 계층 래퍼"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, recorder: FixtureRecorder):
+        self._transport = transport
+        self.recorder = recorder
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        if request.method == "GET":
+            await response.aread()
+            self.recorder.record_response(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """픽스처 파일의 기록을 순서대로 반환 (중단된 기록은 읽을 수 있는 줄까지만)"""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    except (EOFError, gzip.BadGzipFile):
+        return
+
+
+def load_parse_inputs(path: str):
+    """
+    파싱 입력 파일 읽기
+
+    Returns:
+        Tuple[ParseTask, List[Tuple[Dict, Any]]]: (파싱 작업, (기사, 원문) 목록)
+    """
+    records = iter_records(path)
+    header = next(records)
+    if not isinstance(header.get("task"), dict):
+        # 이전 형식(pickle)은 읽을 때 코드가 실행될 수 있으므로 불러오지 않음
+        raise ValueError("이전 형식의 픽스처입니다. --record-fixtures로 다시 기록하세요")
+    task = ParseTask.from_spec(header["task"])
+    # 이전 방식(이어 쓰기)으로 기록된 파일의 중복 명세 줄은 건너뜀
+    return task, [(record["article"], decode_body(record)) for record in records if "article" in record]
+
+
+# 전역 인스턴스 - 기록을 시작한 경우에만 존재
+_recorder: Optional[FixtureRecorder] = None
+
+
+def start_recording(directory: str) -> FixtureRecorder:
+    """픽스처 기록 시작 (이후 생성되는 공유 클라이언트와 파싱 단계가 기록)"""
+    global _recorder
+    if _recorder is None:
+        _recorder = FixtureRecorder(directory)
+        console.print(f"🎞️ 픽스처 기록 시작: {_recorder.directory}")
+    return _recorder
+
+
+def get_fixture_recorder() -> Optional[FixtureRecorder]:
+    """기록 중이면 기록기 반환 (아니면 None)"""
+    return _recorder
+
+
+def stop_recording():
+    global _recorder
+    if _recorder is not None:
+        _recorder.close()
+        _recorder = None
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+재개 가능한 크롤링 프론티어 (디스크 체크포인트)
+실행 도중 중단(Playwright 크래시, 메모리 부족, Ctrl-C)되어도 다음 실행이 멈춘 지점부터 이어가도록
+발견한 기사 URL과 처리 단계를 로컬 SQLite에 기록합니다.
+- 기사 단계: discovered → fetched → parsed → saved
+- parsed 단계는 파싱 결과(본문 포함)를 함께 저장 → 재개 시 본문 요청/파싱 없이 바로 저장
+- 파이프라인이 끝까지 완료된 언론사는 프론티어에서 정리
+- 실행(run) 단위로 완료된 크롤러를 기록 → 중단된 실행을 재개하면 완료된 크롤러는 건너뜀
+"""
+
+import json
+import sqlite3
+import sys
+import os
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+from config.crawler_config import FRONTIER_CONFIG
+
+console = Console()
+
+# 기사 처리 단계 (순서대로 진행)
+DISCOVERED = "discovered"
+FETCHED = "fetched"
+PARSED = "parsed"
+SAVED = "saved"
+
+
+class CrawlFrontier:
+    """언론사별 기사 처리 단계와 실행별 완료 크롤러를 기록하는 체크포인트 저장소"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**FRONTIER_CONFIG, **(config or {})}
+        self.db_path = os.path.join(PROJECT_ROOT, self.config["db_file"])
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        # 기사마다 단계가 바뀌므로 WAL + NORMAL 동기화로 쓰기 비용을 낮춤
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS frontier ("
+            "outlet TEXT, url TEXT, state TEXT, article TEXT, updated_at REAL, "
+            "PRIMARY KEY (outlet, url)) WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, started_at REAL, finished_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_crawlers ("
+            "run_id TEXT, crawler TEXT, finished_at REAL, PRIMARY KEY (run_id, crawler))"
+        )
+        self._conn.commit()
+
+    # ── 실행 단위 ──────────────────────────────────────────────
+
+    def begin_run(self) -> Tuple[str, bool]:
+        """
+        중단된 실행이 있으면 이어서, 없으면 새 실행 시작
+
+        Returns:
+            Tuple[str, bool]: (실행 ID, 재개 여부)
+        """
+        max_age = self.config["resume_max_age_hours"] * 3600
+        now = time.time()
+        self._prune(now - max_age)
+
+        row = self._conn.execute(
+            "SELECT run_id FROM runs WHERE finished_at IS NULL AND started_at >= ? "
+            "ORDER BY started_at DESC LIMIT 1", (now - max_age,)
+        ).fetchone()
+        if row:
+            return row[0], True
+
+        run_id = uuid.uuid4().hex
+        self._conn.execute("INSERT INTO runs VALUES (?, ?, NULL)", (run_id, now))
+        self._conn.commit()
+        return run_id, False
+
+    def completed_crawlers(self, run_id: str) -> Set[str]:
+        """실행에서 이미 완료된 크롤러 이름"""
+        rows = self._conn.execute("SELECT crawler FROM run_crawlers WHERE run_id = ?", (run_id,))
+        return {crawler for (crawler,) in rows}
+
+    def mark_crawler_done(self, run_id: str, crawler: str):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO run_crawlers VALUES (?, ?, ?)", (run_id, crawler, time.time())
+        )
+        self._conn.commit()
+
+    def finish_run(self, run_id: str):
+        """실행 완료 기록 (다음 실행은 새로 시작)"""
+        self._conn.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), run_id))
+        self._conn.execute("DELETE FROM run_crawlers WHERE run_id = ?", (run_id,))
+        self._conn.commit()
+
+    def _prune(self, cutoff: float):
+        """오래된 실행 기록과 기사 단계 정리 (오래된 체크포인트로는 재개하지 않음)"""
+        self._conn.execute(
+            "DELETE FROM run_crawlers WHERE run_id IN (SELECT run_id FROM runs WHERE started_at < ?)", (cutoff,)
+        )
+        self._conn.execute("DELETE FROM runs WHERE started_at < ?", (cutoff,))
+        removed = self._conn.execute("DELETE FROM frontier WHERE updated_at < ?", (cutoff,)).rowcount
+        self._conn.commit()
+        if removed:
+            console.print(f"🧹 오래된 프론티어 항목 {removed}개 정리")
+
+    # ── 기사 단계 ──────────────────────────────────────────────
+
+    def record(self, outlet: str, articles: Iterable[Dict], state: str, keep_article: bool = True):
+        """
+        기사 처리 단계 기록
+
+        Args:
+            outlet: 언론사 이름
+            articles: 기사 목록 (url 필수)
+            state: 처리 단계
+            keep_article: False면 저장된 기사 데이터는 그대로 두고 단계만 갱신
+        """
+        now = time.time()
+        articles = [a for a in articles if a.get("url")]
+        if not articles:
+            return
+        if keep_article:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO frontier VALUES (?, ?, ?, ?, ?)",
+                [(outlet, a["url"], state, json.dumps(a, ensure_ascii=False, default=str), now) for a in articles],
+            )
+        else:
+            self._conn.executemany(
+                "UPDATE frontier SET state = ?, updated_at = ? WHERE outlet = ? AND url = ?",
+                [(state, now, outlet, a["url"]) for a in articles],
+            )
+        self._conn.commit()
+
+    def pending(self, outlet: str) -> List[Tuple[str, Dict]]:
+        """저장까지 끝나지 않은 기사 (단계, 기사) 목록"""
+        rows = self._conn.execute(
+            "SELECT state, article FROM frontier WHERE outlet = ? AND state != ? ORDER BY updated_at",
+            (outlet, SAVED),
+        )
+        return [(state, json.loads(article)) for state, article in rows]
+
+    def saved_urls(self, outlet: str) -> Set[str]:
+        """중단된 실행에서 이미 저장까지 끝난 URL"""
+        rows = self._conn.execute("SELECT url FROM frontier WHERE outlet = ? AND state = ?", (outlet, SAVED))
+        return {url for (url,) in rows}
+
+    def clear(self, outlet: str):
+        """파이프라인이 끝까지 완료된 언론사의 기사 단계 정리"""
+        self._conn.execute("DELETE FROM frontier WHERE outlet = ?", (outlet,))
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+# 전역 인스턴스 (지연 초기화) - 싱글톤 패턴
+_frontier = None
+
+
+def get_frontier() -> Optional[CrawlFrontier]:
+    """프론티어 인스턴스를 반환 (비활성화 시 None)"""
+    global _frontier
+    if not FRONTIER_CONFIG["enabled"]:
+        return None
+    if _frontier is None:
+        _frontier = CrawlFrontier()
+    return _frontier
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 선택
+모든 크롤러는 BeautifulSoup을 직접 만들지 않고 make_soup()을 사용합니다.
+- 선택자/탐색 API는 BeautifulSoup 그대로 유지하고 트리 빌더만 교체
+- lxml(C 구현)이 설치되어 있으면 순수 파이썬 html.parser 대신 사용
+- selectolax는 BeautifulSoup과 탐색 API가 달라 크롤러/추출 명세를 모두 다시 써야 하므로 지원하지 않음
+- 백엔드별 추출 결과 비교는 scripts/parser_parity.py --fixtures로 기록된 픽스처를 재생해 확인
+- 바이트를 넘기면 BOM/meta charset 선언 → UTF-8 순으로 인코딩을 판별 (한겨레 등 UTF-8 페이지는 두 백엔드 결과 동일)
+"""
+
+import sys
+import os
+from contextlib import contextmanager
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import HTML_PARSER_CONFIG
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+BACKENDS = ("lxml", "html.parser")
+
+# use_backend()로 임시 변경한 백엔드 (None이면 설정값 사용)
+_backend_override: Optional[str] = None
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """설정값("auto" 포함)을 실제 BeautifulSoup 트리 빌더 이름으로 변환"""
+    backend = backend or _backend_override or HTML_PARSER_CONFIG["backend"]
+    if backend == "auto":
+        return "lxml" if LXML_AVAILABLE else "html.parser"
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 HTML 파서 백엔드: {backend}")
+    if backend == "lxml" and not LXML_AVAILABLE:
+        raise ImportError("lxml 백엔드를 사용하려면 pip install lxml 이 필요합니다")
+    return backend
+
+
+def make_soup(markup: Union[str, bytes], backend: Optional[str] = None) -> BeautifulSoup:
+    """
+    설정된 백엔드로 HTML 파싱
+
+    Args:
+        markup: HTML 문자열 또는 바이트
+        backend: 이번 호출에만 사용할 백엔드 (None이면 설정값)
+
+    Returns:
+        BeautifulSoup: 파싱된 문서
+    """
+    return BeautifulSoup(markup, resolve_backend(backend))
+
+
+@contextmanager
+def use_backend(backend: str):
+    """블록 안의 make_soup() 호출이 지정한 백엔드를 사용하도록 임시 변경 (비교 스크립트용)"""
+    global _backend_override
+    previous = _backend_override
+    _backend_override = resolve_backend(backend)
+    try:
+        yield
+    finally:
+        _backend_override = previous
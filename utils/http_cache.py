@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+디스크 기반 HTTP 캐시 (조건부 GET)
+- 응답의 ETag / Last-Modified 검증자와 본문을 디스크에 저장
+- 다음 요청 시 If-None-Match / If-Modified-Since 헤더 전송
+- 서버가 304를 반환하면 디스크의 본문으로 200 응답을 만들어 반환
+- 캐시 파일 입출력은 작업 스레드에서 실행 (이벤트 루프를 막지 않음)
+"""
+
+import asyncio
+import hashlib
+import json
+import sys
+import os
+import time
+from typing import Dict, Optional
+
+import httpx
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+from config.crawler_config import HTTP_CACHE_CONFIG
+
+# 캐시 본문으로 응답을 재구성할 때 제외할 헤더 (본문은 이미 디코딩된 상태로 저장)
+_EXCLUDED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class HttpCache:
+    """URL별 검증자와 본문을 디스크에 저장하는 캐시"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**HTTP_CACHE_CONFIG, **(config or {})}
+        self.cache_dir = os.path.join(PROJECT_ROOT, self.config["cache_dir"])
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # 통계
+        self.revalidated = 0  # 304로 재사용한 응답 수
+        self.stored = 0       # 새로 저장한 응답 수
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".json", base + ".body"
+
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 조회 (없거나 만료되면 None)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if time.time() - meta["stored_at"] > self.config["max_age_days"] * 86400:
+                return None
+            with open(body_path, "rb") as f:
+                meta["body"] = f.read()
+            return meta
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, url: str, response: httpx.Response) -> bool:
+        """검증자가 있는 200 응답을 저장 (저장했으면 True)"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _EXCLUDED_HEADERS}
+        try:
+            with open(body_path, "wb") as f:
+                f.write(response.content)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "headers": headers,
+                    "stored_at": time.time(),
+                }, f, ensure_ascii=False)
+            return True
+        except OSError:
+            return False
+
+    def refresh(self, url: str, entry: Dict):
+        """304 응답 후 저장 시각 갱신"""
+        meta_path, _ = self._paths(url)
+        entry = {k: v for k, v in entry.items() if k != "body"}
+        entry["stored_at"] = time.time()
+        try:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except OSError:
+            pass
+
+    def prune(self) -> int:
+        """
+        만료된 캐시 항목 삭제
+
+        만료 여부는 메타 파일의 저장 시각으로 판단 (304 재검증은 메타만 다시 쓰므로
+        파일 수정 시각으로 판단하면 자주 재검증된 항목의 본문이 먼저 지워짐)
+        """
+        expire_before = time.time() - self.config["max_age_days"] * 86400
+        removed = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                base, ext = os.path.splitext(path)
+                try:
+                    if ext == ".json":
+                        with open(path, "r", encoding="utf-8") as f:
+                            expired = json.load(f)["stored_at"] < expire_before
+                        stale = [path, base + ".body"] if expired else []
+                    elif not os.path.exists(base + ".json"):
+                        # 메타 없이 남은 본문 (저장 도중 중단 등)
+                        stale = [path] if os.path.getmtime(path) < expire_before else []
+                    else:
+                        continue
+                except (OSError, ValueError, KeyError):
+                    continue
+                for stale_path in stale:
+                    try:
+                        os.remove(stale_path)
+                        removed += 1
+                    except OSError:
+                        continue
+        return removed
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """GET 요청에 조건부 헤더를 붙이고 304 응답을 캐시 본문으로 대체하는 전송 계층 래퍼"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: HttpCache):
+        self._transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        url = str(request.url)
+        entry = await asyncio.to_thread(self.cache.get, url)
+        if entry:
+            if entry.get("etag"):
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry:
+            await response.aclose()
+            await asyncio.to_thread(self.cache.refresh, url, entry)
+            self.cache.revalidated += 1
+            return httpx.Response(
+                200,
+                headers=entry["headers"],
+                content=entry["body"],
+                request=request,
+                extensions={"from_cache": True},
+            )
+
+        if response.status_code == 200:
+            await response.aread()
+            if await asyncio.to_thread(self.cache.put, url, response):
+                self.cache.stored += 1
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
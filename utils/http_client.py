@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+공유 HTTP 클라이언트
+CrawlerManager가 하나의 커넥션 풀을 소유하고 모든 수집기에 주입합니다.
+- 호스트별 적응형 속도 제한 (utils.rate_limiter)
+- 공통 재시도/백오프 및 호스트별 회로 차단 (utils.retry)
+- 디스크 캐시 + 조건부 GET (utils.http_cache)
+- HTTP/2 지원 (h2 패키지가 설치된 경우)
+- 언론사별 요청 수/수신 바이트/재시도/캐시 재사용 집계 (utils.crawl_metrics)
+- 모의 언론사 서버로 요청 전환 (MOCK_OUTLET_CONFIG["base_url"], 부하 테스트용)
+- keep-alive 연결 재사용으로 TCP/TLS 핸드셰이크 및 DNS 조회 최소화
+"""
+
+import sys
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+import httpx
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import HTTP_CLIENT_CONFIG, HTTP_CACHE_CONFIG, MOCK_OUTLET_CONFIG
+from utils.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+from utils.http_cache import CachingTransport, HttpCache
+from utils.retry import RetryController, RetryingTransport
+from utils.fixtures import RecordingTransport, get_fixture_recorder
+from utils.crawl_metrics import MetricsTransport, get_crawl_metrics
+
+try:
+    import h2  # noqa: F401 - HTTP/2 지원 여부 확인용
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """호스트별 적응형 속도 제한을 적용하는 전송 계층 래퍼"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: AdaptiveRateLimiter):
+        self._transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host_limiter = self.limiter.for_host(request.url.host)
+        await host_limiter.acquire()
+
+        started = time.monotonic()
+        status_code = None
+        retry_after = None
+        timed_out = False
+        try:
+            response = await self._transport.handle_async_request(request)
+            # 본문까지 읽은 뒤 슬롯을 반환해야 동시성이 제한됨
+            await response.aread()
+            status_code = response.status_code
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            return response
+        except httpx.TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            await host_limiter.release(
+                time.monotonic() - started,
+                status_code=status_code,
+                timed_out=timed_out,
+                retry_after=retry_after,
+            )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class BaseUrlOverrideTransport(httpx.AsyncBaseTransport):
+    """
+    모든 요청을 지정한 서버(scripts/mock_outlet_server.py)로 보내는 전송 계층 래퍼
+
+    원래 주소는 Host / X-Original-URL 헤더로 전달하고 응답 후 요청 주소를 되돌리므로
+    크롤러, 속도 제한기, 재시도 관리자는 실제 언론사 주소 기준으로 동작합니다.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, base_url: str):
+        self._transport = transport
+        self.base_url = httpx.URL(base_url)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        original = request.url
+        request.headers["X-Original-URL"] = str(original)
+        request.url = original.copy_with(
+            scheme=self.base_url.scheme, host=self.base_url.host, port=self.base_url.port
+        )
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            request.url = original
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_shared_client(config: Optional[Dict] = None) -> httpx.AsyncClient:
+    """
+    파이프라인 전체에서 재사용할 공유 AsyncClient 생성
+
+    Args:
+        config: HTTP 클라이언트 설정 (기본값: HTTP_CLIENT_CONFIG)
+
+    Returns:
+        httpx.AsyncClient: 커넥션 풀이 설정된 클라이언트
+    """
+    config = {**HTTP_CLIENT_CONFIG, **(config or {})}
+    http2 = config["http2"] and HTTP2_AVAILABLE
+
+    limits = httpx.Limits(
+        max_connections=config["max_connections"],
+        max_keepalive_connections=config["max_keepalive_connections"],
+        keepalive_expiry=config["keepalive_expiry"],
+    )
+    transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=config["connect_retries"])
+    # 모의 서버 전환은 가장 안쪽에 두어 바깥 계층은 실제 언론사 호스트 기준으로 동작
+    mock_base_url = MOCK_OUTLET_CONFIG["base_url"]
+    if mock_base_url:
+        transport = BaseUrlOverrideTransport(transport, mock_base_url)
+    transport = RateLimitedTransport(transport, limiter=AdaptiveRateLimiter())
+    # 재시도는 속도 제한기 바깥에 두어 재시도 요청도 호스트별 제한(Retry-After 포함)을 받도록 함
+    transport = RetryingTransport(transport, retry=RetryController())
+    # 캐시는 속도 제한기 바깥에 두어 조건부 요청도 호스트별 제한을 받도록 함
+    # (모의 서버 사용 시에는 실제 응답 캐시를 읽거나 덮어쓰지 않도록 사용하지 않음)
+    if HTTP_CACHE_CONFIG["enabled"] and not mock_base_url:
+        transport = CachingTransport(transport, cache=HttpCache())
+    # 지표는 캐시 바깥에서 집계해 크롤러가 보낸 요청 하나를 한 번만 셈
+    transport = MetricsTransport(transport, metrics=get_crawl_metrics())
+    # 픽스처 기록은 가장 바깥에서 크롤러가 실제로 받은 응답(캐시 적중 포함)을 기록
+    recorder = get_fixture_recorder()
+    if recorder is not None:
+        transport = RecordingTransport(transport, recorder)
+
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(config["timeout"], connect=config["connect_timeout"]),
+        follow_redirects=True,
+        headers={"User-Agent": config["user_agent"]},
+    )
+
+
+def _find_transport_attr(client: httpx.AsyncClient, name: str):
+    """래핑된 전송 계층을 따라가며 지정한 속성 검색"""
+    transport = getattr(client, "_transport", None)
+    while transport is not None:
+        if hasattr(transport, name):
+            return getattr(transport, name)
+        transport = getattr(transport, "_transport", None)
+    return None
+
+
+def get_rate_limiter(client: httpx.AsyncClient) -> Optional[AdaptiveRateLimiter]:
+    """클라이언트에 연결된 속도 제한기 반환 (없으면 None)"""
+    return _find_transport_attr(client, "limiter")
+
+
+def get_retry_controller(client: httpx.AsyncClient) -> Optional[RetryController]:
+    """클라이언트에 연결된 재시도/회로 차단 관리자 반환 (없으면 None)"""
+    return _find_transport_attr(client, "retry")
+
+
+def get_http_cache(client: httpx.AsyncClient) -> Optional[HttpCache]:
+    """클라이언트에 연결된 HTTP 캐시 반환 (없으면 None)"""
+    return _find_transport_attr(client, "cache")
+
+
+@asynccontextmanager
+async def open_client(shared_client: Optional[httpx.AsyncClient] = None, timeout: Optional[float] = None):
+    """
+    공유 클라이언트가 있으면 그대로 사용하고, 없으면 임시 클라이언트 생성
+
+    수집기를 단독 실행할 때도 동작하도록 하기 위한 헬퍼입니다.
+    임시 클라이언트도 같은 설정(속도 제한 포함)으로 생성되며,
+    공유 클라이언트는 소유자(CrawlerManager)가 닫으므로 여기서 닫지 않습니다.
+
+    Args:
+        shared_client: CrawlerManager가 주입한 공유 클라이언트
+        timeout: 임시 클라이언트의 요청 타임아웃 (초)
+
+    Yields:
+        httpx.AsyncClient: 요청에 사용할 클라이언트
+    """
+    if shared_client is not None and not shared_client.is_closed:
+        yield shared_client
+        return
+
+    config = {"timeout": timeout} if timeout else None
+    async with create_shared_client(config) as client:
+        yield client
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+저장 시점 유사 중복 기사 색인 (통신사 기사 재게재 판별)
+연합뉴스/뉴시스 기사를 다른 언론사가 거의 그대로 싣는 경우를 찾아 대표 기사(canonical)에 연결합니다.
+- 본문: 정규화한 단어 3-gram의 64비트 SimHash (데이트라인/기자명/이메일/저작권 문구 제거 후)
+- 제목: 말머리([속보] 등)와 공백/문장부호를 뺀 제목 키 (제목이 같으면 본문 거리를 더 넓게 허용)
+- 후보 검색: SimHash를 16비트 4구간으로 나눠 한 구간이라도 같은 기사만 비교 (거리 3 이하는 누락 없음)
+- 처음 저장된 기사를 대표로 삼고, 중복 기사끼리도 같은 대표를 가리키도록 연결
+- 연결 결과는 Supabase article_duplicates 테이블에 기록 → 전처리/임베딩/클러스터링은 중복을 건너뛰고
+  이슈의 언론사 성향 집계에는 중복 기사 언론사도 포함
+- 테이블/컬럼 생성 SQL: sql/article_duplicates.sql
+"""
+
+import hashlib
+import re
+import sqlite3
+import sys
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+from config.crawler_config import NEAR_DUP_CONFIG
+
+console = Console()
+
+_BITS = 64
+_BANDS = 4
+_BAND_BITS = _BITS // _BANDS
+_MASK = (1 << _BITS) - 1
+
+# 본문 정규화: 앞머리 데이트라인, 기자명, 이메일, 저작권 문구는 언론사마다 달라 지문에서 제외
+_DATELINE = re.compile(r'^\s*(?:[\[\(【][^\]\)】]{0,40}[\]\)】]\s*)+')
+_EMAIL = re.compile(r'\S+@\S+')
+_REPORTER = re.compile(r'[가-힣]{2,4}\s*(?:기자|특파원|통신원)')
+_COPYRIGHT = re.compile(r'(?:ⓒ|©|저작권자|무단\s*전재|재배포\s*금지|Copyright).*', re.IGNORECASE)
+_TOKEN = re.compile(r'[가-힣A-Za-z0-9]+')
+_TITLE_PREFIX = re.compile(r'^\s*(?:[\[\(【<][^\]\)】>]{0,10}[\]\)】>]\s*)+')
+
+
+def _signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 저장할 수 있도록 변환"""
+    return value - (1 << _BITS) if value >= 1 << (_BITS - 1) else value
+
+
+def _hamming(a: int, b: int) -> int:
+    return bin((a ^ b) & _MASK).count("1")
+
+
+def body_tokens(text: str) -> List[str]:
+    """지문에 사용할 본문 단어 (언론사별로 다른 머리/꼬리 문구 제외)"""
+    lines = []
+    for line in (text or "").splitlines():
+        line = _COPYRIGHT.sub('', _REPORTER.sub('', _EMAIL.sub('', _DATELINE.sub('', line))))
+        lines.append(line)
+    return [token.lower() for token in _TOKEN.findall(" ".join(lines))]
+
+
+def title_key(title: str) -> Optional[str]:
+    """말머리/공백/문장부호를 제거한 제목 키 (비어 있으면 None)"""
+    normalized = "".join(_TOKEN.findall(_TITLE_PREFIX.sub('', title or ''))).lower()
+    if not normalized:
+        return None
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def simhash(tokens: List[str], shingle_size: int = 3) -> int:
+    """단어 n-gram 빈도를 가중치로 한 64비트 SimHash"""
+    shingles = Counter(
+        " ".join(tokens[i:i + shingle_size]) for i in range(max(1, len(tokens) - shingle_size + 1))
+    )
+    weights = [0] * _BITS
+    for shingle, weight in shingles.items():
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+        for bit in range(_BITS):
+            if h >> bit & 1:
+                weights[bit] += weight
+            else:
+                weights[bit] -= weight
+    return sum(1 << bit for bit in range(_BITS) if weights[bit] > 0)
+
+
+def _bands(fingerprint: int) -> List[int]:
+    return [(fingerprint >> (band * _BAND_BITS)) & ((1 << _BAND_BITS) - 1) for band in range(_BANDS)]
+
+
+class NearDuplicateIndex:
+    """최근 저장 기사의 SimHash 색인 (SQLite)"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**NEAR_DUP_CONFIG, **(config or {})}
+        self.db_path = os.path.join(PROJECT_ROOT, self.config["db_file"])
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        # 생성 이후의 색인 조회/갱신은 모두 아래 작업 스레드 하나에서만 실행
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "url TEXT PRIMARY KEY, media_id TEXT, simhash INTEGER, title_key TEXT, "
+            "canonical_url TEXT, added_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS fingerprints_title ON fingerprints (title_key)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS bands ("
+            "band INTEGER, value INTEGER, url TEXT, added_at REAL, "
+            "PRIMARY KEY (band, value, url)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+        self._prune()
+
+        # SimHash 계산과 후보 조회는 저장 경로(이벤트 루프) 밖의 전용 스레드에서 순서대로 실행
+        # (스레드가 하나라 먼저 저장된 배치가 먼저 색인되어 대표 기사 판별 순서가 유지됨)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="near-dup")
+
+        # 통계
+        self.checked = 0
+        self.duplicates = 0
+
+    def _prune(self):
+        """비교 기간이 지난 지문 정리 (재게재는 보통 며칠 안에 일어남)"""
+        cutoff = time.time() - self.config["window_days"] * 86400
+        self._conn.execute("DELETE FROM fingerprints WHERE added_at < ?", (cutoff,))
+        self._conn.execute("DELETE FROM bands WHERE added_at < ?", (cutoff,))
+        self._conn.commit()
+
+    def _candidates(self, fingerprint: int, key: Optional[str]) -> Iterable[tuple]:
+        query = (
+            "SELECT f.url, f.media_id, f.simhash, f.title_key, f.canonical_url FROM fingerprints f "
+            "WHERE f.url IN (SELECT url FROM bands WHERE " +
+            " OR ".join("(band = ? AND value = ?)" for _ in range(_BANDS)) + ")"
+        )
+        params = [p for band, value in enumerate(_bands(fingerprint)) for p in (band, value)]
+        if key:
+            query += " OR f.title_key = ?"
+            params.append(key)
+        return self._conn.execute(query, params)
+
+    def find(self, fingerprint: int, key: Optional[str]) -> Optional[Dict]:
+        """가장 가까운 유사 중복 기사 (기준을 넘으면 None)"""
+        best = None
+        for url, media_id, other, other_key, canonical_url in self._candidates(fingerprint, key):
+            distance = _hamming(fingerprint, other & _MASK)
+            title_match = key is not None and key == other_key
+            limit = self.config["title_max_distance"] if title_match else self.config["max_distance"]
+            if distance > limit:
+                continue
+            if best is None or distance < best["distance"]:
+                best = {
+                    "canonical_url": canonical_url or url,
+                    "matched_url": url,
+                    "canonical_media_id": media_id,
+                    "distance": distance,
+                    "title_match": title_match,
+                }
+        return best
+
+    def link_batch(self, articles: List[Dict]) -> List[Dict]:
+        """
+        새로 저장된 기사를 색인에 추가하고 유사 중복 기사를 대표 기사에 연결
+
+        같은 묶음 안의 기사끼리도 순서대로 비교합니다.
+
+        Args:
+            articles: 저장이 확인된 기사 (url, title, content, media_id)
+
+        Returns:
+            List[Dict]: 중복 연결 목록 (url, canonical_url, media_id, canonical_media_id, distance, title_match)
+        """
+        links = []
+        now = time.time()
+        for article in articles:
+            url = article.get("url")
+            tokens = body_tokens(article.get("content", ""))
+            # 짧은 기사(사진 설명, 단신 등)는 오판 가능성이 커서 비교하지 않음
+            if not url or len(tokens) < self.config["min_tokens"]:
+                continue
+            self.checked += 1
+            fingerprint = simhash(tokens, self.config["shingle_size"])
+            key = title_key(article.get("title", ""))
+            media_id = str(article["media_id"]) if article.get("media_id") is not None else None
+
+            match = self.find(fingerprint, key)
+            if match and match["matched_url"] != url:
+                # 대표 기사의 언론사는 대표 지문에서 다시 조회 (중복의 중복도 같은 대표를 가리킴)
+                if match["canonical_url"] != match["matched_url"]:
+                    row = self._conn.execute(
+                        "SELECT media_id FROM fingerprints WHERE url = ?", (match["canonical_url"],)
+                    ).fetchone()
+                    match["canonical_media_id"] = row[0] if row else None
+                links.append({
+                    "url": url,
+                    "canonical_url": match["canonical_url"],
+                    "media_id": media_id,
+                    "canonical_media_id": match["canonical_media_id"],
+                    "distance": match["distance"],
+                    "title_match": match["title_match"],
+                })
+                self.duplicates += 1
+                canonical_url = match["canonical_url"]
+            else:
+                canonical_url = None
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)",
+                (url, media_id, _signed(fingerprint), key, canonical_url, now),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO bands VALUES (?, ?, ?, ?)",
+                [(band, value, url, now) for band, value in enumerate(_bands(fingerprint))],
+            )
+        self._conn.commit()
+        return links
+
+    def submit(self, articles: List[Dict], on_links: Callable[[List[Dict]], object]) -> Future:
+        """
+        새로 저장된 기사 묶음의 중복 연결을 작업 스레드에 맡김 (호출한 쪽은 기다리지 않음)
+
+        Args:
+            articles: 저장이 확인된 기사 (url, title, content, media_id)
+            on_links: 찾은 중복 연결 목록을 받아 기록할 함수 (작업 스레드에서 호출)
+        """
+        return self._executor.submit(self._link_job, articles, on_links)
+
+    def _link_job(self, articles: List[Dict], on_links: Callable[[List[Dict]], object]):
+        try:
+            links = self.link_batch(articles)
+            if links:
+                on_links(links)
+        except Exception as e:
+            # 중복 연결 실패는 기사 저장에 영향 없음
+            console.print(f"⚠️ 유사 중복 연결 실패: {str(e)[:80]}")
+
+    def close(self):
+        """남은 연결 작업을 마친 뒤 색인 닫기"""
+        self._executor.shutdown(wait=True)
+        self._conn.close()
+
+
+# 전역 인스턴스 (지연 초기화) - 싱글톤 패턴
+_near_duplicate_index = None
+# 저장 함수가 여러 작업 스레드에서 동시에 처음 호출해도 색인은 하나만 생성
+_near_duplicate_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> Optional[NearDuplicateIndex]:
+    """유사 중복 색인 인스턴스를 반환 (비활성화 시 None)"""
+    global _near_duplicate_index
+    if not NEAR_DUP_CONFIG["enabled"]:
+        return None
+    with _near_duplicate_lock:
+        if _near_duplicate_index is None:
+            _near_duplicate_index = NearDuplicateIndex()
+    return _near_duplicate_index
+
+
+def close_near_duplicate_index():
+    """유사 중복 색인 닫기 (CrawlerManager 종료 시 호출, 대기 중인 연결 작업까지 완료)"""
+    global _near_duplicate_index
+    if _near_duplicate_index is not None:
+        _near_duplicate_index.close()
+        _near_duplicate_index = None
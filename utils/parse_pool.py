@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+HTML 파싱 전용 프로세스 풀
+BeautifulSoup 파싱과 decompose() 정리는 CPU를 많이 쓰므로 이벤트 루프 밖에서 실행합니다.
+- 파이프라인 파싱 단계는 원문(HTML)과 기사 정보만 워커 프로세스로 전달
+- 워커는 크롤러의 단순 속성(문자열/숫자/목록 등)만으로 파싱 전용 인스턴스를 재구성
+- 결과로는 본문/발행시간이 채워진 기사 딕셔너리만 돌려받음 (soup 객체는 넘어오지 않음)
+- 워커는 forkserver(없으면 spawn)로 시작 → 원문 보관/중복 색인 등 백그라운드 스레드가 잡고 있던 락을
+  fork로 물려받아 워커가 멈추는 일이 없음
+"""
+
+import asyncio
+import importlib
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import PIPELINE_CONFIG
+from utils.crawl_metrics import current_outlet
+
+console = Console()
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+class SkipArticle(Exception):
+    """
+    파싱 함수가 수집 제외 조건에 해당하는 기사임을 알리는 예외
+
+    실패(None)와 달리 다시 시도해도 결과가 같으므로 파이프라인은 처리 완료(제외)로 기록합니다.
+    워커 프로세스에서 발생해도 그대로 전달됩니다.
+    """
+
+# 워커 프로세스에서 재사용하는 파싱 전용 크롤러 인스턴스 (클래스별)
+_worker_instances: Dict[type, Any] = {}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_size = 0
+
+
+def _is_plain(value: Any, depth: int = 0) -> bool:
+    """워커로 보내도 되는 단순 값인지 확인 (클라이언트/락/연결 객체 제외)"""
+    if isinstance(value, _PLAIN_TYPES):
+        return True
+    if depth > 3:
+        return False
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_plain(v, depth + 1) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain(v, depth + 1) for k, v in value.items())
+    return False
+
+
+class ParseTask:
+    """워커 프로세스에서 실행할 파싱 함수 정보 (크롤러 클래스 + 메서드 이름 + 단순 속성)"""
+
+    def __init__(self, parse_detail: Callable):
+        owner = getattr(parse_detail, "__self__", None)
+        if owner is None:
+            raise TypeError("파싱 함수는 크롤러 인스턴스의 메서드여야 합니다")
+        self.cls = type(owner)
+        if self.cls.__module__ == "__main__":
+            # 단독 실행한 스크립트의 클래스는 워커 프로세스에서 다시 import할 수 없음
+            raise TypeError("단독 실행 스크립트의 크롤러는 프로세스 풀을 사용하지 않습니다")
+        self.method = parse_detail.__name__
+        # 실행 중 채워지는 수집 결과 목록은 제외
+        self.state = {
+            k: v for k, v in vars(owner).items()
+            if k != "articles" and _is_plain(v)
+        }
+        # 클래스/속성이 실제로 전달 가능한지 미리 확인 (불가하면 이벤트 루프에서 파싱)
+        pickle.dumps((self.cls, self.state))
+
+    def to_spec(self) -> Dict:
+        """
+        파일에 보관할 재구성 정보 (원문 보관소/픽스처용)
+
+        pickle 대신 "모듈.클래스.메서드" 이름과 JSON으로 저장 가능한 단순 속성만 남기므로
+        클래스 구조가 바뀌어도 읽을 수 있고, 읽을 때 임의 코드가 실행되지 않습니다.
+        """
+        return {
+            "target": f"{self.cls.__module__}.{self.cls.__qualname__}.{self.method}",
+            # 집합/튜플은 JSON 목록으로 저장
+            "state": json.loads(json.dumps(self.state, ensure_ascii=False, default=list)),
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Dict) -> "ParseTask":
+        """to_spec() 기록에서 파싱 작업 재구성 (현재 코드의 크롤러 클래스를 import)"""
+        module_name, class_name, method = spec["target"].rsplit(".", 2)
+        task = cls.__new__(cls)
+        task.cls = getattr(importlib.import_module(module_name), class_name)
+        if not callable(getattr(task.cls, method, None)):
+            raise AttributeError(f"{class_name}에 파싱 메서드 {method}가 없습니다")
+        task.method = method
+        task.state = dict(spec.get("state") or {})
+        return task
+
+
+def parse_in_worker(task: ParseTask, article: Dict, raw: Any) -> Optional[Dict]:
+    """워커 프로세스: 파싱 전용 인스턴스를 (재)구성해 파싱 메서드 실행"""
+    instance = _worker_instances.get(task.cls)
+    if instance is None:
+        # __init__은 DB/HTTP 연결을 만들므로 호출하지 않음
+        instance = task.cls.__new__(task.cls)
+        _worker_instances[task.cls] = instance
+    instance.__dict__.clear()
+    instance.__dict__.update(task.state)
+    return getattr(instance, task.method)(article, raw)
+
+
+class ParseRunner:
+    """파싱 함수를 프로세스 풀에서 실행 (풀이 없거나 보낼 수 없으면 이벤트 루프에서 직접 실행)"""
+
+    def __init__(self, parse_detail: Callable, name: str, use_pool: bool = True):
+        self.parse_detail = parse_detail
+        self.name = name
+        self.pool = get_parse_pool() if use_pool else None
+        self.task = None
+        # 픽스처 기록 중이면 파싱 입력도 함께 기록 (utils/fixtures.py)
+        from utils.fixtures import get_fixture_recorder
+        self.recorder = get_fixture_recorder()
+        # 원문 보관소가 켜져 있으면 파싱 입력을 보관 (utils/raw_archive.py, 재추출용)
+        from utils.raw_archive import get_raw_archive
+        self.archive = get_raw_archive()
+        if self.pool is not None:
+            try:
+                self.task = ParseTask(parse_detail)
+            except (TypeError, pickle.PicklingError, AttributeError) as e:
+                console.print(f"⚠️ {name} 파싱은 이벤트 루프에서 실행: {str(e)[:60]}")
+                self.pool = None
+
+    async def __call__(self, article: Dict, raw: Any) -> Optional[Dict]:
+        if self.recorder is not None:
+            self.recorder.record_parse_input(self.parse_detail, article, raw)
+        if self.archive is not None:
+            # 공유 지표와 같은 이름(CrawlerManager의 크롤러 이름)으로 보관해 재추출 시 크롤러를 찾을 수 있게 함
+            # (대기열에 넣기만 하고 해시/압축/기록은 보관소의 기록 스레드에서 처리)
+            self.archive.store(current_outlet.get() or self.name, self.parse_detail, article, raw)
+        if self.pool is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self.pool, parse_in_worker, self.task, article, raw
+                )
+            except (BrokenProcessPool, pickle.PicklingError) as e:
+                console.print(f"⚠️ {self.name} 파싱 프로세스 풀 사용 중단: {str(e)[:60]}")
+                self.pool = None
+        return self.parse_detail(article, raw)
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """공유 파싱 프로세스 풀 반환 (설정에서 끈 경우 None)"""
+    global _pool, _pool_size
+    processes = PIPELINE_CONFIG.get("parse_processes", 0)
+    if processes == 0:
+        return None
+    if _pool is None:
+        _pool_size = processes or os.cpu_count() or 1
+        # 풀은 백그라운드 스레드가 이미 실행 중일 때 처음 만들어지므로 fork 대신 새 프로세스에서 워커 시작
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _pool = ProcessPoolExecutor(max_workers=_pool_size, mp_context=multiprocessing.get_context(method))
+    return _pool
+
+
+def parse_pool_size() -> int:
+    """공유 파싱 프로세스 풀의 프로세스 수 (풀이 없으면 0)"""
+    return _pool_size if _pool is not None else 0
+
+
+def shutdown_parse_pool():
+    """파싱 프로세스 풀 종료 (CrawlerManager 종료 시 호출)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+스트리밍 크롤링 파이프라인
+목록 수집 → 본문 요청 → HTML 파싱 → DB 저장을 크기 제한 큐로 연결합니다.
+- 각 단계는 독립된 워커로 동시에 실행 (앞 단계가 끝나기를 기다리지 않음)
+- 큐가 가득 차면 앞 단계가 대기 (backpressure) → 메모리 사용량 일정
+- 저장 단계는 일정 개수 또는 일정 시간마다 배치 저장 → 첫 기사가 수 초 안에 DB에 반영
+  (동기 Supabase 클라이언트를 쓰는 저장 함수는 작업 스레드에서 실행 → 저장 중에도 다른 언론사 작업 진행)
+- 목록에서 발견한 기사는 로컬 URL 인덱스로 먼저 걸러 이미 저장된 기사는 본문 요청 생략
+- HTML 파싱은 프로세스 풀에서 실행 → 파싱 중에도 이벤트 루프의 다운로드가 멈추지 않음
+- 기사별 처리 단계를 프론티어에 기록 → 중단된 실행은 남은 기사부터 이어서 처리
+- 단계별 소요 시간과 기사 처리 결과를 언론사별 지표에 기록 (utils.crawl_metrics)
+"""
+
+import asyncio
+import sqlite3
+import sys
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import PIPELINE_CONFIG
+from utils.scheduler import CrawlScheduler, resource_slot
+from utils.supabase_manager import get_supabase_client
+from utils.url_index import KnownUrlIndex, get_url_index
+from utils.parse_pool import ParseRunner, SkipArticle, parse_pool_size
+from utils.frontier import CrawlFrontier, get_frontier, DISCOVERED, FETCHED, PARSED, SAVED
+from utils.crawl_metrics import current_outlet, get_crawl_metrics, timed_iter
+
+console = Console()
+
+# 단계 종료 신호
+_DONE = object()
+
+
+class CrawlPipeline:
+    """한 언론사의 목록 → 본문 → 파싱 → 저장 스트리밍 파이프라인"""
+
+    def __init__(self, name: str,
+                 discover: AsyncIterator[Dict],
+                 fetch_detail: Callable[[Dict], Awaitable[Any]],
+                 parse_detail: Callable[[Dict, Any], Optional[Dict]],
+                 save_batch: Callable[[List[Dict]], List[str]],
+                 scheduler: Optional[CrawlScheduler] = None,
+                 config: Optional[Dict] = None,
+                 media_id: Optional[str] = None,
+                 url_index: Optional[KnownUrlIndex] = None,
+                 parse_in_process: bool = True,
+                 frontier: Optional[CrawlFrontier] = None):
+        """
+        Args:
+            name: 로그에 표시할 언론사 이름
+            discover: 목록에서 발견한 기사(제목/URL 등)를 순서대로 내보내는 비동기 이터레이터
+            fetch_detail: 기사 상세 페이지 원문(HTML 등)을 가져오는 함수 (실패 시 None)
+            parse_detail: 원문을 파싱해 본문/발행시간을 채운 기사를 반환하는 함수 (실패 시 None, 제외 조건이면 SkipArticle)
+            save_batch: 기사 묶음을 DB에 저장하고 기사별 결과('inserted'/'duplicate'/'skipped'/'failed') 목록을 반환하는 동기 함수
+                        (작업 스레드에서 실행되므로 URL 인덱스 등 이벤트 루프 스레드 전용 자원은 사용하지 않아야 함)
+            scheduler: CrawlerManager가 주입한 스케줄러 (저장 시 DB 슬롯 점유)
+            media_id: 언론사 ID (없으면 name으로 조회해 URL 인덱스 동기화)
+            url_index: 기존 기사 URL 인덱스 (없으면 공유 인덱스 사용)
+            parse_in_process: False면 parse_detail을 이벤트 루프에서 실행 (가벼운 파싱용)
+            frontier: 기사 처리 단계 체크포인트 (없으면 공유 프론티어 사용)
+        """
+        self.name = name
+        self.discover = discover
+        self.fetch_detail = fetch_detail
+        self.parse_detail = parse_detail
+        self.save_batch = save_batch
+        self.scheduler = scheduler
+        self.config = {**PIPELINE_CONFIG, **(config or {})}
+        self.media_id = media_id
+        self.url_index = url_index if url_index is not None else get_url_index()
+        self.frontier = frontier if frontier is not None else get_frontier()
+        # CrawlerManager 실행 시 크롤러 이름, 단독 실행 시 언론사 이름으로 집계
+        self.metrics = get_crawl_metrics().outlet(current_outlet.get() or name)
+
+        # 파싱 함수를 워커 프로세스로 보낼 수 있으면 프로세스 풀 사용
+        self._parse = ParseRunner(parse_detail, name, use_pool=parse_in_process)
+        if self._parse.archive is not None:
+            self._parse.archive.register_saver(current_outlet.get() or name, save_batch)
+
+        self._detail_queue: asyncio.Queue = asyncio.Queue(self.config["detail_queue_size"])
+        self._parse_queue: asyncio.Queue = asyncio.Queue(self.config["parse_queue_size"])
+        self._save_queue: asyncio.Queue = asyncio.Queue(self.config["save_queue_size"])
+
+        # DB 저장이 확인된 기사 (삽입/중복, 본문 없이 워터마크/요약에 필요한 필드만 유지)
+        self.processed: List[Dict] = []
+        # 본문 요청/파싱/저장에 실패한 기사 (워터마크가 이 기사들을 건너뛰지 않도록 전달)
+        self.failed: List[Dict] = []
+        # 파싱/저장 단계에서 제외된 기사 (제외 조건, 짧은 본문 등 다시 시도해도 결과가 같으므로 처리 완료로 간주)
+        self.skipped: List[Dict] = []
+
+        # 통계
+        self.discovered = 0
+        self.resumed = 0
+        self.known_skipped = 0
+        self.fetch_failed = 0
+        self.parse_skipped = 0
+        self.parse_failed = 0
+        self.saved = 0
+        self.save_duplicates = 0
+        self.save_skipped = 0
+        self.save_failed = 0
+
+    @staticmethod
+    def _summary(article: Dict) -> Dict:
+        return {"title": article.get("title", ""), "url": article.get("url"), "published_at": article.get("published_at")}
+
+    def _checkpoint(self, articles: List[Dict], state: str, keep_article: bool = True):
+        """프론티어에 처리 단계 기록 (기록 실패는 수집을 멈추지 않음)"""
+        if not self.frontier:
+            return
+        try:
+            self.frontier.record(self.name, articles, state, keep_article)
+        except sqlite3.Error as e:
+            console.print(f"⚠️ {self.name} 프론티어 기록 실패: {str(e)[:60]}")
+
+    async def _resume_pending(self) -> set:
+        """
+        중단된 실행에서 남은 기사를 이어서 처리
+
+        Returns:
+            set: 이미 처리한(저장 완료 또는 재개 중인) URL
+        """
+        if not self.frontier:
+            return set()
+        handled = self.frontier.saved_urls(self.name)
+        for state, article in self.frontier.pending(self.name):
+            handled.add(article.get("url"))
+            self.resumed += 1
+            if state == PARSED:
+                # 파싱까지 끝난 기사는 본문 요청/파싱 없이 바로 저장
+                await self._save_queue.put(article)
+            else:
+                await self._detail_queue.put(article)
+        if self.resumed:
+            console.print(f"⏯️ {self.name}: 중단된 실행의 기사 {self.resumed}개부터 이어서 처리")
+        return handled
+
+    async def _discover_stage(self):
+        """목록에서 발견한 기사를 본문 요청 큐로 전달"""
+        try:
+            handled = await self._resume_pending()
+            async for article in timed_iter(self.discover, self.metrics, "list"):
+                self.discovered += 1
+                if article.get("url") in handled:
+                    continue
+                # 이미 저장된 기사는 본문을 요청하지 않음
+                started = time.perf_counter()
+                known = bool(self.url_index) and self.url_index.contains(article.get("url"))
+                self.metrics.observe("dedup", time.perf_counter() - started)
+                if known:
+                    self.known_skipped += 1
+                    continue
+                self._checkpoint([article], DISCOVERED)
+                await self._detail_queue.put(article)
+        except Exception as e:
+            console.print(f"❌ {self.name} 목록 수집 중 오류: {str(e)[:80]}")
+
+    async def _fetch_stage(self):
+        """상세 페이지 원문을 가져와 파싱 큐로 전달"""
+        while True:
+            article = await self._detail_queue.get()
+            if article is _DONE:
+                return
+            started = time.perf_counter()
+            try:
+                raw = await self.fetch_detail(article)
+            except Exception as e:
+                console.print(f"❌ 본문 요청 실패: {article.get('title', '')[:30]}... - {str(e)[:50]}")
+                raw = None
+            self.metrics.observe("fetch", time.perf_counter() - started)
+            if raw is None:
+                self.fetch_failed += 1
+                self.failed.append(self._summary(article))
+                continue
+            self._checkpoint([article], FETCHED, keep_article=False)
+            await self._parse_queue.put((article, raw))
+
+    async def _parse_stage(self):
+        """원문을 파싱해 저장 큐로 전달"""
+        while True:
+            item = await self._parse_queue.get()
+            if item is _DONE:
+                return
+            article, raw = item
+            started = time.perf_counter()
+            try:
+                parsed = await self._parse(article, raw)
+            except SkipArticle:
+                self.metrics.observe("parse", time.perf_counter() - started)
+                self.parse_skipped += 1
+                self._mark_skipped([article])
+                continue
+            except Exception as e:
+                console.print(f"❌ 파싱 실패: {article.get('title', '')[:30]}... - {str(e)[:50]}")
+                parsed = None
+            self.metrics.observe("parse", time.perf_counter() - started)
+            # 본문이 비어 있으면 실패로 처리 (워터마크 URL 목록에 들어가지 않아 다음 실행에서 재시도)
+            if parsed is None or not parsed.get("content"):
+                self.parse_failed += 1
+                self.failed.append(self._summary(article))
+                continue
+            self._checkpoint([parsed], PARSED)
+            await self._save_queue.put(parsed)
+
+    async def _save_stage(self):
+        """일정 개수 또는 일정 시간마다 모인 기사를 배치 저장"""
+        batch_size = self.config["save_batch_size"]
+        flush_interval = self.config["save_flush_interval"]
+        batch: List[Dict] = []
+        deadline = None
+        done = False
+
+        while not done:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = await asyncio.wait_for(self._save_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = None
+
+            if item is _DONE:
+                done = True
+            elif item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + flush_interval
+
+            if batch and (done or len(batch) >= batch_size or time.monotonic() >= deadline):
+                await self._flush(batch)
+                batch = []
+                deadline = None
+
+    def _mark_skipped(self, articles: List[Dict]):
+        """제외된 기사 기록 (DB에는 없으므로 URL 인덱스에는 넣지 않고, 재개 시 다시 처리하지 않도록 프론티어에만 완료로 기록)"""
+        self._checkpoint(articles, SAVED, keep_article=False)
+        self.skipped.extend(self._summary(a) for a in articles)
+
+    async def _flush(self, batch: List[Dict]):
+        """
+        배치 저장 후 DB에 반영이 확인된 기사만 저장 완료로 기록
+
+        save_batch는 입력 순서와 같은 기사별 결과('inserted', 'duplicate', 'skipped', 'failed')를 반환해야 하며,
+        삽입/중복 기사만 프론티어(SAVED)와 워터마크에 반영하고, 제외('skipped') 기사는 재시도하지 않도록
+        프론티어에 처리 완료로 기록해 따로 집계하며, 나머지는 저장 실패로 집계합니다.
+        """
+        try:
+            async with resource_slot(self.scheduler, "db"):
+                started = time.perf_counter()
+                try:
+                    statuses = await asyncio.to_thread(self.save_batch, batch)
+                finally:
+                    self.metrics.observe("save", time.perf_counter() - started)
+        except Exception as e:
+            console.print(f"❌ {self.name} 배치 저장 중 오류: {str(e)[:80]}")
+            statuses = ["failed"] * len(batch)
+
+        if not isinstance(statuses, list) or len(statuses) != len(batch):
+            # 기사별 결과를 알 수 없으면 저장되지 않은 것으로 간주 (다음 실행에서 재시도)
+            console.print(f"⚠️ {self.name} 저장 결과를 확인할 수 없어 배치 {len(batch)}개를 실패로 처리")
+            statuses = ["failed"] * len(batch)
+
+        stored = [a for a, status in zip(batch, statuses) if status in ("inserted", "duplicate")]
+        skipped = [a for a, status in zip(batch, statuses) if status == "skipped"]
+        unsaved = [a for a, status in zip(batch, statuses) if status not in ("inserted", "duplicate", "skipped")]
+        # 저장 건수는 실제로 삽입된 기사만 (이미 DB에 있던 중복 기사는 따로 집계)
+        self.saved += statuses.count("inserted")
+        self.save_duplicates += statuses.count("duplicate")
+        self.save_skipped += len(skipped)
+        self.save_failed += len(unsaved)
+        self.failed.extend(self._summary(a) for a in unsaved)
+        if skipped:
+            self._mark_skipped(skipped)
+        if stored:
+            # 저장이 확인된 URL은 로컬 인덱스에 기록 (다음 실행에서 본문 요청 생략, SQLite라 이벤트 루프 스레드에서 처리)
+            if self.url_index:
+                self.url_index.add((a.get("url"), a.get("media_id", self.media_id)) for a in stored)
+            self._checkpoint(stored, SAVED, keep_article=False)
+            self.processed.extend(self._summary(a) for a in stored)
+
+    async def run(self) -> List[Dict]:
+        """
+        파이프라인 실행
+
+        Returns:
+            List[Dict]: DB 저장이 확인된 기사 요약 (제목/URL/발행시간)
+        """
+        fetch_workers = self.config["fetch_workers"]
+        parse_workers = self.config["parse_workers"]
+        if self._parse.pool is not None:
+            # 풀의 모든 프로세스가 쉬지 않도록 파싱 워커 수를 풀 크기 이상으로 유지
+            parse_workers = max(parse_workers, parse_pool_size())
+
+        # 지난 동기화 이후 저장된 URL만 가져와 인덱스 갱신 (DB 슬롯 점유, Supabase 조회는 작업 스레드에서 실행)
+        if self.url_index:
+            async with resource_slot(self.scheduler, "db"):
+                started = time.perf_counter()
+                await self.url_index.sync_outlet(get_supabase_client(), self.name, self.media_id)
+                self.metrics.observe("dedup", time.perf_counter() - started)
+
+        discover = asyncio.create_task(self._discover_stage())
+        fetchers = [asyncio.create_task(self._fetch_stage()) for _ in range(fetch_workers)]
+        parsers = [asyncio.create_task(self._parse_stage()) for _ in range(parse_workers)]
+        saver = asyncio.create_task(self._save_stage())
+        tasks = [discover, *fetchers, *parsers, saver]
+
+        try:
+            # 앞 단계가 끝나면 다음 단계 워커 수만큼 종료 신호 전달
+            await discover
+            for _ in fetchers:
+                await self._detail_queue.put(_DONE)
+            await asyncio.gather(*fetchers)
+            for _ in parsers:
+                await self._parse_queue.put(_DONE)
+            await asyncio.gather(*parsers)
+            await self._save_queue.put(_DONE)
+            await saver
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            self._record_counts()
+
+        # 끝까지 완료된 파이프라인은 다음 실행에서 재개할 기사가 없음
+        if self.frontier:
+            self.frontier.clear(self.name)
+
+        console.print(
+            f"📦 {self.name} 파이프라인 완료: 발견 {self.discovered}, 재개 {self.resumed}, 기존 기사 {self.known_skipped}, 저장 {self.saved}, 중복 {self.save_duplicates}, "
+            f"제외 {self.parse_skipped + self.save_skipped}, 요청 실패 {self.fetch_failed}, 파싱 실패 {self.parse_failed}, 저장 실패 {self.save_failed}"
+        )
+        return self.processed
+
+    def _record_counts(self):
+        """기사 처리 결과를 언론사 지표에 반영"""
+        for key in ("discovered", "resumed", "known_skipped", "fetch_failed", "parse_skipped", "parse_failed", "saved", "save_duplicates", "save_skipped", "save_failed"):
+            self.metrics.count(key, getattr(self, key))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+호스트별 적응형 속도 제한기 (토큰 버킷 + AIMD)
+- 응답이 빠르고 오류가 없으면 동시성과 요청 속도를 점진적으로 증가 (Additive Increase)
+- 429/5xx/타임아웃 발생 시 즉시 절반 수준으로 감소 (Multiplicative Decrease)
+- Retry-After 헤더가 있으면 해당 시간 동안 호스트 요청 중단
+"""
+
+import asyncio
+import sys
+import os
+import time
+from typing import Dict, Optional
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import RATE_LIMIT_CONFIG
+
+# 서버 과부하로 간주하는 상태 코드
+BACKOFF_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class HostRateLimiter:
+    """단일 호스트의 동시성 윈도우와 토큰 버킷을 관리하는 클래스"""
+
+    def __init__(self, host: str, config: Dict):
+        self.host = host
+        self.config = config
+
+        # AIMD 동시성 윈도우
+        self.concurrency = float(config["initial_concurrency"])
+        self.in_flight = 0
+
+        # 토큰 버킷 (초당 요청 수)
+        self.rate = float(config["initial_rate"])
+        self.tokens = float(config["burst"])
+        self.last_refill = time.monotonic()
+
+        # Retry-After 등으로 요청을 멈춰야 하는 시각
+        self.blocked_until = 0.0
+
+        # 통계
+        self.total_requests = 0
+        self.backoff_count = 0
+
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        """요청 슬롯과 토큰을 확보할 때까지 대기"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.concurrency))
+            self.in_flight += 1
+
+        try:
+            await self._wait_for_token()
+        except BaseException:
+            await self._release_slot()
+            raise
+
+    async def _wait_for_token(self):
+        """토큰 버킷에서 토큰 하나를 꺼낼 때까지 대기"""
+        while True:
+            now = time.monotonic()
+
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+
+            # 경과 시간만큼 토큰 충전
+            self.tokens = min(float(self.config["burst"]), self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def release(self, latency: float, status_code: Optional[int] = None,
+                      timed_out: bool = False, retry_after: Optional[float] = None):
+        """
+        요청 결과를 반영하여 동시성/속도 조정 후 슬롯 반환
+
+        Args:
+            latency: 요청 소요 시간 (초)
+            status_code: HTTP 상태 코드 (연결 오류 시 None)
+            timed_out: 타임아웃 여부
+            retry_after: Retry-After 헤더 값 (초)
+        """
+        self.total_requests += 1
+
+        if timed_out or status_code in BACKOFF_STATUS_CODES:
+            self._decrease(retry_after)
+        elif status_code is not None and latency <= self.config["latency_target"]:
+            self._increase()
+
+        await self._release_slot()
+
+    async def _release_slot(self):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def _increase(self):
+        """정상 응답: 동시성과 속도를 조금씩 증가"""
+        cfg = self.config
+        self.concurrency = min(cfg["max_concurrency"], self.concurrency + cfg["additive_increase"] / self.concurrency)
+        self.rate = min(cfg["max_rate"], self.rate + cfg["additive_increase"])
+
+    def _decrease(self, retry_after: Optional[float]):
+        """과부하 신호: 동시성과 속도를 크게 감소"""
+        cfg = self.config
+        self.backoff_count += 1
+        self.concurrency = max(cfg["min_concurrency"], self.concurrency * cfg["multiplicative_decrease"])
+        self.rate = max(cfg["min_rate"], self.rate * cfg["multiplicative_decrease"])
+        self.tokens = 0.0
+
+        pause = retry_after if retry_after is not None else cfg["backoff_pause"]
+        self.blocked_until = max(self.blocked_until, time.monotonic() + min(pause, cfg["max_retry_after"]))
+
+    def snapshot(self) -> Dict:
+        """현재 상태 반환 (로그/요약용)"""
+        return {
+            "host": self.host,
+            "concurrency": round(self.concurrency, 1),
+            "rate": round(self.rate, 1),
+            "requests": self.total_requests,
+            "backoffs": self.backoff_count,
+        }
+
+
+class AdaptiveRateLimiter:
+    """호스트별 HostRateLimiter를 관리하는 클래스"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**RATE_LIMIT_CONFIG, **(config or {})}
+        self._hosts: Dict[str, HostRateLimiter] = {}
+
+    def for_host(self, host: str) -> HostRateLimiter:
+        """호스트별 제한기 반환 (없으면 생성)"""
+        if host not in self._hosts:
+            self._hosts[host] = HostRateLimiter(host, self.config)
+        return self._hosts[host]
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """전체 호스트 상태 반환"""
+        return {host: limiter.snapshot() for host, limiter in self._hosts.items()}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 단위)를 float로 변환 (HTTP 날짜 형식은 무시)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
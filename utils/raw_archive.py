@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+원문 HTML 보관소 (재수집 없이 본문 재추출)
+파싱 단계에 들어간 모든 상세 페이지 원문을 압축해 로컬에 보관합니다.
+선택자가 깨져 본문 추출에 실패해도 scripts/reextract.py로 보관된 원문을 다시 파싱하면 되므로
+목록에서 사라진 기사까지 네트워크 요청 없이 복구할 수 있습니다.
+- 원문은 내용 해시(SHA-256)를 이름으로 한 zstd 압축 파일 (같은 원문은 한 번만 저장)
+  (zstandard 패키지가 없으면 gzip으로 저장하며, 읽을 때는 파일마다 기록된 형식을 따름)
+- 색인은 URL + 수집 시각 단위로 기사 정보(목록에서 얻은 제목/URL 등)와 함께 SQLite에 기록
+- 크롤러별 파싱 메서드("모듈.클래스.메서드" 이름 + 단순 속성, JSON)와 저장 메서드 이름을 함께 기록
+  → 재추출은 현재 코드로 실행 (pickle을 쓰지 않아 클래스 구조가 바뀌어도 보관본을 읽을 수 있음)
+- 해시/압축/파일 쓰기/색인 기록은 전용 기록 스레드에서 처리 (크롤러 이벤트 루프를 막지 않고 색인은 묶어서 커밋)
+- 대기열은 크기 제한 (압축/쓰기가 수집 속도를 못 따라가면 이벤트 루프를 멈추지 않고 새 원문은 보관하지 않음, 건수 집계)
+"""
+
+import gzip
+import hashlib
+import json
+import pickle
+import queue
+import sqlite3
+import sys
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+from config.crawler_config import RAW_ARCHIVE_CONFIG
+from utils.parse_pool import ParseTask
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+console = Console()
+
+
+def encode_raw(raw: Any) -> Optional[Tuple[str, bytes]]:
+    """원문을 (종류, 바이트)로 변환 (문자열/바이트/JSON 외의 원문은 보관하지 않음)"""
+    if isinstance(raw, bytes):
+        return "bytes", raw
+    if isinstance(raw, str):
+        return "text", raw.encode("utf-8")
+    if isinstance(raw, (dict, list)):
+        return "json", json.dumps(raw, ensure_ascii=False, default=str).encode("utf-8")
+    return None
+
+
+def decode_raw(kind: str, data: bytes) -> Any:
+    if kind == "bytes":
+        return data
+    if kind == "text":
+        return data.decode("utf-8")
+    return json.loads(data)
+
+
+def read_object(path: str) -> bytes:
+    """압축된 원문 파일 읽기 (확장자로 형식 판별)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".zst"):
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class RawArchive:
+    """내용 주소 방식 원문 보관소"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**RAW_ARCHIVE_CONFIG, **(config or {})}
+        self.root = os.path.join(PROJECT_ROOT, self.config["dir"])
+        os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+
+        self._compressor = zstandard.ZstdCompressor(level=self.config["zstd_level"]) if ZSTD_AVAILABLE else None
+        self._suffix = ".zst" if ZSTD_AVAILABLE else ".gz"
+
+        self._db_path = os.path.join(self.root, "index.sqlite")
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT, fetched_at REAL, outlet TEXT, method TEXT, digest TEXT, path TEXT, kind TEXT, "
+            "article TEXT, PRIMARY KEY (url, fetched_at))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_outlet ON pages (outlet, fetched_at)")
+        # 예전 형식(pickle로 저장한 파싱 작업)은 읽지 않음 - 다음 수집 때 parsers에 다시 기록됨
+        self._conn.execute("DROP TABLE IF EXISTS tasks")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parsers ("
+            "outlet TEXT, method TEXT, spec TEXT, updated_at REAL, PRIMARY KEY (outlet, method))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS savers (outlet TEXT PRIMARY KEY, save_method TEXT)"
+        )
+        self._conn.commit()
+
+        # 이번 실행에서 파싱 메서드를 기록했는지 여부 ((언론사, 메서드) → 보관 가능 여부, 기록 스레드 전용)
+        self._registered: Dict[Tuple[str, str], bool] = {}
+
+        # 보관 대기열과 기록 스레드 (첫 store() 호출 시 시작)
+        self._queue: "queue.Queue" = queue.Queue(self.config["queue_size"])
+        self._writer: Optional[threading.Thread] = None
+
+        # 통계
+        self.stored = 0
+        self.deduplicated = 0
+        self.dropped = 0
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest + self._suffix)
+
+    def _register_task(self, conn: sqlite3.Connection, outlet: str, parse_detail: Callable) -> bool:
+        """크롤러의 파싱 메서드를 기록 (실행마다 한 번, 현재 속성값으로 갱신)"""
+        method = getattr(parse_detail, "__name__", "")
+        key = (outlet, method)
+        if key not in self._registered:
+            try:
+                task = ParseTask(parse_detail)
+            except (TypeError, pickle.PicklingError, AttributeError):
+                self._registered[key] = False
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO parsers VALUES (?, ?, ?, ?)",
+                (outlet, method, json.dumps(task.to_spec(), ensure_ascii=False), time.time()),
+            )
+            self._registered[key] = True
+        return self._registered[key]
+
+    def register_saver(self, outlet: str, save_batch: Callable):
+        """파이프라인 저장 메서드 이름 기록 (재추출한 새 기사를 같은 형식으로 저장할 때 사용)"""
+        # 크롤러 인스턴스의 메서드가 아니면 재추출 시 다시 호출할 수 없음
+        if getattr(save_batch, "__self__", None) is None:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO savers VALUES (?, ?)", (outlet, save_batch.__name__)
+        )
+        self._conn.commit()
+
+    def store(self, outlet: str, parse_detail: Callable, article: Dict, raw: Any):
+        """파싱 입력(기사 정보 + 원문) 보관 요청 (실제 기록은 기록 스레드에서 처리)"""
+        url = article.get("url")
+        # 파싱 중에 바뀔 수 있는 기사 정보와 JSON 원문은 호출 시점 상태로 고정
+        encoded = encode_raw(raw)
+        if not url or encoded is None:
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="raw-archive", daemon=True)
+            self._writer.start()
+        try:
+            # 이벤트 루프에서 호출되므로 기다리지 않음 (대기열이 가득 차면 이 원문은 보관하지 않음)
+            self._queue.put_nowait((outlet, parse_detail, dict(article), encoded, time.time()))
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self):
+        """대기열의 원문을 압축해 저장하고 색인은 묶어서 커밋 (기록 스레드 전용 연결 사용)"""
+        conn = sqlite3.connect(self._db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        closing = False
+        while not closing:
+            items = [self._queue.get()]
+            # 쌓여 있는 항목은 한 번에 처리해 커밋 횟수를 줄임
+            while len(items) < self.config["commit_every"]:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in items:
+                if item is None:
+                    closing = True
+                    continue
+                try:
+                    self._write(conn, *item)
+                except Exception as e:
+                    # 원문 보관 실패는 크롤링에 영향 없음
+                    console.print(f"⚠️ 원문 보관 실패: {str(e)[:80]}")
+            conn.commit()
+        conn.close()
+
+    def _write(self, conn: sqlite3.Connection, outlet: str, parse_detail: Callable, article: Dict,
+               encoded: Tuple[str, bytes], fetched_at: float):
+        if not self._register_task(conn, outlet, parse_detail):
+            return
+        kind, data = encoded
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            self.deduplicated += 1
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            compressed = self._compressor.compress(data) if self._compressor else gzip.compress(data)
+            # 임시 파일에 쓴 뒤 교체해 중단되어도 깨진 원문 파일이 남지 않도록 함
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+            self.stored += 1
+
+        conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (article["url"], fetched_at, outlet, parse_detail.__name__, digest,
+             os.path.relpath(path, self.root), kind, json.dumps(article, ensure_ascii=False, default=str)),
+        )
+
+    def tasks(self) -> Dict[Tuple[str, str], ParseTask]:
+        """기록된 파싱 작업 ((언론사, 메서드) → ParseTask, 클래스/메서드를 찾을 수 없는 항목 제외)"""
+        tasks = {}
+        for outlet, method, spec in self._conn.execute("SELECT outlet, method, spec FROM parsers"):
+            try:
+                tasks[(outlet, method)] = ParseTask.from_spec(json.loads(spec))
+            except (ImportError, AttributeError, ValueError) as e:
+                console.print(f"⚠️ {outlet} 파싱 작업을 불러올 수 없음: {str(e)[:60]}")
+        return tasks
+
+    def savers(self) -> Dict[str, str]:
+        return dict(self._conn.execute("SELECT outlet, save_method FROM savers"))
+
+    def iter_pages(self, outlets=None, since: Optional[float] = None, until: Optional[float] = None,
+                   latest_only: bool = True) -> Iterator[Dict]:
+        """
+        보관된 페이지 조회
+
+        Args:
+            outlets: 조회할 언론사 (없으면 전체)
+            since / until: 수집 시각 범위 (Unix 시각)
+            latest_only: URL별로 가장 최근에 수집한 원문만 반환
+        """
+        query = "SELECT url, fetched_at, outlet, method, path, kind, article FROM pages WHERE 1=1"
+        params = []
+        if outlets:
+            query += f" AND outlet IN ({','.join('?' * len(outlets))})"
+            params += list(outlets)
+        if since is not None:
+            query += " AND fetched_at >= ?"
+            params.append(since)
+        if until is not None:
+            query += " AND fetched_at < ?"
+            params.append(until)
+        if latest_only:
+            query += " AND fetched_at = (SELECT MAX(p.fetched_at) FROM pages p WHERE p.url = pages.url)"
+        query += " ORDER BY outlet, fetched_at"
+        for url, fetched_at, outlet, method, path, kind, article in self._conn.execute(query, params):
+            yield {
+                "url": url, "fetched_at": fetched_at, "outlet": outlet, "method": method,
+                "path": os.path.join(self.root, path), "kind": kind, "article": json.loads(article),
+            }
+
+    def prune(self) -> int:
+        """
+        보관 기간이 지난 색인과 더 이상 참조되지 않는 원문 파일 정리
+
+        Returns:
+            int: 삭제한 원문 파일 수
+        """
+        cutoff = time.time() - self.config["max_age_days"] * 86400
+        deleted = self._conn.execute("DELETE FROM pages WHERE fetched_at < ?", (cutoff,)).rowcount
+        self._conn.commit()
+        if not deleted:
+            return 0
+
+        referenced = {row[0] for row in self._conn.execute("SELECT DISTINCT path FROM pages")}
+        removed = 0
+        objects = os.path.join(self.root, "objects")
+        for directory in os.listdir(objects):
+            for name in os.listdir(os.path.join(objects, directory)):
+                relpath = os.path.join("objects", directory, name)
+                if relpath not in referenced:
+                    os.remove(os.path.join(self.root, relpath))
+                    removed += 1
+        return removed
+
+    def close(self):
+        """대기 중인 원문을 모두 기록한 뒤 보관소 닫기"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        if self.stored or self.deduplicated:
+            console.print(f"🗄️ 원문 보관: 새 원문 {self.stored}개, 중복 원문 {self.deduplicated}개")
+        if self.dropped:
+            console.print(f"⚠️ 보관 대기열이 가득 차 보관하지 못한 원문 {self.dropped}개 (queue_size 조정 필요)")
+        self._conn.close()
+
+
+# 전역 인스턴스 (지연 초기화) - 싱글톤 패턴
+_raw_archive = None
+
+
+def get_raw_archive() -> Optional[RawArchive]:
+    """원문 보관소 인스턴스를 반환 (비활성화 시 None)"""
+    global _raw_archive
+    if not RAW_ARCHIVE_CONFIG["enabled"]:
+        return None
+    if _raw_archive is None:
+        _raw_archive = RawArchive()
+    return _raw_archive
+
+
+def close_raw_archive():
+    """원문 보관소 닫기 (CrawlerManager 종료 시 호출)"""
+    global _raw_archive
+    if _raw_archive is not None:
+        _raw_archive.close()
+        _raw_archive = None
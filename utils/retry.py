@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+공통 재시도 / 백오프 / 회로 차단기 (RETRY_CONFIG)
+공유 HTTP 클라이언트의 전송 계층에서 모든 수집기의 요청에 같은 재시도 정책을 적용합니다.
+- 타임아웃/연결 오류/429/5xx는 지터를 섞은 지수 백오프로 재시도 (GET/HEAD만)
+- 재시도 예산: 전체 요청 대비 재시도 비율을 제한해 장애 시 재시도 폭주 방지
+- 호스트별 회로 차단기: 연속 실패가 쌓이면 일정 시간 요청을 즉시 실패시키고,
+  대기 후에는 시험 요청 한 건으로 복구 여부 확인
+"""
+
+import asyncio
+import random
+import sys
+import os
+import time
+from typing import Dict, Optional
+
+import httpx
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import RETRY_CONFIG
+
+# 재시도할 상태 코드 (일시적인 과부하/장애)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 재시도해도 안전한 메서드
+IDEMPOTENT_METHODS = {"GET", "HEAD"}
+
+
+class CircuitOpenError(httpx.TransportError):
+    """회로가 열린 호스트로의 요청 (실제 요청 없이 즉시 실패)"""
+
+
+class CircuitBreaker:
+    """단일 호스트의 연속 실패 횟수와 차단 상태를 관리하는 클래스"""
+
+    def __init__(self, host: str, config: Dict):
+        self.host = host
+        self.config = config
+        self.failures = 0            # 연속 실패 횟수
+        self.opened_until = 0.0      # 차단이 풀리는 시각
+        self.trial_in_flight = False  # 차단 해제 후 시험 요청 진행 여부
+
+        # 통계
+        self.open_count = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_until == 0.0:
+            return "closed"
+        return "open" if time.monotonic() < self.opened_until else "half-open"
+
+    def allow(self) -> bool:
+        """요청 가능 여부 (차단 중이면 False, 대기 후에는 시험 요청 한 건만 허용)"""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_until = 0.0
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        # 시험 요청 실패 또는 연속 실패 한도 도달 시 차단
+        if self.trial_in_flight or self.failures >= self.config["breaker_failures"]:
+            if self.state != "open":
+                self.open_count += 1
+            self.opened_until = time.monotonic() + self.config["breaker_cooldown"]
+            self.trial_in_flight = False
+
+
+class RetryController:
+    """재시도 정책, 재시도 예산, 호스트별 회로 차단기를 관리하는 클래스"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**RETRY_CONFIG, **(config or {})}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+        # 통계 (재시도 예산 계산에도 사용)
+        self.requests = 0
+        self.retries = 0
+        self.budget_exhausted = 0
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """호스트별 회로 차단기 반환 (없으면 생성)"""
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(host, self.config)
+        return self._breakers[host]
+
+    def backoff(self, attempt: int) -> float:
+        """지터를 섞은 지수 백오프 대기 시간 (full jitter)"""
+        ceiling = min(self.config["max_delay"], self.config["retry_delay"] * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def take_retry(self) -> bool:
+        """재시도 예산에서 한 번 차감 (예산이 없으면 False)"""
+        budget = self.config["retry_budget_min"] + self.requests * self.config["retry_budget_ratio"]
+        if self.retries >= budget:
+            self.budget_exhausted += 1
+            return False
+        self.retries += 1
+        return True
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """회로 차단기가 동작한 호스트 상태 (요약 출력용)"""
+        return {
+            host: {"state": b.state, "opened": b.open_count, "rejected": b.rejected}
+            for host, b in self._breakers.items() if b.open_count
+        }
+
+
+class RetryingTransport(httpx.AsyncBaseTransport):
+    """재시도와 호스트별 회로 차단을 적용하는 전송 계층 래퍼"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, retry: Optional[RetryController] = None):
+        self._transport = transport
+        self.retry = retry or RetryController()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self.retry.breaker(request.url.host)
+        retryable = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"회로 차단 중인 호스트: {request.url.host}", request=request)
+
+            self.retry.requests += 1
+            try:
+                response = await self._transport.handle_async_request(request)
+            except (httpx.TimeoutException, httpx.NetworkError):
+                breaker.record_failure()
+                if not self._should_retry(retryable, attempt, breaker):
+                    raise
+            except BaseException:
+                # 취소 등으로 시험 요청이 끝나지 못해도 다음 요청이 시험할 수 있도록 해제
+                breaker.trial_in_flight = False
+                raise
+            else:
+                # 429는 호스트가 살아 있다는 신호이므로 실패로 세지 않음 (속도 조절은 속도 제한기가 담당)
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+                if response.status_code not in RETRY_STATUS_CODES or \
+                        not self._should_retry(retryable, attempt, breaker):
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(self.retry.backoff(attempt))
+            attempt += 1
+            request.extensions["retries"] = attempt  # 언론사별 지표 집계용 (utils.crawl_metrics)
+
+    def _should_retry(self, retryable: bool, attempt: int, breaker: CircuitBreaker) -> bool:
+        return (
+            retryable
+            and attempt < self.retry.config["max_retries"]
+            and breaker.state != "open"
+            and self.retry.take_retry()
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
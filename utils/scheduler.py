@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+자원 클래스 기반 크롤링 스케줄러
+단계별 배리어 없이 모든 작업을 하나의 대기열에 넣고,
+워커가 실행 가능한(필요 자원이 비어 있는) 작업을 먼저 가져가 실행합니다.
+- 자원 클래스: http (크롤러 작업 단위) / db (작업 내부의 URL 인덱스 동기화와 배치 저장 단위)
+- 목록/본문 요청은 슬롯을 따로 점유하지 않음 (호스트별 동시 요청은 공유 HTTP 클라이언트의 속도 제한기가 조절)
+- 앞 작업이 자원을 기다리는 동안 뒤 작업이 먼저 실행됨 (head-of-line blocking 방지)
+"""
+
+import asyncio
+import sys
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import SCHEDULER_CONFIG
+
+
+class ScheduledJob:
+    """스케줄러에 등록되는 작업"""
+
+    def __init__(self, name: str, func: Callable[[], Awaitable[Any]],
+                 resources: Tuple[str, ...] = ("http",), priority: int = 0):
+        self.name = name
+        self.func = func
+        self.resources = resources
+        self.priority = priority  # 높을수록 먼저 실행
+        self.result = None
+
+
+class CrawlScheduler:
+    """자원 클래스별 슬롯을 관리하며 작업을 분배하는 스케줄러"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**SCHEDULER_CONFIG, **(config or {})}
+        self.capacity: Dict[str, int] = dict(self.config["resource_slots"])
+        self.in_use: Dict[str, int] = {name: 0 for name in self.capacity}
+
+        self._pending: List[ScheduledJob] = []
+        self._condition = asyncio.Condition()
+
+    def submit(self, job: ScheduledJob):
+        """작업 등록 (우선순위가 높은 작업이 앞에 오도록 정렬)"""
+        unknown = [r for r in job.resources if r not in self.capacity]
+        if unknown:
+            raise ValueError(f"알 수 없는 자원 클래스: {', '.join(unknown)}")
+
+        self._pending.append(job)
+        self._pending.sort(key=lambda j: -j.priority)
+
+    def _is_available(self, resources: Tuple[str, ...]) -> bool:
+        return all(self.in_use[r] < self.capacity[r] for r in resources)
+
+    def _take_runnable_job(self) -> Optional[ScheduledJob]:
+        """필요 자원이 모두 비어 있는 첫 작업을 꺼내고 자원 점유"""
+        for index, job in enumerate(self._pending):
+            if self._is_available(job.resources):
+                for r in job.resources:
+                    self.in_use[r] += 1
+                return self._pending.pop(index)
+        return None
+
+    async def _release(self, resources: Tuple[str, ...]):
+        async with self._condition:
+            for r in resources:
+                self.in_use[r] -= 1
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self, resource: str):
+        """
+        작업 내부의 세부 단계(예: DB 저장)에서 자원 슬롯 하나를 점유
+
+        Args:
+            resource: 자원 클래스 이름 (http / db)
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._is_available((resource,)))
+            self.in_use[resource] += 1
+        try:
+            yield
+        finally:
+            await self._release((resource,))
+
+    async def _worker(self):
+        """실행 가능한 작업을 계속 가져와 실행"""
+        while True:
+            async with self._condition:
+                job = None
+                while self._pending:
+                    job = self._take_runnable_job()
+                    if job:
+                        break
+                    await self._condition.wait()
+                if job is None:
+                    return
+
+            try:
+                job.result = await job.func()
+            except Exception as e:
+                job.result = e
+            finally:
+                await self._release(job.resources)
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        등록된 모든 작업을 실행
+
+        Returns:
+            Dict[str, Any]: 작업 이름별 결과 (예외 발생 시 예외 객체)
+        """
+        jobs = list(self._pending)
+        workers = min(self.config["workers"], len(jobs)) or 1
+        await asyncio.gather(*(self._worker() for _ in range(workers)))
+        return {job.name: job.result for job in jobs}
+
+
+@asynccontextmanager
+async def resource_slot(scheduler: Optional[CrawlScheduler], resource: str):
+    """
+    스케줄러가 주입된 경우에만 자원 슬롯을 점유 (단독 실행 시에는 제한 없음)
+
+    Args:
+        scheduler: CrawlerManager가 주입한 스케줄러
+        resource: 자원 클래스 이름
+    """
+    if scheduler is None:
+        yield
+        return
+
+    async with scheduler.slot(resource):
+        yield
@@ -4,16 +4,103 @@ Supabase 데이터베이스 관리 클래스
 """
 
 import os
+import threading
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from rich.console import Console
 
+from utils.near_duplicate import get_near_duplicate_index
+from config.crawler_config import NEAR_DUP_CONFIG
+
 load_dotenv()
 
 console = Console()
 
+# media_outlets 캐시 유지 시간 (초)
+MEDIA_OUTLET_CACHE_TTL = 600
+
+
+class MediaOutletRegistry:
+    """media_outlets 테이블을 한 번 읽어 메모리에서 조회하는 프로세스 공용 캐시"""
+    
+    def __init__(self, ttl: float = MEDIA_OUTLET_CACHE_TTL):
+        self.ttl = ttl
+        self._by_id: Dict[Any, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        # 없는 언론사 이름 → 확인한 시각 (설정 오류인 이름을 배치마다 다시 조회하지 않도록 같은 TTL로 캐시)
+        self._missing: Dict[str, float] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+    
+    def _ensure_loaded(self, client: Client):
+        """캐시가 비었거나 만료되었으면 전체 테이블을 다시 읽음"""
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._is_fresh():
+                return
+            result = client.table('media_outlets').select('*').execute()
+            self._by_id, self._by_name, self._missing = {}, {}, {}
+            for outlet in result.data or []:
+                self._store(outlet)
+            self._loaded_at = time.monotonic()
+    
+    def _store(self, outlet: Dict[str, Any]):
+        self._by_id[outlet['id']] = outlet
+        if outlet.get('name'):
+            self._by_name[outlet['name']] = outlet
+    
+    def get_by_name(self, client: Client, name: str) -> Optional[Dict[str, Any]]:
+        """이름으로 언론사 조회 (캐시에 없으면 해당 행만 한 번 더 확인, 없다는 결과도 TTL 동안 캐시)"""
+        self._ensure_loaded(client)
+        outlet = self._by_name.get(name)
+        if outlet is not None:
+            return outlet
+        checked_at = self._missing.get(name)
+        if checked_at is not None and time.monotonic() - checked_at < self.ttl:
+            return None
+        result = client.table('media_outlets').select('*').eq('name', name).execute()
+        if result.data:
+            outlet = result.data[0]
+            self.register(outlet)
+        else:
+            with self._lock:
+                self._missing[name] = time.monotonic()
+        return outlet
+    
+    def get_by_id(self, client: Client, media_id: Any) -> Optional[Dict[str, Any]]:
+        """ID로 언론사 조회"""
+        self._ensure_loaded(client)
+        return self._by_id.get(media_id)
+    
+    def bias_mapping(self, client: Client) -> Dict[Any, str]:
+        """언론사 ID별 bias 매핑"""
+        self._ensure_loaded(client)
+        return {media_id: outlet.get('bias') for media_id, outlet in self._by_id.items()}
+    
+    def register(self, outlet: Dict[str, Any]):
+        """새로 생성/조회한 언론사를 캐시에 추가"""
+        with self._lock:
+            self._store(outlet)
+            self._missing.pop(outlet.get('name'), None)
+    
+    def invalidate(self):
+        """다음 조회 시 전체 테이블을 다시 읽도록 캐시 무효화"""
+        with self._lock:
+            self._loaded_at = None
+            self._missing = {}
+
+
+# 프로세스 공용 언론사 캐시
+media_outlet_registry = MediaOutletRegistry()
+
+
 class SupabaseManager:
     """Supabase 데이터베이스 관리 클래스"""
     
@@ -32,7 +119,7 @@ class SupabaseManager:
     
     def get_media_outlet(self, name: str) -> Optional[Dict[str, Any]]:
         """
-        media_outlets 테이블에서 언론사 정보 조회
+        media_outlets 테이블에서 언론사 정보 조회 (프로세스 공용 캐시 사용)
         
         Args:
             name: 언론사 이름
@@ -44,10 +131,7 @@ class SupabaseManager:
             return None
             
         try:
-            result = self.client.table('media_outlets').select('*').eq('name', name).execute()
-            if result.data:
-                return result.data[0]
-            return None
+            return media_outlet_registry.get_by_name(self.client, name)
         except Exception as e:
             console.print(f"❌ 언론사 조회 실패: {str(e)}")
             return None
@@ -75,6 +159,7 @@ class SupabaseManager:
             }
             result = self.client.table('media_outlets').insert(data).execute()
             if result.data:
+                media_outlet_registry.register(result.data[0])
                 console.print(f"✅ 언론사 생성 완료: {name} (ID: {result.data[0]['id']})")
                 return result.data[0]['id']
             return None
@@ -82,6 +167,26 @@ class SupabaseManager:
             console.print(f"❌ 언론사 생성 실패: {str(e)}")
             return None
     
+    def get_media_bias_mapping(self) -> Dict[Any, str]:
+        """
+        언론사 ID별 bias 매핑 조회 (프로세스 공용 캐시 사용)
+        
+        Returns:
+            {언론사 ID: bias} 딕셔너리 (조회 실패 시 빈 딕셔너리)
+        """
+        if not self.client:
+            return {}
+        
+        try:
+            return media_outlet_registry.bias_mapping(self.client)
+        except Exception as e:
+            console.print(f"❌ 언론사 bias 매핑 조회 실패: {str(e)}")
+            return {}
+    
+    def invalidate_media_outlets(self):
+        """언론사 캐시 무효화 (media_outlets 테이블을 직접 수정한 경우 호출)"""
+        media_outlet_registry.invalidate()
+    
     def insert_article(self, article: Dict[str, Any]) -> bool:
         """
         articles 테이블에 기사 삽입
@@ -111,6 +216,138 @@ class SupabaseManager:
             console.print(f"❌ 기사 삽입 오류: {str(e)}")
             return False
     
+    def insert_articles_bulk(self, articles: List[Dict[str, Any]], chunk_size: int = 100) -> List[str]:
+        """
+        articles 테이블에 여러 기사를 청크 단위로 한 번에 삽입 (url 기준 upsert)
+        
+        이미 같은 URL이 있는 행은 덮어쓰지 않고 건너뜁니다.
+        청크 요청이 실패하면 해당 청크만 한 건씩 다시 삽입해 행별 결과를 확인합니다.
+        
+        Args:
+            articles: 기사 데이터 딕셔너리 목록
+            chunk_size: 요청 한 번에 보낼 최대 행 수
+            
+        Returns:
+            입력 순서와 같은 행별 상태 목록 ('inserted', 'duplicate', 'failed')
+        """
+        if not self.client:
+            return ['failed'] * len(articles)
+        
+        statuses: List[str] = []
+        rows_all: List[Dict[str, Any]] = []
+        for start in range(0, len(articles), chunk_size):
+            chunk = articles[start:start + chunk_size]
+            rows = []
+            for article in chunk:
+                row = dict(article)
+                # published_at이 datetime 객체인 경우 isoformat 문자열로 변환
+                if isinstance(row.get('published_at'), datetime):
+                    row['published_at'] = row['published_at'].isoformat()
+                rows.append(row)
+            rows_all.extend(rows)
+            
+            try:
+                result = self.client.table('articles').upsert(
+                    rows, on_conflict='url', ignore_duplicates=True
+                ).execute()
+                # 중복 무시 upsert는 실제로 삽입된 행만 반환
+                inserted_urls = {row.get('url') for row in (result.data or [])}
+                statuses.extend('inserted' if row.get('url') in inserted_urls else 'duplicate' for row in rows)
+            except Exception as e:
+                console.print(f"⚠️ 청크 삽입 실패 ({len(rows)}개) - 개별 삽입으로 재시도: {str(e)[:80]}")
+                for row in rows:
+                    try:
+                        result = self.client.table('articles').insert(row).execute()
+                        statuses.append('inserted' if result.data else 'failed')
+                    except Exception as row_error:
+                        # 고유 제약 위반은 중복으로 처리
+                        statuses.append('duplicate' if '23505' in str(row_error) else 'failed')
+        
+        # 새로 삽입된 기사는 유사 중복(통신사 기사 재게재) 여부를 확인해 대표 기사에 연결
+        # (SimHash 계산/색인 조회는 색인의 작업 스레드에서 실행해 크롤러 이벤트 루프를 막지 않음)
+        near_duplicates = get_near_duplicate_index()
+        inserted_rows = [row for row, status in zip(rows_all, statuses) if status == 'inserted']
+        if near_duplicates and inserted_rows:
+            near_duplicates.submit(inserted_rows, self.save_duplicate_links)
+        
+        console.print(
+            f"💾 일괄 저장: 삽입 {statuses.count('inserted')}개, "
+            f"중복 {statuses.count('duplicate')}개, 실패 {statuses.count('failed')}개"
+        )
+        return statuses
+    
+    def save_duplicate_links(self, links: List[Dict[str, Any]]) -> int:
+        """
+        유사 중복 기사 → 대표 기사 연결 저장 (실패해도 기사 저장에는 영향 없음)
+        
+        Args:
+            links: NearDuplicateIndex.link_batch() 결과
+            
+        Returns:
+            저장한 연결 수
+        """
+        if not self.client or not links:
+            return 0
+        try:
+            self.client.table(NEAR_DUP_CONFIG["table"]).upsert(links, on_conflict='url').execute()
+            console.print(f"🔗 유사 중복 연결 {len(links)}개 저장")
+            return len(links)
+        except Exception as e:
+            console.print(f"⚠️ 유사 중복 연결 저장 실패: {str(e)[:80]}")
+            return 0
+    
+    def mark_duplicate_articles(self, ids: List[Any], fields: Optional[Dict[str, Any]] = None,
+                                chunk_size: int = 100) -> int:
+        """
+        대표 기사에 연결된 중복 기사 표시 (articles.is_duplicate, 임베딩 조회 대상에서 제외)
+        
+        Args:
+            ids: 중복 기사 ID 목록
+            fields: 함께 갱신할 컬럼 (예: 전처리 완료 표시)
+            chunk_size: 요청 한 번에 넣을 최대 ID 수
+            
+        Returns:
+            표시한 기사 수
+        """
+        if not self.client or not ids:
+            return 0
+        marked = 0
+        for start in range(0, len(ids), chunk_size):
+            try:
+                result = self.client.table('articles').update({
+                    'is_duplicate': True, **(fields or {})
+                }).in_('id', ids[start:start + chunk_size]).execute()
+                marked += len(result.data or [])
+            except Exception as e:
+                console.print(f"⚠️ 중복 기사 표시 실패: {str(e)[:80]}")
+        return marked
+    
+    def fetch_duplicate_links(self, urls: List[str], column: str = 'url', chunk_size: int = 20) -> List[Dict[str, Any]]:
+        """
+        주어진 기사와 관련된 유사 중복 연결만 조회 (전처리/임베딩/클러스터링 단계에서 사용)
+        
+        Args:
+            urls: 조회할 기사 URL 목록
+            column: 'url'이면 해당 기사가 중복인 연결, 'canonical_url'이면 해당 기사를 대표로 하는 연결
+            chunk_size: 요청 한 번에 넣을 최대 URL 수 (URL이 GET 쿼리 문자열에 들어가므로 주소 길이 제한 이내로 유지)
+            
+        Returns:
+            연결 목록 {url, canonical_url, media_id} (테이블이 없거나 조회 실패 시 빈 목록)
+        """
+        if not self.client or not urls:
+            return []
+        links: List[Dict[str, Any]] = []
+        try:
+            for start in range(0, len(urls), chunk_size):
+                result = self.client.table(NEAR_DUP_CONFIG["table"]).select(
+                    'url, canonical_url, media_id'
+                ).in_(column, urls[start:start + chunk_size]).execute()
+                links.extend(result.data or [])
+        except Exception as e:
+            console.print(f"⚠️ 유사 중복 연결 조회 실패: {str(e)[:80]}")
+            return []
+        return links
+    
 
 
 # 전역 인스턴스 (지연 초기화) - 싱글톤 패턴
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+단계별 본문 수집 (httpx → 브라우저)
+- 모든 기사는 먼저 httpx로 받아 파싱하고 추출 결과(본문 길이, 필수 필드)를 검사
+- 검사를 통과하지 못한 기사만 공유 브라우저 풀로 다시 수집
+- 언론사별 브라우저 전환 비율을 기록해 파이프라인 종료 시 요약
+"""
+
+import sys
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.crawler_config import TIERED_FETCH_CONFIG
+from utils.parse_pool import ParseRunner
+
+console = Console()
+
+# 언론사별 전환 통계 (CrawlerManager 요약 출력용)
+ESCALATION_STATS: Dict[str, Dict[str, int]] = {}
+
+# fetch_detail 결과 구분
+_PARSED = "parsed"
+_BROWSER = "browser"
+
+
+class TieredFetcher:
+    """httpx로 먼저 추출해 보고 실패한 기사만 브라우저로 재수집하는 본문 수집기"""
+
+    def __init__(self, name: str,
+                 http_fetch: Callable[[Dict], Awaitable[Any]],
+                 http_parse: Callable[[Dict, Any], Optional[Dict]],
+                 browser_fetch: Callable[[Dict], Awaitable[Any]],
+                 browser_parse: Callable[[Dict, Any], Optional[Dict]],
+                 config: Optional[Dict] = None):
+        """
+        Args:
+            name: 로그/통계에 표시할 언론사 이름
+            http_fetch: 기사 상세 페이지 HTML을 httpx로 가져오는 함수
+            http_parse: HTML에서 본문/발행시간을 추출하는 함수 (프로세스 풀에서 실행)
+            browser_fetch: 브라우저로 렌더링한 추출 원문을 가져오는 함수
+            browser_parse: 브라우저 추출 원문을 기사로 변환하는 함수
+        """
+        self.name = name
+        self.http_fetch = http_fetch
+        self.http_parse = ParseRunner(http_parse, name)
+        self.browser_fetch = browser_fetch
+        self.browser_parse = browser_parse
+        self.config = {**TIERED_FETCH_CONFIG, **(config or {})}
+
+        self.stats = ESCALATION_STATS.setdefault(name, {"http": 0, "browser": 0})
+
+    def _is_complete(self, parsed: Optional[Dict]) -> bool:
+        """httpx 추출 결과가 충분한지 확인"""
+        if not parsed:
+            return False
+        if len((parsed.get("content") or "").strip()) < self.config["min_content_length"]:
+            return False
+        return all(parsed.get(field) for field in self.config["required_fields"])
+
+    async def fetch_detail(self, article: Dict) -> Optional[Tuple[str, Any]]:
+        """파이프라인 본문 요청 단계: httpx 추출 → 부족하면 브라우저 원문 수집"""
+        try:
+            html = await self.http_fetch(article)
+            parsed = await self.http_parse(dict(article), html) if html else None
+        except Exception as e:
+            console.print(f"⚠️ httpx 수집 실패: {article.get('title', '')[:30]}... - {str(e)[:50]}")
+            parsed = None
+
+        if self._is_complete(parsed):
+            self.stats["http"] += 1
+            return _PARSED, parsed
+
+        self.stats["browser"] += 1
+        console.print(f"🌐 브라우저로 재수집: {article.get('title', '')[:30]}...")
+        raw = await self.browser_fetch(article)
+        return (_BROWSER, raw) if raw is not None else None
+
+    def parse_detail(self, article: Dict, fetched: Tuple[str, Any]) -> Optional[Dict]:
+        """파이프라인 파싱 단계: httpx 결과는 그대로, 브라우저 원문만 변환"""
+        tier, payload = fetched
+        if tier == _PARSED:
+            return payload
+        return self.browser_parse(article, payload)
+
+    def print_summary(self):
+        total = self.stats["http"] + self.stats["browser"]
+        if total:
+            console.print(
+                f"🪜 {self.name} 본문 수집: httpx {self.stats['http']}건, 브라우저 {self.stats['browser']}건 "
+                f"(전환율 {self.stats['browser'] / total * 100:.1f}%)"
+            )
+
+
+def get_escalation_stats() -> Dict[str, Dict[str, int]]:
+    """언론사별 httpx/브라우저 수집 건수"""
+    return ESCALATION_STATS
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+기존 기사 URL 인덱스 (본문 요청 전 중복 제거)
+- 저장된 기사 URL을 로컬 SQLite에 보관하고 언론사별로 Supabase와 증분 동기화
+- 메모리의 블룸 필터로 대부분의 새 URL을 SQLite 조회 없이 바로 판별
+- 목록 파싱 직후 확인하므로 이미 저장된 기사는 본문을 다시 요청하지 않음
+"""
+
+import asyncio
+import hashlib
+import math
+import sqlite3
+import sys
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+from config.crawler_config import URL_INDEX_CONFIG
+
+console = Console()
+
+
+class BloomFilter:
+    """URL 존재 여부를 빠르게 걸러내는 블룸 필터 (없음 판정은 확정, 있음 판정은 추정)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class KnownUrlIndex:
+    """이미 저장된 기사 URL 인덱스 (SQLite + 블룸 필터)"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = {**URL_INDEX_CONFIG, **(config or {})}
+        self.db_path = os.path.join(PROJECT_ROOT, self.config["db_file"])
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS known_urls ("
+            "url TEXT PRIMARY KEY, media_id TEXT, added_at REAL) WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "media_id TEXT PRIMARY KEY, synced_until TEXT)"
+        )
+        self._conn.commit()
+
+        # 이번 프로세스에서 이미 동기화한 언론사 (실행당 한 번만 Supabase 조회)
+        self._synced: Set[str] = set()
+        self._load_bloom()
+
+    def _load_bloom(self):
+        """SQLite의 URL로 블룸 필터 구성 (용량 초과 시 두 배로 확장)"""
+        count = self._conn.execute("SELECT COUNT(*) FROM known_urls").fetchone()[0]
+        capacity = max(self.config["bloom_capacity"], count * 2)
+        self._bloom = BloomFilter(capacity, self.config["bloom_error_rate"])
+        self._capacity = capacity
+        self._count = 0
+        for (url,) in self._conn.execute("SELECT url FROM known_urls"):
+            self._bloom.add(url)
+            self._count += 1
+
+    def contains(self, url: str) -> bool:
+        """이미 저장된 URL인지 확인 (블룸 필터 통과 시에만 SQLite 조회)"""
+        if not url or url not in self._bloom:
+            return False
+        row = self._conn.execute("SELECT 1 FROM known_urls WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def add(self, entries: Iterable[Tuple[str, Optional[str]]]):
+        """
+        저장이 확인된 URL 추가
+
+        Args:
+            entries: (url, media_id) 목록
+        """
+        now = time.time()
+        rows = [(url, str(media_id) if media_id is not None else None, now) for url, media_id in entries if url]
+        if not rows:
+            return
+        before = self._conn.total_changes
+        self._conn.executemany("INSERT OR IGNORE INTO known_urls VALUES (?, ?, ?)", rows)
+        self._conn.commit()
+        self._count += self._conn.total_changes - before
+
+        if self._count > self._capacity:
+            self._load_bloom()
+        else:
+            for url, _, _ in rows:
+                self._bloom.add(url)
+
+    async def sync_outlet(self, supabase_manager, media_name: str, media_id: Optional[str] = None):
+        """
+        언론사의 저장된 기사 URL을 마지막 동기화 이후분만 가져와 인덱스에 반영
+
+        Supabase 조회(동기 클라이언트)는 별도 스레드에서 실행해 다른 언론사 작업이 멈추지 않도록 하고,
+        SQLite 인덱스 반영은 이벤트 루프 스레드에서 처리합니다.
+
+        Args:
+            supabase_manager: SupabaseManager 인스턴스
+            media_name: 언론사 이름 (media_id가 없을 때 조회에 사용)
+            media_id: 언론사 ID (알고 있으면 이름 조회 생략)
+        """
+        if not supabase_manager or not supabase_manager.client:
+            return
+        if media_id is None:
+            media = await asyncio.to_thread(supabase_manager.get_media_outlet, media_name)
+            if not media:
+                return
+            media_id = media["id"]
+        key = str(media_id)
+        if key in self._synced:
+            return
+
+        row = self._conn.execute("SELECT synced_until FROM sync_state WHERE media_id = ?", (key,)).fetchone()
+        synced_until = row[0] if row else None
+
+        try:
+            urls, latest = await asyncio.to_thread(self._fetch_since, supabase_manager, media_id, synced_until)
+        except Exception as e:
+            console.print(f"⚠️ URL 인덱스 동기화 실패 ({media_name}): {str(e)[:80]}")
+            return
+
+        self.add((url, media_id) for url in urls)
+        if latest != synced_until:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (key, latest)
+            )
+            self._conn.commit()
+        self._synced.add(key)
+        console.print(f"🗂️ {media_name}: URL 인덱스 동기화 (새 URL {len(urls)}개, 전체 {self._count}개)")
+
+    def _fetch_since(self, supabase_manager, media_id: str, synced_until: Optional[str]) -> Tuple[List[str], Optional[str]]:
+        """
+        마지막 동기화 이후 저장된 URL 조회 (작업 스레드에서 실행, SQLite 연결은 사용하지 않음)
+
+        Returns:
+            Tuple[List[str], Optional[str]]: (URL 목록, 가장 최근 created_at)
+        """
+        page_size = self.config["sync_page_size"]
+        urls: List[str] = []
+        latest = synced_until
+
+        # 기본 행 제한에 걸리지 않도록 created_at 순으로 페이지 단위 조회
+        offset = 0
+        while True:
+            query = supabase_manager.client.table("articles").select("url, created_at").eq("media_id", media_id)
+            if synced_until:
+                query = query.gt("created_at", synced_until)
+            result = query.order("created_at").range(offset, offset + page_size - 1).execute()
+            rows = result.data or []
+            urls.extend(r["url"] for r in rows)
+            if rows and rows[-1].get("created_at"):
+                latest = rows[-1]["created_at"]
+            if len(rows) < page_size:
+                break
+            offset += page_size
+        return urls, latest
+
+    def close(self):
+        self._conn.close()
+
+
+# 전역 인스턴스 (지연 초기화) - 싱글톤 패턴
+_url_index = None
+
+
+def get_url_index() -> Optional[KnownUrlIndex]:
+    """URL 인덱스 인스턴스를 반환 (비활성화 시 None)"""
+    global _url_index
+    if not URL_INDEX_CONFIG["enabled"]:
+        return None
+    if _url_index is None:
+        _url_index = KnownUrlIndex()
+    return _url_index
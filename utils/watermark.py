@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+언론사별 증분 크롤링 워터마크
+- 지난 실행에서 처리한 최신 기사(URL / 발행시간)를 언론사별로 저장
+- 처리 여부는 URL 목록으로만 판단 (발행시간은 페이지 순회 중단 기준으로만 사용)
+- 목록 페이지의 모든 기사가 처리했거나 워터마크보다 오래되었으면 페이지 순회 중단
+- 실패한 기사보다 워터마크를 앞당기지 않음 → 다음 실행에서 그 페이지까지 다시 확인
+- 저장에서 제외된 기사(본문이 너무 짧은 등)는 다시 시도해도 같으므로 처리한 기사로 기록
+- 실행 시작 이후의 발행시간(파싱 실패 시 현재 시각으로 채운 값)은 워터마크에 반영하지 않음
+- 첫 실행(워터마크 없음)에는 설정된 페이지 수(CRAWLER_PARAMS)만큼 수집
+"""
+
+import asyncio
+import json
+import sys
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+from config.crawler_config import WATERMARK_CONFIG
+
+console = Console()
+
+# 시간대 정보가 없는 발행시간은 한국 시간으로 간주
+KST = timezone(timedelta(hours=9))
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """발행시간 문자열/datetime을 시간대가 있는 datetime으로 변환 (실패 시 None)"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=KST)
+
+
+class CrawlWatermark:
+    """단일 언론사의 워터마크 (최근 처리한 URL 목록 + 최신 발행시간)"""
+
+    def __init__(self, outlet: str, config: Optional[Dict] = None):
+        self.outlet = outlet
+        self.config = {**WATERMARK_CONFIG, **(config or {})}
+        self.state_file = os.path.join(PROJECT_ROOT, self.config["state_file"])
+
+        state = self._load_all().get(outlet, {}) if self.config["enabled"] else {}
+        self.recent_urls: List[str] = state.get("recent_urls", [])
+        self.latest_published_at: Optional[str] = state.get("latest_published_at")
+        self._url_set = set(self.recent_urls)
+        self._latest = _parse_timestamp(self.latest_published_at)
+        # 발행시간을 못 찾은 기사는 수집 중 현재 시각으로 채워지므로 이 시각 이후 값은 신뢰하지 않음
+        self._run_started = datetime.now(KST)
+
+    def _load_all(self) -> Dict:
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @property
+    def is_first_run(self) -> bool:
+        """저장된 워터마크가 없으면 True (설정된 깊이 전체 수집)"""
+        return not self._url_set and self._latest is None
+
+    def is_seen(self, article: Dict) -> bool:
+        """이미 처리한 기사인지 확인 (URL 기준)"""
+        return article.get("url") in self._url_set
+
+    def _is_older(self, article: Dict) -> bool:
+        """워터마크 발행시간보다 오래된 기사인지 확인 (페이지 순회 중단 판단용)"""
+        published_at = _parse_timestamp(article.get("published_at"))
+        return bool(published_at and self._latest and published_at < self._latest)
+
+    def is_page_stale(self, page_articles: List[Dict]) -> bool:
+        """목록 페이지의 모든 기사가 처리했거나 워터마크 이전이면 True (이후 페이지는 확인하지 않음)"""
+        return bool(page_articles) and all(
+            self.is_seen(article) or self._is_older(article) for article in page_articles
+        )
+
+    def advance(self, articles: List[Dict], failed: Optional[List[Dict]] = None,
+                skipped: Optional[List[Dict]] = None):
+        """
+        처리 완료된 기사로 워터마크 갱신 후 저장
+
+        Args:
+            articles: 이번 실행에서 저장까지 완료된 기사 목록
+            failed: 본문 요청/파싱/저장에 실패해 다시 시도할 기사 (워터마크가 이 기사들보다 앞서지 않도록 제한)
+            skipped: 저장에서 제외된 기사 (다시 시도하지 않도록 처리한 기사와 같이 기록)
+        """
+        if not self.config["enabled"]:
+            return
+
+        processed = [a for a in [*articles, *(skipped or [])] if a.get("url")]
+        if not processed and not failed:
+            return
+
+        # 새로 처리한 URL을 앞에 두고 최대 개수만 유지
+        new_urls = [a["url"] for a in processed if a["url"] not in self._url_set]
+        self.recent_urls = (new_urls + self.recent_urls)[:self.config["max_urls"]]
+        self._url_set = set(self.recent_urls)
+
+        for article in processed:
+            published_at = _parse_timestamp(article.get("published_at"))
+            if published_at and published_at < self._run_started and (self._latest is None or published_at > self._latest):
+                self._latest = published_at
+
+        # 실패한 기사의 페이지에서 순회가 멈추지 않도록 가장 오래된 실패 기사 시각까지만 인정
+        failed_times = [
+            published_at for published_at in (_parse_timestamp(a.get("published_at")) for a in failed or [])
+            if published_at and published_at < self._run_started
+        ]
+        if failed_times and self._latest and min(failed_times) <= self._latest:
+            self._latest = min(failed_times)
+        if self._latest:
+            self.latest_published_at = self._latest.isoformat()
+
+        self._save()
+
+    def _save(self):
+        """전체 워터마크 파일을 다시 읽어 이 언론사 항목만 교체 (임시 파일로 원자적 저장)"""
+        all_states = self._load_all()
+        all_states[self.outlet] = {
+            "recent_urls": self.recent_urls,
+            "latest_published_at": self.latest_published_at,
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            tmp_path = self.state_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(all_states, f, ensure_ascii=False)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            console.print(f"⚠️ 워터마크 저장 실패 ({self.outlet}): {str(e)[:50]}")
+
+
+async def iter_new_articles(fetch_page: Callable[[int], Awaitable[List[Dict]]],
+                            num_pages: int, watermark: CrawlWatermark) -> AsyncIterator[Dict]:
+    """
+    워터마크 기준으로 목록 페이지를 순회하며 새 기사를 하나씩 반환
+
+    첫 실행에는 num_pages 전체를 동시에 요청하고 끝나는 순서대로 내보내며,
+    이후에는 앞 페이지부터 순서대로 가져오다가 모든 기사가 워터마크 이전인
+    페이지를 만나면 중단합니다.
+
+    Args:
+        fetch_page: 페이지 인덱스(0부터)를 받아 해당 페이지의 기사 목록을 반환하는 함수
+        num_pages: 최대 페이지 수 (첫 실행 시 수집 깊이)
+        watermark: 언론사 워터마크
+
+    Yields:
+        Dict: 아직 처리하지 않은 새 기사
+    """
+    if watermark.is_first_run:
+        console.print(f"🆕 {watermark.outlet}: 워터마크 없음 - {num_pages}개 페이지 전체 수집")
+        for next_page in asyncio.as_completed([fetch_page(i) for i in range(num_pages)]):
+            try:
+                page_articles = await next_page
+            except Exception as e:
+                console.print(f"❌ 목록 페이지 처리 중 오류: {str(e)}")
+                continue
+            for article in page_articles:
+                yield article
+        return
+
+    pages_fetched = 0
+    new_count = 0
+    for i in range(num_pages):
+        try:
+            page_articles = await fetch_page(i)
+        except Exception as e:
+            console.print(f"❌ 페이지 {i + 1} 처리 중 오류: {str(e)}")
+            continue
+        pages_fetched += 1
+
+        for article in page_articles:
+            if not watermark.is_seen(article):
+                new_count += 1
+                yield article
+        if watermark.is_page_stale(page_articles):
+            break
+
+    console.print(f"🔖 {watermark.outlet}: 목록 {pages_fetched}개 페이지 확인, 새 기사 {new_count}개")